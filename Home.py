@@ -2,9 +2,11 @@ import streamlit as st
 from utils.theme import apply_theme, render_logo
 from utils.state import ensure_state
 from components.nav import render_cta_row
+from utils.profiling import finish_run, start_run
 
 st.set_page_config(page_title="EBOSS® Tool", layout="wide", initial_sidebar_state="collapsed")
 
+start_run("Home")
 apply_theme()
 ensure_state()
 render_logo()
@@ -29,3 +31,5 @@ render_cta_row(
     col3=(" ", None),  # placeholder
     col4=(" ", None),  # placeholder
 )
+
+finish_run()
@@ -1,10 +1,24 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 from utils.theme import apply_theme, render_logo
 from utils.state import ensure_state
+from utils.style import global_css
 from components.nav import render_cta_row
+from calculations import (
+    interpolate_gph, calculate_charge_rate, get_max_charge_rate,
+    calculate_load_specs,
+)
+from utils.data import (
+    EBOSS_LOAD_REFERENCE, STANDARD_GENERATOR_DATA, EBOSS_STANDARD_PAIRING,
+)
+from utils.profiling import finish_run, fragment_run, section, start_run
+from utils.spec_table import spec_table
+from utils.compare import compare, spec_differences
+
+# Display text rendered from the compiled spec table (parsed once per process)
+EBOSS_SPECS = spec_table("EBOSS_SPEC_SHEET").sheets()
 
+start_run("app")
+section("theme")
 apply_theme()
 render_logo()
 global_css()
@@ -48,520 +62,6 @@ st.set_page_config(
 )
 
 
-# EBOSS® Load Calculation Reference Data
-EBOSS_LOAD_REFERENCE = {
-    "battery_capacities": {
-        "EB25 kVA": 15,
-        "EB70 kVA": 25,
-        "EB125 kVA": 50,
-        "EB220 kVA": 75,
-        "EB400 kVA": 125
-    },
-    "generator_kva_hybrid": {
-        "EB25 kVA": 25,
-        "EB70 kVA": 45,
-        "EB125 kVA": 65,
-        "EB220 kVA": 125,
-        "EB400 kVA": 220
-    },
-    "generator_sizes": {
-        25: {"eboss_model": "EB25 kVA", "pm_charge_rate": 18.5, "fh_charge_rate": 19.5, "max_charge_rate": 20, "kwh": 15, "gen_kw": 20},
-        45: {"eboss_model": "EB70 kVA", "pm_charge_rate": 33, "fh_charge_rate": 36, "max_charge_rate": 45, "kwh": 25, "gen_kw": 36},
-        65: {"eboss_model": "EB125 kVA", "pm_charge_rate": 48, "fh_charge_rate": 52, "max_charge_rate": 65, "kwh": 50, "gen_kw": 52},
-        125: {"eboss_model": "EB220 kVA", "pm_charge_rate": 96, "fh_charge_rate": 100, "max_charge_rate": 125, "kwh": 75, "gen_kw": 100},
-        220: {"eboss_model": "EB400 kVA", "pm_charge_rate": 166, "fh_charge_rate": 176, "max_charge_rate": 220, "kwh": 125, "gen_kw": 176}
-    },
-    "gph_interpolation": {
-        25: {"25%": 0.67, "50%": 0.94, "75%": 1.26, "100%": 1.62},
-        45: {"25%": 1.04, "50%": 1.60, "75%": 2.20, "100%": 2.03},
-        70: {"25%": 1.70, "50%": 2.60, "75%": 3.50, "100%": 4.40},
-        125: {"25%": 2.60, "50%": 4.10, "75%": 5.60, "100%": 7.10},
-        220: {"25%": 4.60, "50%": 6.90, "75%": 9.40, "100%": 12.00},
-        400: {"25%": 7.70, "50%": 12.20, "75%": 17.30, "100%": 22.50}
-    }
-}
-
-# Standard Diesel Generator Reference Data (based on authentic industry specifications)
-STANDARD_GENERATOR_DATA = {
-    "25 kVA / 20 kW": {
-        "kva": 25, "kw": 20,
-        "fuel_consumption_gph": {"50%": 0.90, "75%": 1.30, "100%": 1.60},
-        "noise_level_db": 68, "dimensions": "L:48\" W:24\" H:30\"", "weight_lbs": 650,
-        "fuel_tank_gal": 12, "runtime_at_50_load": 13.3, "co2_per_gal": 22.4
-    },
-    "45 kVA / 36 kW": {
-        "kva": 45, "kw": 36,
-        "fuel_consumption_gph": {"50%": 2.30, "75%": 3.20, "100%": 4.00},
-        "noise_level_db": 72, "dimensions": "L:60\" W:28\" H:36\"", "weight_lbs": 1200,
-        "fuel_tank_gal": 25, "runtime_at_50_load": 10.9, "co2_per_gal": 22.4
-    },
-    "65 kVA / 52 kW": {
-        "kva": 65, "kw": 52,
-        "fuel_consumption_gph": {"50%": 2.90, "75%": 3.80, "100%": 4.80},
-        "noise_level_db": 75, "dimensions": "L:72\" W:32\" H:42\"", "weight_lbs": 1800,
-        "fuel_tank_gal": 40, "runtime_at_50_load": 13.8, "co2_per_gal": 22.4
-    },
-    "125 kVA / 100 kW": {
-        "kva": 125, "kw": 100,
-        "fuel_consumption_gph": {"50%": 5.00, "75%": 7.10, "100%": 9.10},
-        "noise_level_db": 78, "dimensions": "L:96\" W:36\" H:48\"", "weight_lbs": 3200,
-        "fuel_tank_gal": 75, "runtime_at_50_load": 15.0, "co2_per_gal": 22.4
-    },
-    "220 kVA / 176 kW": {
-        "kva": 220, "kw": 176,
-        "fuel_consumption_gph": {"50%": 8.80, "75%": 12.50, "100%": 16.60},
-        "noise_level_db": 82, "dimensions": "L:120\" W:48\" H:60\"", "weight_lbs": 5500,
-        "fuel_tank_gal": 125, "runtime_at_50_load": 14.2, "co2_per_gal": 22.4
-    },
-    "400 kVA / 320 kW": {
-        "kva": 400, "kw": 320,
-        "fuel_consumption_gph": {"50%": 14.90, "75%": 21.30, "100%": 28.60},
-        "noise_level_db": 85, "dimensions": "L:144\" W:60\" H:72\"", "weight_lbs": 8800,
-        "fuel_tank_gal": 200, "runtime_at_50_load": 13.4, "co2_per_gal": 22.4
-    }
-}
-
-# Standard Generator Data for Comparison
-STANDARD_GENERATOR_DATA = {
-    "25 kVA / 20 kW": {
-        "kw": 20,
-        "fuel_consumption_gph": {"50%": 1.2, "75%": 1.7, "100%": 2.3},
-        "fuel_tank_gal": 38,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 75,
-        "dimensions": "60\" x 24\" x 36\"",
-        "weight_lbs": 1850
-    },
-    "45 kVA / 36 kW": {
-        "kw": 36,
-        "fuel_consumption_gph": {"50%": 2.1, "75%": 3.0, "100%": 4.1},
-        "fuel_tank_gal": 60,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 78,
-        "dimensions": "72\" x 30\" x 42\"",
-        "weight_lbs": 2850
-    },
-    "65 kVA / 52 kW": {
-        "kw": 52,
-        "fuel_consumption_gph": {"50%": 2.8, "75%": 4.2, "100%": 5.8},
-        "fuel_tank_gal": 80,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 80,
-        "dimensions": "84\" x 36\" x 48\"",
-        "weight_lbs": 4200
-    },
-    "125 kVA / 100 kW": {
-        "kw": 100,
-        "fuel_consumption_gph": {"50%": 5.2, "75%": 7.8, "100%": 10.5},
-        "fuel_tank_gal": 120,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 82,
-        "dimensions": "120\" x 48\" x 60\"",
-        "weight_lbs": 8500
-    },
-    "220 kVA / 176 kW": {
-        "kw": 176,
-        "fuel_consumption_gph": {"50%": 9.1, "75%": 13.7, "100%": 18.2},
-        "fuel_tank_gal": 200,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 85,
-        "dimensions": "144\" x 60\" x 72\"",
-        "weight_lbs": 15000
-    },
-    "400 kVA / 320 kW": {
-        "kw": 320,
-        "fuel_consumption_gph": {"50%": 16.8, "75%": 25.2, "100%": 33.6},
-        "fuel_tank_gal": 350,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 88,
-        "dimensions": "180\" x 72\" x 84\"",
-        "weight_lbs": 28000
-    }
-}
-
-def interpolate_gph (generator_kva, load_percent):
-   # Interpolate GPH fuel consumption based on generator kVA and load percentage
-   # Uses authentic EBOSS® GPH interpolation data from working_Accurate_Fuel_Calc_1752711064907.xlsx
-    # Convert load percent to decimal if needed
-    if load_percent > 1:
-        load_percent = load_percent / 100
-    
-    # Get GPH interpolation data
-    gph_data_map = EBOSS_LOAD_REFERENCE["gph_interpolation"]
-    
-    # Find the correct generator size data or closest match
-    if generator_kva not in gph_data_map:
-        # Find closest generator size
-        available_sizes = list(gph_data_map.keys())
-        closest_size = min(available_sizes, key=lambda x: abs(x - generator_kva))
-        gph_data = gph_data_map[closest_size]
-    else:
-        gph_data = gph_data_map[generator_kva]
-    
-    # Define load percentage breakpoints and corresponding GPH values
-    load_points = [0.25, 0.50, 0.75, 1.00]
-    gph_values = [gph_data["25%"], gph_data["50%"], gph_data["75%"], gph_data["100%"]]
-    
-    # Clamp load_percent to valid range
-    load_percent = max(0.25, min(1.00, load_percent))
-    
-    # Handle edge cases
-    if load_percent <= 0.25:
-        return gph_values[0]
-    elif load_percent >= 1.00:
-        return gph_values[3]
-    
-    # Find the two points to interpolate between
-    for i in range(len(load_points) - 1):
-        if load_points[i] <= load_percent <= load_points[i + 1]:
-            # Linear interpolation formula: y = y1 + (x - x1) * (y2 - y1) / (x2 - x1)
-            x1, x2 = load_points[i], load_points[i + 1]
-            y1, y2 = gph_values[i], gph_values[i + 1]
-            
-            interpolated_gph = y1 + (load_percent - x1) * (y2 - y1) / (x2 - x1)
-            return round(interpolated_gph, 4)
-    
-    return 0
-
-def calculate_charge_rate(eboss_model, eboss_type, generator_kva=None, custom_rate=None):
-    """Calculate charge rate using authentic formulas"""
-    if custom_rate:
-        return custom_rate
-        
-    # Get generator kW capacity
-    generator_kw = 0
-    if eboss_type == "Full Hybrid":
-        # Use paired generator for hybrid
-        hybrid_kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(eboss_model, 0)
-        generator_kw = hybrid_kva * 0.8  # kW = kVA * 0.8
-    elif eboss_type == "Power Module" and generator_kva:
-        # Use selected generator for power module
-        gen_kva = float(generator_kva.replace("kVA", ""))
-        generator_kw = gen_kva * 0.8  # kW = kVA * 0.8
-    
-    # Calculate charge rate based on formulas
-    if eboss_type == "Full Hybrid":
-        # Full Hybrid: 98% of generator kW
-        charge_rate = generator_kw * 0.98
-    elif eboss_type == "Power Module":
-        # Power Module: 98% of (90% of generator kW)
-        charge_rate = generator_kw * 0.90 * 0.98
-    else:
-        charge_rate = 0
-        
-    return round(charge_rate, 1)
-
-def get_max_charge_rate(eboss_model, eboss_type, generator_kva=None):
-    """Get maximum allowed charge rate using model-specific limits, with 98% generator kW as fallback"""
-    
-    # EBOSS® model specific maximum charge rates from the table
-    model_max_charge_rates = {
-        "EB25 kVA": 20,
-        "EB70 kVA": 45,
-        "EB125 kVA": 65,
-        "EB220 kVA": 125,
-        "EB400 kVA": 220
-    }
-    
-    # Get model-specific max charge rate
-    model_max = model_max_charge_rates.get(eboss_model, 0)
-    
-    # Calculate 98% of generator kW as secondary limit
-    generator_kw = 0
-    if eboss_type == "Full Hybrid":
-        hybrid_kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(eboss_model, 0)
-        generator_kw = hybrid_kva * 0.8
-    elif eboss_type == "Power Module" and generator_kva:
-        gen_kva = float(generator_kva.replace("kVA", ""))
-        generator_kw = gen_kva * 0.8
-    
-    generator_98_percent = generator_kw * 0.98
-    
-    # Use the lower of the two limits (model max or 98% generator kW)
-    if model_max > 0 and generator_98_percent > 0:
-        max_charge_rate = min(model_max, generator_98_percent)
-    elif model_max > 0:
-        max_charge_rate = model_max
-    elif generator_98_percent > 0:
-        max_charge_rate = generator_98_percent
-    else:
-        max_charge_rate = 0
-    
-    return round(max_charge_rate, 1)
-
-def calculate_standard_generator_specs(standard_generator_size, continuous_load, max_peak_load):
-    """Calculate specifications for standard diesel generator comparison using authentic interpolation"""
-    if not standard_generator_size or standard_generator_size not in STANDARD_GENERATOR_DATA:
-        return {}
-    
-    gen_data = STANDARD_GENERATOR_DATA[standard_generator_size]
-    gen_kw = gen_data["kw"]
-    
-    # Calculate engine load percentage based on continuous load (since it runs 24/7)
-    engine_load_percent = (continuous_load / gen_kw * 100) if gen_kw > 0 else 0
-    load_percentage = continuous_load / gen_kw if gen_kw > 0 else 0
-    
-    # Use same interpolation method as EBOSS® for consistency
-    fuel_gph_data = gen_data["fuel_consumption_gph"]
-    if load_percentage <= 0.5:
-        fuel_per_hour = fuel_gph_data["50%"]
-    elif load_percentage <= 0.75:
-        fuel_per_hour = fuel_gph_data["75%"]
-    else:
-        fuel_per_hour = fuel_gph_data["100%"]
-    
-    # Calculate daily, weekly, monthly consumption (runs 24/7)
-    fuel_per_day = fuel_per_hour * 24
-    fuel_per_week = fuel_per_day * 7
-    fuel_per_month = fuel_per_day * 30
-    
-    # Calculate CO2 emissions (22.4 lbs CO2 per gallon of diesel)
-    co2_per_day = fuel_per_day * gen_data["co2_per_gal"]
-    
-    # Runtime is continuous (24 hours) since no battery backup
-    runtime_per_day = 24.0
-    
-    # Tank runtime calculation
-    tank_runtime = gen_data["fuel_tank_gal"] / fuel_per_hour if fuel_per_hour > 0 else 0
-    
-    return {
-        "generator_type": "Standard Diesel Generator",
-        "generator_size": standard_generator_size,
-        "engine_load_percent": engine_load_percent,
-        "continuous_load_percent": load_percentage * 100,
-        "fuel_consumption_gph": fuel_per_hour,
-        "fuel_per_hour": fuel_per_hour,
-        "fuel_per_day": fuel_per_day,
-        "fuel_per_week": fuel_per_week,
-        "fuel_per_month": fuel_per_month,
-        "co2_per_day": co2_per_day,
-        "runtime_per_day": runtime_per_day,
-        "tank_runtime_hours": tank_runtime,
-        "noise_level": gen_data["noise_level_db"],
-        "dimensions": gen_data["dimensions"],
-        "weight_lbs": gen_data["weight_lbs"],
-        "fuel_tank_capacity": gen_data["fuel_tank_gal"]
-    }
-
-def calculate_load_specs(eboss_model, eboss_type, continuous_load, max_peak_load, generator_kva=None, custom_charge_rate=None):
-
-    #Calculate load-based specifications using authentic EBOSS® reference data
-    # Get EBOSS® model capacity based on generator size and max continuous load
-    generator_kw_mapping = {
-        "EB25 kVA": 14.5,   # Gen Size 25 kVA
-        "EB70 kVA": 24.5,   # Gen Size 45 kVA  
-        "EB125 kVA": 49,    # Gen Size 65 kVA
-        "EB220 kVA": 74,    # Gen Size 125 kVA
-        "EB400 kVA": 125    # Gen Size 220 kVA
-    }
-    model_capacity = generator_kw_mapping.get(eboss_model, 0)
-    
-    # Find matching generator data
-    generator_data = None
-    if generator_kva:
-        gen_size = int(generator_kva.replace("kVA", ""))
-        generator_data = EBOSS_LOAD_REFERENCE["generator_sizes"].get(gen_size)
-    
-    # Calculate utilization
-    peak_utilization = (max_peak_load / model_capacity * 100) if model_capacity > 0 else 0
-    continuous_utilization = (continuous_load / model_capacity * 100) if model_capacity > 0 else 0
-    
-    # Calculate charge rate using new formula
-    charge_rate = calculate_charge_rate(eboss_model, eboss_type, generator_kva, custom_charge_rate)
-    
-    # Calculate fuel consumption and engine load based on EBOSS® model's paired generator
-    fuel_consumption = None
-    engine_load_percent = 0
-    
-    # Get the appropriate generator size for this EBOSS® model
-    paired_generator_kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(eboss_model, 0)
-    if paired_generator_kva > 0:
-        # Get paired generator data
-        paired_gen_data = EBOSS_LOAD_REFERENCE["generator_sizes"].get(paired_generator_kva)
-        if paired_gen_data:
-            gen_kw = paired_gen_data["gen_kw"]
-            charge_rate_kw = charge_rate  # charge rate is already in kW
-            engine_load_percent = (charge_rate_kw / gen_kw * 100) if gen_kw > 0 else 0
-            
-            # Use charge rate for GPH interpolation
-            load_percentage = charge_rate_kw / gen_kw if gen_kw > 0 else 0
-            
-            # Interpolate GPH based on paired generator size and load percentage
-            gph_data = EBOSS_LOAD_REFERENCE["gph_interpolation"].get(paired_generator_kva, {})
-            
-            if load_percentage <= 0.25:
-                fuel_consumption = gph_data.get("25%", 0)
-            elif load_percentage <= 0.5:
-                fuel_consumption = gph_data.get("50%", 0)
-            elif load_percentage <= 0.75:
-                fuel_consumption = gph_data.get("75%", 0)
-            else:
-                fuel_consumption = gph_data.get("100%", 0)
-    
-    # Calculate battery specs - always use model-specific capacity
-    battery_capacity = EBOSS_LOAD_REFERENCE["battery_capacities"].get(eboss_model, 0)
-    charge_time = (battery_capacity / charge_rate) if charge_rate > 0 else 0
-    
-    # Calculate environmental impact
-    co2_per_day = fuel_consumption * 24 * 19.6 if fuel_consumption else 0  # 19.6 lbs CO2 per gallon
-    
-    return {
-        "model_capacity": model_capacity,
-        "peak_utilization": peak_utilization,
-        "continuous_utilization": continuous_utilization,
-        "charge_rate": charge_rate,
-        "battery_capacity": battery_capacity,
-        "charge_time": charge_time,
-        "fuel_consumption_gph": fuel_consumption,
-        "fuel_per_day": fuel_consumption * 24 if fuel_consumption else 0,
-        "co2_per_day": co2_per_day,
-        "engine_load_percent": engine_load_percent,
-        "generator_data": generator_data
-    }
-
-# EBOSS® Specifications Data
-EBOSS_SPECS = {
-    "EB25 kVA": {
-        "Hybrid Energy System": "ANA EBOSS",
-        "Three-phase Max Power": "30 kVA / 24 kW",
-        "Single-phase Max Power": "20 kVA / 16 kW",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120/240 (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Max Intermittent amp-load 208V": "70 A / 13.5 kW",
-        "Max Continuous amp-load 208V": "55 A / 10.5 kW",
-        "Max Intermittent amp-load 240V": "61 A / 13.5 kW",
-        "Max Continuous amp-load 240V": "48 A / 10.5 kW",
-        "Max Intermittent amp-load 480V": "35 A / 28 kW",
-        "Max Continuous amp-load 480V": "28 A / 22 kW",
-        "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
-        "Battery Capacity": "15 kWh",
-        "Generator kVA": "25 kVA (Hybrid units only)",
-        "Battery Voltage": "440 VDC",
-        "Inverter Type": "Pure Sine Wave",
-        "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
-        "Dimensions (L x W x H)": "108\" x 45\" x 62\"",
-        "Weight": "8,200 lbs",
-        "Warranty - EBOSS® only": "2 Years",
-        "Warranty - With trailer & generator": "2 Years, 2000 Hours",
-        "Battery warranty": "7 Years",
-        "Service & Support": "24/7, 365 Days",
-        "Training": "Henderson, NV or On Location"
-    },
-    
-    "EB70 kVA": {
-        "Hybrid Energy System": "ANA EBOSS",
-        "Three-phase Max Power": "70 kVA / 56 kW",
-        "Single-phase Max Power": "47 kVA / 37 kW",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120/240 (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Max Intermittent amp-load 208V": "194 A / 37.2 kW",
-        "Max Continuous amp-load 208V": "155 A / 29.8 kW",
-        "Max Intermittent amp-load 240V": "169 A / 37.2 kW",
-        "Max Continuous amp-load 240V": "135 A / 29.8 kW",
-        "Max Intermittent amp-load 480V": "84 A / 70 kW",
-        "Max Continuous amp-load 480V": "67 A / 56 kW",
-        "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
-        "Battery Capacity": "25 kWh",
-        "Generator kVA": "45 kVA (Hybrid units only)",
-        "Battery Voltage": "440 VDC",
-        "Inverter Type": "Pure Sine Wave",
-        "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
-        "Dimensions (L x W x H)": "108\" x 60\" x 62\"",
-        "Weight": "13,200 lbs",
-        "Warranty - EBOSS® only": "2 Years",
-        "Warranty - With trailer & generator": "2 Years, 2000 Hours",
-        "Battery warranty": "7 Years",
-        "Service & Support": "24/7, 365 Days",
-        "Training": "Henderson, NV or On Location"
-    },
-    "EB125 kVA": {
-        "Hybrid Energy System": "ANA EBOSS",
-        "Three-phase Max Power": "125 kVA / 100 kW",
-        "Single-phase Max Power": "N/A / N/A",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120V (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Max Intermittent amp-load 208V": "345 A / 66.2 kW",
-        "Max Continuous amp-load 208V": "276 A / 53 kW",
-        "Max Intermittent amp-load 240V": "301 A / 66.2 kW",
-        "Max Continuous amp-load 240V": "241 A / 53 kW",
-        "Max Intermittent amp-load 480V": "150 A / 125 kW",
-        "Max Continuous amp-load 480V": "120 A / 100 kW",
-        "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
-        "Battery Capacity": "50 kWh",
-        "Generator kVA": "65 kVA (Hybrid units only)",
-        "Battery Voltage": "440 VDC",
-        "Inverter Type": "Pure Sine Wave",
-        "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
-        "Dimensions (L x W x H)": "144\" x 60\" x 62\"",
-        "Weight": "18,200 lbs",
-        "Warranty - EBOSS® only": "2 Years",
-        "Warranty - With trailer & generator": "2 Years, 2000 Hours",
-        "Battery warranty": "7 Years",
-        "Service & Support": "24/7, 365 Days",
-        "Training": "Henderson, NV or On Location"
-    },
-    "EB220 kVA": {
-        "Hybrid Energy System": "ANA EBOSS",
-        "Three-phase Max Power": "220 kVA / 176 kW",
-        "Single-phase Max Power": "N/A / N/A",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120V (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Max Intermittent amp-load 208V": "700 A / 134 kW",
-        "Max Continuous amp-load 208V": "560 A / 108 kW",
-        "Max Intermittent amp-load 240V": "611 A / 134 kW",
-        "Max Continuous amp-load 240V": "489 A / 108 kW",
-        "Max Intermittent amp-load 480V": "264 A / 220 kW",
-        "Max Continuous amp-load 480V": "211 A / 176 kW",
-        "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
-        "Battery Capacity": "75 kWh",
-        "Generator kVA": "125 kVA (Hybrid units only)",
-        "Battery Voltage": "440 VDC",
-        "Inverter Type": "Pure Sine Wave",
-        "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
-        "Dimensions (L x W x H)": "192\" x 60\" x 62\"",
-        "Weight": "29,200 lbs",
-        "Warranty - EBOSS® only": "2 Years",
-        "Warranty - With trailer & generator": "2 Years, 2000 Hours",
-        "Battery warranty": "7 Years",
-        "Service & Support": "24/7, 365 Days",
-        "Training": "Henderson, NV or On Location"
-    },
-    "EB400 kVA": {
-        "Hybrid Energy System": "ANA EBOSS™",
-        "Three-phase Max Power": "400 kVA / 320 kW",
-        "Single-phase Max Power": "N/A",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120V (Courtesy Outlets) • 480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Max Intermittent amp-load 208V": "481 A / 92.5 kW",
-        "Max Continuous amp-load 208V": "385 A / 74 kW",
-        "Max Intermittent amp-load 240V": "419 A / 92.5 kW",
-        "Max Continuous amp-load 240V": "335 A / 74 kW",
-        "Max Intermittent amp-load 480V": "481 A / 400 kW",
-        "Max Continuous amp-load 480V": "385 A / 320 kW",
-        "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
-        "Battery Capacity": "125 kWh",
-        "Generator kVA": "220 kVA (Hybrid units only)",
-        "Battery Voltage": "440 VDC",
-        "Inverter Type": "Pure Sine Wave",
-        "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
-        "Dimensions (L x W x H)": "240\" x 60\" x 62\"",
-        "Weight": "38,200 lbs",
-        "Warranty": "2 Years",
-        "Warranty - With generator": "2 Years, 2000 Hours",
-        "Battery warranty": "7 Years",
-        "Service & Support": "24/7, 365 Days",
-        "Training": "Henderson, NV or On Location"
-    }
-}
-
-
-
-
 # Initialize session state
 if 'eboss_model' not in st.session_state:
     st.session_state.eboss_model = None
@@ -590,14 +90,6 @@ if 'show_generator_dialog' not in st.session_state:
 if 'paired_generator' not in st.session_state:
     st.session_state.paired_generator = None
 
-# EBOSS® to Standard Generator Pairing (ascending order: 25, 65, 125, 220, 400 kVA)
-EBOSS_STANDARD_PAIRING = {
-    "EB25 kVA": "25 kVA / 20 kW",
-    "EB70 kVA": "65 kVA / 52 kW", 
-    "EB125 kVA": "125 kVA / 100 kW",
-    "EB220 kVA": "220 kVA / 176 kW",
-    "EB400 kVA": "400 kVA / 320 kW"
-}
 
 def generator_selection_dialog():
     """Dialog to confirm or change paired generator selection"""
@@ -635,44 +127,12 @@ def generator_selection_dialog():
     
     st.markdown('</div>', unsafe_allow_html=True)
 
-def cost_analysis_dialog():
-    """Modal dialog for cost analysis with generator selection and input fields"""
-    paired_gen = EBOSS_STANDARD_PAIRING.get(st.session_state.eboss_model, "25 kVA / 20 kW")
-        
-        # Generator selection section
-
-    
-gen_col1, gen_col2 = st.columns([1, 1])
-    
-        # Column 1
-with gen_col1:
-    if st.button("✅ Use Recommended", key="use_paired_gen_cost", use_container_width=True):
-        st.session_state.cost_standard_generator = paired_gen
-        st.rerun()
-    
-        # Column 2
-        with gen_col2:
-            if st.button("🔧 Select Different", key="select_different_gen_cost", use_container_width=True):
-                available_generators = list(STANDARD_GENERATOR_DATA.keys())
-                st.session_state.cost_standard_generator = st.selectbox(
-                    "Choose Standard Generator:",
-                    options=available_generators,
-                    index=available_generators.index(paired_gen) if paired_gen in available_generators else 0,
-                    key="cost_generator_select"
-                )
-    
-        # If a generator is selected, show the cost analysis form
-            if st.session_state.get("cost_standard_generator"):
-                st.divider()
-                st.subheader("Print")
-
-    # Call the dialog function
 def cost_analysis_dialog():
     """Modal dialog for cost analysis with generator selection and input fields"""
     paired_gen = EBOSS_STANDARD_PAIRING.get(st.session_state.eboss_model, "25 kVA / 20 kW")
     
     # Generator selection section
-    st.markdown("""
+    st.markdown(f"""
     <strong>Recommended Generator:</strong><br>
     For the <strong>{st.session_state.eboss_model}</strong> model: <strong>{paired_gen}</strong>
 
@@ -696,715 +156,176 @@ def cost_analysis_dialog():
                 key="cost_generator_select"
             )
     
-    # If a generator is selected, show the cost analysis form
-        if st.session_state.cost_standard_generator:
-            st.divider()
-            st.markdown('<a href="https://anacorp.com/contact/" target="_blank">Contact us for more details</a>', unsafe_allow_html=True)
-            st.subheader("Parameters")
-            
-        # Row 1: Fuel price and delivery fee
-st.markdown("**Fuel Information**")
-fuel_col1, fuel_col2 = st.columns([1, 1])
-
-with fuel_col1:
-    local_fuel_price = st.number_input(
-        "Local Fuel Price / Gal ($)",
-        min_value=-1.0,
-        max_value=1000.0,
-        value=0.00,
-        step=0.01,
-        key="local_fuel_price"
-    )
-
-with fuel_col2:
-    fuel_delivery_fee = st.number_input(
-        "Fuel Delivery Fee ($)",
-        min_value=0.0,       # float
-        max_value=1000.0,    # float
-        value=75.0,          # float
-        step=1.0,            # float
-        format="%.2f",       # show two decimal places
-        key="fuel_delivery_fee"
-    )
+    # If a generator is selected, point to the cost parameters below
+    if st.session_state.cost_standard_generator:
+        st.divider()
+        st.markdown('<a href="https://anacorp.com/contact/" target="_blank">Contact us for more details</a>', unsafe_allow_html=True)
 
-# Row 2: PM interval and PM charge   <-- FIXED: no extra indentation
-st.markdown("**Maintenance Information**")
-pm_col1, pm_col2 = st.columns([1, 1])
 
-with pm_col1:
-    pm_interval_hrs = st.number_input(
-        "PM Interval Hrs",
-        min_value=0.0,
-        max_value=1000.0,
-        value=0.0,
-        step=1.0,
-        key="pm_interval_hrs"
-    )
+# ------ Cost parameters (fragment) ------
+COST_PARAM_KEYS = ['local_fuel_price', 'fuel_delivery_fee', 'pm_interval_hrs', 'cost_per_pm',
+                   'eboss_weekly_rate', 'eboss_monthly_rate', 'standard_weekly_rate', 'standard_monthly_rate']
 
-with pm_col2:
-    pm_charge_selection = st.radio(
-        "Is there a PM Charge?",
-        options=["No", "Yes"],
-        index=0,
-        key="pm_charge_radio",
-        horizontal=True
-    )
+@st.fragment
+@fragment_run("cost_parameters")
+def cost_parameters_form():
+    """
+    Cost inputs. Editing a field reruns only this fragment, not the whole app.
 
-    if pm_charge_selection == "Yes":
-        cost_per_pm = st.number_input(
-            "Cost per PM ($)",
+    Output: st.session_state.cost_params, a dict of the current values, rewritten on
+    every change and read by cost_analysis.Cost_Analysis (the widget keys do not
+    survive the dialog closing). "Generate Analysis" and "Cancel" change what the rest of the page
+    shows, so they rerun the app; "Reset Form" only needs this fragment redrawn.
+    """
+    st.subheader("Parameters")
+    
+    # Row 1: Fuel price and delivery fee
+    st.markdown("**Fuel Information**")
+    fuel_col1, fuel_col2 = st.columns([1, 1])
+    
+    with fuel_col1:
+        local_fuel_price = st.number_input(
+            "Local Fuel Price / Gal ($)",
+            min_value=-1.0,
+            max_value=1000.0,
+            value=0.00,
+            step=0.01,
+            key="local_fuel_price"
+        )
+    
+    with fuel_col2:
+        fuel_delivery_fee = st.number_input(
+            "Fuel Delivery Fee ($)",
             min_value=0.0,
-            max_value=10000.0,
-            value=0.0,
-            step=0.1,
+            max_value=1000.0,
+            value=75.0,
+            step=1.0,
             format="%.2f",
-            key="cost_per_pm"
+            key="fuel_delivery_fee"
         )
-
-        
-        # Row 3: Weekly and Monthly rates for both systems
-st.markdown("**System Rates**")
-rate_col1, rate_col2 = st.columns([1, 1])
-
-# --- EBOSS Hybrid System ---
-with rate_col1:
-    st.markdown("**EBOSS Hybrid System**")
-    default_rate = 1500.0
-    eboss_weekly_rate = st.number_input(
-    "Weekly Rate ($)",
-    min_value=0.0,
-    max_value=100000.0,
-    value=max(default_rate, 0.0),
-    step=50.0,
-    format="%.2f",
-    key="eboss_weekly_rate"
-)
-
-    eboss_monthly_rate = st.number_input(
-    "Monthly Rate ($)",
-    min_value=0.0,           # ✅ safer than -1.00
-    max_value=100000.0,
-    value=0.0,
-    step=50.0,
-    format="%.2f",
-    key="eboss_monthly_rate"
-)
-
-# --- Standard Generator ---
-with rate_col2:
-    st.markdown("**Standard Generator**")
-    standard_weekly_rate = st.number_input(
-    "Weekly Rate ($)",
-    min_value=0.0,
-    max_value=100000.0,
-    value=0.0,
-    step=50.0,
-    format="%.2f",
-    key="standard_weekly_rate"
-)
-
-    standard_monthly_rate = st.number_input(
-    "Monthly Rate ($)",
-    min_value=0.0,
-    max_value=100000.0,
-    value=0.0,
-    step=50.0,
-    format="%.2f",
-    key="standard_monthly_rate"
-)
-
-        # Action buttons
-st.divider()
-action_col1, action_col2, action_col3 = st.columns([1, 1, 1])
-        
-with action_col1:
-    if st.button("Generate Analysis", key="generate_cost_analysis", use_container_width=True):
-        st.session_state.show_cost_dialog = False
-        st.session_state.show_cost_analysis = True
-        st.rerun()
-        
-        with action_col2:
-            if st.button("Reset Form", key="reset_cost_form", use_container_width=True):
-                # Reset all form values
-                for key in ['local_fuel_price', 'fuel_delivery_fee', 'pm_interval_hrs', 'cost_per_pm', 
-                           'eboss_weekly_rate', 'eboss_monthly_rate', 'standard_weekly_rate', 'standard_monthly_rate']:
-                    if key in st.session_state:
-                        del st.session_state[key]
-                st.rerun()
-        
-        with action_col3:
-            if st.button("Cancel", key="cancel_cost_dialog", use_container_width=True):
-                st.session_state.show_cost_dialog = False
-                st.rerun()
-
-# EBOSS Specifications Data
-EBOSS_SPECS = {
-    "EB25 kVA": {
-        "Hybrid Energy System": "ANA EBOSS",
-        "Three-phase Max Power": "30 kVA / 24 kW",
-        "Single-phase Max Power": "20 kVA / 16 kW",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120/240 (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Max Intermittent amp-load 208V": "70 A / 13.5 kW",
-        "Max Continuous amp-load 208V": "55 A / 10.5 kW",
-        "Max Intermittent amp-load 240V": "61 A / 13.5 kW",
-        "Max Continuous amp-load 240V": "48 A / 10.5 kW",
-        "Max Intermittent amp-load 480V": "35 A / 28 kW",
-        "Max Continuous amp-load 480V": "28 A / 22 kW",
-        "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
-        "Battery Capacity": "15 kWh",
-        "Generator kVA": "25 kVA (Hybrid units only)",
-        "Battery Voltage": "440 VDC",
-        "Inverter Type": "Pure Sine Wave",
-        "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
-        "Dimensions (L x W x H)": "108\" x 45\" x 62\"",
-        "Weight": "8,200 lbs",
-        "Warranty - EBOSS only": "2 Years",
-        "Warranty - With trailer & generator": "2 Years, 2000 Hours",
-        "Battery warranty": "7 Years",
-        "Service & Support": "24/7, 365 Days",
-        "Training": "Henderson, NV or On Location"
-    },
-    "EB70 kVA": {
-        "Hybrid Energy System": "ANA EBOSS",
-        "Three-phase Max Power": "70 kVA / 56 kW",
-        "Single-phase Max Power": "47 kVA / 37 kW",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120/240 (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Max Intermittent amp-load 208V": "194 A / 37.2 kW",
-        "Max Continuous amp-load 208V": "155 A / 29.8 kW",
-        "Max Intermittent amp-load 240V": "169 A / 37.2 kW",
-        "Max Continuous amp-load 240V": "135 A / 29.8 kW",
-        "Max Intermittent amp-load 480V": "84 A / 70 kW",
-        "Max Continuous amp-load 480V": "67 A / 56 kW",
-        "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
-        "Battery Capacity": "25 kWh",
-        "Generator kVA": "45 kVA (Hybrid units only)",
-        "Battery Voltage": "440 VDC",
-        "Inverter Type": "Pure Sine Wave",
-        "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
-        "Dimensions (L x W x H)": "108\" x 60\" x 62\"",
-        "Weight": "13,200 lbs",
-        "Warranty - EBOSS only": "2 Years",
-        "Warranty - With trailer & generator": "2 Years, 2000 Hours",
-        "Battery warranty": "7 Years",
-        "Service & Support": "24/7, 365 Days",
-        "Training": "Henderson, NV or On Location"
-    },
-    "EB125 kVA": {
-        "Hybrid Energy System": "ANA EBOSS",
-        "Three-phase Max Power": "125 kVA / 100 kW",
-        "Single-phase Max Power": "N/A / N/A",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120V (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Max Intermittent amp-load 208V": "345 A / 66.2 kW",
-        "Max Continuous amp-load 208V": "276 A / 53 kW",
-        "Max Intermittent amp-load 240V": "301 A / 66.2 kW",
-        "Max Continuous amp-load 240V": "241 A / 53 kW",
-        "Max Intermittent amp-load 480V": "150 A / 125 kW",
-        "Max Continuous amp-load 480V": "120 A / 100 kW",
-        "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
-        "Battery Capacity": "50 kWh",
-        "Generator kVA": "65 kVA (Hybrid units only)",
-        "Battery Voltage": "440 VDC",
-        "Inverter Type": "Pure Sine Wave",
-        "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
-        "Dimensions (L x W x H)": "144\" x 60\" x 62\"",
-        "Weight": "18,200 lbs",
-        "Warranty - EBOSS only": "2 Years",
-        "Warranty - With trailer & generator": "2 Years, 2000 Hours",
-        "Battery warranty": "7 Years",
-        "Service & Support": "24/7, 365 Days",
-        "Training": "Henderson, NV or On Location"
-    },
-    "EB220 kVA": {
-        "Hybrid Energy System": "ANA EBOSS",
-        "Three-phase Max Power": "220 kVA / 176 kW",
-        "Single-phase Max Power": "N/A / N/A",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120V (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Max Intermittent amp-load 208V": "700 A / 134 kW",
-        "Max Continuous amp-load 208V": "560 A / 108 kW",
-        "Max Intermittent amp-load 240V": "611 A / 134 kW",
-        "Max Continuous amp-load 240V": "489 A / 108 kW",
-        "Max Intermittent amp-load 480V": "264 A / 220 kW",
-        "Max Continuous amp-load 480V": "211 A / 176 kW",
-        "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
-        "Battery Capacity": "75 kWh",
-        "Generator kVA": "125 kVA (Hybrid units only)",
-        "Battery Voltage": "440 VDC",
-        "Inverter Type": "Pure Sine Wave",
-        "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
-        "Dimensions (L x W x H)": "192\" x 60\" x 62\"",
-        "Weight": "29,200 lbs",
-        "Warranty - EBOSS only": "2 Years",
-        "Warranty - With trailer & generator": "2 Years, 2000 Hours",
-        "Battery warranty": "7 Years",
-        "Service & Support": "24/7, 365 Days",
-        "Training": "Henderson, NV or On Location"
-    },
-    "EB400 kVA": {
-        "Hybrid Energy System": "ANA EBOSS™",
-        "Three-phase Max Power": "400 kVA / 320 kW",
-        "Single-phase Max Power": "N/A",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120V (Courtesy Outlets) • 480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Max Intermittent amp-load 208V": "481 A / 92.5 kW",
-        "Max Continuous amp-load 208V": "385 A / 74 kW",
-        "Max Intermittent amp-load 240V": "419 A / 92.5 kW",
-        "Max Continuous amp-load 240V": "335 A / 74 kW",
-        "Max Intermittent amp-load 480V": "481 A / 400 kW",
-        "Max Continuous amp-load 480V": "385 A / 320 kW",
-        "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
-        "Battery Capacity": "125 kWh",
-        "Generator kVA": "220 kVA (Hybrid units only)",
-        "Battery Voltage": "440 VDC",
-        "Inverter Type": "Pure Sine Wave",
-        "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
-        "Dimensions (L x W x H)": "240\" x 60\" x 62\"",
-        "Weight": "38,200 lbs",
-        "Warranty": "2 Years",
-        "Warranty - With generator": "2 Years, 2000 Hours",
-        "Battery warranty": "7 Years",
-        "Service & Support": "24/7, 365 Days",
-        "Training": "Henderson, NV or On Location"
-    }
-}
-
-
-#--POWER /ENGINE STATS--EBOSS
-spec_data = {
-    "EBOSS® 25 kVA": {
-        "Three-phase Output": "25 kVA / 20 kW",
-        "Single-phase Output": "20 kVA / 16 kW",
-        "Frequency": "60 Hz",
-        "Simultaneous Voltage": "120V (1Φ) • 208/480 (3Φ)",
-        "Voltage Regulation": "Adjustable",
-        "Max Intermittent Amp Load @208V": "83 A / 17.3 kW",
-        "Max Intermittent Amp Load @480V": "36 A / 29.8 kW",
-        "Motor Start Rating 3s @208V": "133 A / 47.8 kW",
-        "Motor Start Rating 3s @480V": "57 A / 47.8 kW",
-        "Generator": "Airman SDG25",
-        "EBOSS Charge Rate": "25 kVA / 20 kW"
-    },
-    "EBOSS® 70 kVA": {
-        "Three-phase Output": "45 kVA / 36 kW",
-        "Single-phase Output": "47 kVA / 37 kW",
-        "Frequency": "60 Hz",
-        "Simultaneous Voltage": "120V (1Φ) • 208/480 (3Φ)",
-        "Voltage Regulation": "Adjustable",
-        "Max Intermittent Amp Load @208V": "194 A / 38 kW",
-        "Max Intermittent Amp Load @480V": "84 A / 58 kW",
-        "Motor Start Rating 3s @208V": "298 A / 107 kW",
-        "Motor Start Rating 3s @480V": "129 A / 107 kW",
-        "Generator": "Airman SDG45",
-        "EBOSS Charge Rate": "45 kVA / 36 kW"
-    }
-}
-EBOSS_LOAD_REFERENCE = {
-    "battery_capacities": {
-        "EB25 kVA": 15,
-        "EB70 kVA": 25,
-        "EB125 kVA": 50,
-        "EB220 kVA": 75,
-        "EB400 kVA": 125
-    },
-    "generator_kva_hybrid": {
-        "EB25 kVA": 25,
-        "EB70 kVA": 45,
-        "EB125 kVA": 65,
-        "EB220 kVA": 125,
-        "EB400 kVA": 220
-    },
-    "generator_sizes": {
-        25: {"eboss_model": "EB25 kVA", "pm_charge_rate": 18.5, "fh_charge_rate": 19.5, "max_charge_rate": 20, "kwh": 15, "gen_kw": 20},
-        45: {"eboss_model": "EB70 kVA", "pm_charge_rate": 33, "fh_charge_rate": 36, "max_charge_rate": 45, "kwh": 25, "gen_kw": 36},
-        65: {"eboss_model": "EB125 kVA", "pm_charge_rate": 48, "fh_charge_rate": 52, "max_charge_rate": 65, "kwh": 50, "gen_kw": 52},
-        125: {"eboss_model": "EB220 kVA", "pm_charge_rate": 96, "fh_charge_rate": 100, "max_charge_rate": 125, "kwh": 75, "gen_kw": 100},
-        220: {"eboss_model": "EB400 kVA", "pm_charge_rate": 166, "fh_charge_rate": 176, "max_charge_rate": 220, "kwh": 125, "gen_kw": 176}
-    },
-    "gph_interpolation": {
-        25: {"25%": 0.67, "50%": 0.94, "75%": 1.26, "100%": 1.62},
-        45: {"25%": 1.04, "50%": 1.60, "75%": 2.20, "100%": 2.03},
-        70: {"25%": 1.70, "50%": 2.60, "75%": 3.50, "100%": 4.40},
-        125: {"25%": 2.60, "50%": 4.10, "75%": 5.60, "100%": 7.10},
-        220: {"25%": 4.60, "50%": 6.90, "75%": 9.40, "100%": 12.00},
-        400: {"25%": 7.70, "50%": 12.20, "75%": 17.30, "100%": 22.50}
-    }
-}
-
-# Standard Diesel Generator Reference Data (based on authentic industry specifications)
-STANDARD_GENERATOR_DATA = {
-    "25 kVA / 20 kW": {
-        "kva": 25, "kw": 20,
-        "fuel_consumption_gph": {"50%": 0.90, "75%": 1.30, "100%": 1.60},
-        "noise_level_db": 68, "dimensions": "L:48\" W:24\" H:30\"", "weight_lbs": 650,
-        "fuel_tank_gal": 12, "runtime_at_50_load": 13.3, "co2_per_gal": 22.4
-    },
-    "45 kVA / 36 kW": {
-        "kva": 45, "kw": 36,
-        "fuel_consumption_gph": {"50%": 2.30, "75%": 3.20, "100%": 4.00},
-        "noise_level_db": 72, "dimensions": "L:60\" W:28\" H:36\"", "weight_lbs": 1200,
-        "fuel_tank_gal": 25, "runtime_at_50_load": 10.9, "co2_per_gal": 22.4
-    },
-    "65 kVA / 52 kW": {
-        "kva": 65, "kw": 52,
-        "fuel_consumption_gph": {"50%": 2.90, "75%": 3.80, "100%": 4.80},
-        "noise_level_db": 75, "dimensions": "L:72\" W:32\" H:42\"", "weight_lbs": 1800,
-        "fuel_tank_gal": 40, "runtime_at_50_load": 13.8, "co2_per_gal": 22.4
-    },
-    "125 kVA / 100 kW": {
-        "kva": 125, "kw": 100,
-        "fuel_consumption_gph": {"50%": 5.00, "75%": 7.10, "100%": 9.10},
-        "noise_level_db": 78, "dimensions": "L:96\" W:36\" H:48\"", "weight_lbs": 3200,
-        "fuel_tank_gal": 75, "runtime_at_50_load": 15.0, "co2_per_gal": 22.4
-    },
-    "220 kVA / 176 kW": {
-        "kva": 220, "kw": 176,
-        "fuel_consumption_gph": {"50%": 8.80, "75%": 12.50, "100%": 16.60},
-        "noise_level_db": 82, "dimensions": "L:120\" W:48\" H:60\"", "weight_lbs": 5500,
-        "fuel_tank_gal": 125, "runtime_at_50_load": 14.2, "co2_per_gal": 22.4
-    },
-    "400 kVA / 320 kW": {
-        "kva": 400, "kw": 320,
-        "fuel_consumption_gph": {"50%": 14.90, "75%": 21.30, "100%": 28.60},
-        "noise_level_db": 85, "dimensions": "L:144\" W:60\" H:72\"", "weight_lbs": 8800,
-        "fuel_tank_gal": 200, "runtime_at_50_load": 13.4, "co2_per_gal": 22.4
-    }
-}
-
-# Standard Generator Data for Comparison
-STANDARD_GENERATOR_DATA = {
-    "25 kVA / 20 kW": {
-        "kw": 20,
-        "fuel_consumption_gph": {"50%": 1.2, "75%": 1.7, "100%": 2.3},
-        "fuel_tank_gal": 38,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 75,
-        "dimensions": "60\" x 24\" x 36\"",
-        "weight_lbs": 1850
-    },
-    "45 kVA / 36 kW": {
-        "kw": 36,
-        "fuel_consumption_gph": {"50%": 2.1, "75%": 3.0, "100%": 4.1},
-        "fuel_tank_gal": 60,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 78,
-        "dimensions": "72\" x 30\" x 42\"",
-        "weight_lbs": 2850
-    },
-    "65 kVA / 52 kW": {
-        "kw": 52,
-        "fuel_consumption_gph": {"50%": 2.8, "75%": 4.2, "100%": 5.8},
-        "fuel_tank_gal": 80,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 80,
-        "dimensions": "84\" x 36\" x 48\"",
-        "weight_lbs": 4200
-    },
-    "125 kVA / 100 kW": {
-        "kw": 100,
-        "fuel_consumption_gph": {"50%": 5.2, "75%": 7.8, "100%": 10.5},
-        "fuel_tank_gal": 120,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 82,
-        "dimensions": "120\" x 48\" x 60\"",
-        "weight_lbs": 8500
-    },
-    "220 kVA / 176 kW": {
-        "kw": 176,
-        "fuel_consumption_gph": {"50%": 9.1, "75%": 13.7, "100%": 18.2},
-        "fuel_tank_gal": 200,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 85,
-        "dimensions": "144\" x 60\" x 72\"",
-        "weight_lbs": 15000
-    },
-    "400 kVA / 320 kW": {
-        "kw": 320,
-        "fuel_consumption_gph": {"50%": 16.8, "75%": 25.2, "100%": 33.6},
-        "fuel_tank_gal": 350,
-        "co2_per_gal": 22.4,
-        "noise_level_db": 88,
-        "dimensions": "180\" x 72\" x 84\"",
-        "weight_lbs": 28000
-    }
-}
-
-def interpolate_gph(generator_kva, load_percent):
-    """
-    Interpolate GPH fuel consumption based on generator kVA and load percentage
-    Uses authentic EBOSS GPH interpolation data from working_Accurate_Fuel_Calc_1752711064907.xlsx
-    """
-    # Convert load percent to decimal if needed
-    if load_percent > 1:
-        load_percent = load_percent / 100
-    
-    # Get GPH interpolation data
-    gph_data_map = EBOSS_LOAD_REFERENCE["gph_interpolation"]
     
-    # Find the correct generator size data or closest match
-    if generator_kva not in gph_data_map:
-        # Find closest generator size
-        available_sizes = list(gph_data_map.keys())
-        closest_size = min(available_sizes, key=lambda x: abs(x - generator_kva))
-        gph_data = gph_data_map[closest_size]
-    else:
-        gph_data = gph_data_map[generator_kva]
+    # Row 2: PM interval and PM charge
+    st.markdown("**Maintenance Information**")
+    pm_col1, pm_col2 = st.columns([1, 1])
     
-    # Define load percentage breakpoints and corresponding GPH values
-    load_points = [0.25, 0.50, 0.75, 1.00]
-    gph_values = [gph_data["25%"], gph_data["50%"], gph_data["75%"], gph_data["100%"]]
-    
-    # Clamp load_percent to valid range
-    load_percent = max(0.25, min(1.00, load_percent))
+    with pm_col1:
+        pm_interval_hrs = st.number_input(
+            "PM Interval Hrs",
+            min_value=0.0,
+            max_value=1000.0,
+            value=0.0,
+            step=1.0,
+            key="pm_interval_hrs"
+        )
     
-    # Handle edge cases
-    if load_percent <= 0.25:
-        return gph_values[0]
-    elif load_percent >= 1.00:
-        return gph_values[3]
+    cost_per_pm = 0.0
+    with pm_col2:
+        pm_charge_selection = st.radio(
+            "Is there a PM Charge?",
+            options=["No", "Yes"],
+            index=0,
+            key="pm_charge_radio",
+            horizontal=True
+        )
+        
+        if pm_charge_selection == "Yes":
+            cost_per_pm = st.number_input(
+                "Cost per PM ($)",
+                min_value=0.0,
+                max_value=10000.0,
+                value=0.0,
+                step=0.1,
+                format="%.2f",
+                key="cost_per_pm"
+            )
     
-    # Find the two points to interpolate between
-    for i in range(len(load_points) - 1):
-        if load_points[i] <= load_percent <= load_points[i + 1]:
-            # Linear interpolation formula: y = y1 + (x - x1) * (y2 - y1) / (x2 - x1)
-            x1, x2 = load_points[i], load_points[i + 1]
-            y1, y2 = gph_values[i], gph_values[i + 1]
-            
-            interpolated_gph = y1 + (load_percent - x1) * (y2 - y1) / (x2 - x1)
-            return round(interpolated_gph, 4)
+    # Row 3: Weekly and Monthly rates for both systems
+    st.markdown("**System Rates**")
+    rate_col1, rate_col2 = st.columns([1, 1])
     
-    return 0
-
-def calculate_charge_rate(eboss_model, eboss_type, generator_kva=None, custom_rate=None):
-    """Calculate charge rate using authentic formulas"""
-    if custom_rate:
-        return custom_rate
+    # --- EBOSS Hybrid System ---
+    with rate_col1:
+        st.markdown("**EBOSS Hybrid System**")
+        default_rate = 1500.0
+        eboss_weekly_rate = st.number_input(
+            "Weekly Rate ($)",
+            min_value=0.0,
+            max_value=100000.0,
+            value=max(default_rate, 0.0),
+            step=50.0,
+            format="%.2f",
+            key="eboss_weekly_rate"
+        )
         
-    # Get generator kW capacity
-    generator_kw = 0
-    if eboss_type == "Full Hybrid":
-        # Use paired generator for hybrid
-        hybrid_kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(eboss_model, 0)
-        generator_kw = hybrid_kva * 0.8  # kW = kVA * 0.8
-    elif eboss_type == "Power Module" and generator_kva:
-        # Use selected generator for power module
-        gen_kva = float(generator_kva.replace("kVA", ""))
-        generator_kw = gen_kva * 0.8  # kW = kVA * 0.8
+        eboss_monthly_rate = st.number_input(
+            "Monthly Rate ($)",
+            min_value=0.0,
+            max_value=100000.0,
+            value=0.0,
+            step=50.0,
+            format="%.2f",
+            key="eboss_monthly_rate"
+        )
     
-    # Calculate charge rate based on formulas
-    if eboss_type == "Full Hybrid":
-        # Full Hybrid: 98% of generator kW
-        charge_rate = generator_kw * 0.98
-    elif eboss_type == "Power Module":
-        # Power Module: 98% of (90% of generator kW)
-        charge_rate = generator_kw * 0.90 * 0.98
-    else:
-        charge_rate = 0
+    # --- Standard Generator ---
+    with rate_col2:
+        st.markdown("**Standard Generator**")
+        standard_weekly_rate = st.number_input(
+            "Weekly Rate ($)",
+            min_value=0.0,
+            max_value=100000.0,
+            value=0.0,
+            step=50.0,
+            format="%.2f",
+            key="standard_weekly_rate"
+        )
         
-    return round(charge_rate, 1)
-
-def get_max_charge_rate(eboss_model, eboss_type, generator_kva=None):
-    """Get maximum allowed charge rate using model-specific limits, with 98% generator kW as fallback"""
-    
-    # EBOSS model specific maximum charge rates from the table
-    model_max_charge_rates = {
-        "EB25 kVA": 20,
-        "EB70 kVA": 45,
-        "EB125 kVA": 65,
-        "EB220 kVA": 125,
-        "EB400 kVA": 220
-    }
-    
-    # Get model-specific max charge rate
-    model_max = model_max_charge_rates.get(eboss_model, 0)
-    
-    # Calculate 98% of generator kW as secondary limit
-    generator_kw = 0
-    if eboss_type == "Full Hybrid":
-        hybrid_kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(eboss_model, 0)
-        generator_kw = hybrid_kva * 0.8
-    elif eboss_type == "Power Module" and generator_kva:
-        gen_kva = float(generator_kva.replace("kVA", ""))
-        generator_kw = gen_kva * 0.8
-    
-    generator_98_percent = generator_kw * 0.98
-    
-    # Use the lower of the two limits (model max or 98% generator kW)
-    if model_max > 0 and generator_98_percent > 0:
-        max_charge_rate = min(model_max, generator_98_percent)
-    elif model_max > 0:
-        max_charge_rate = model_max
-    elif generator_98_percent > 0:
-        max_charge_rate = generator_98_percent
-    else:
-        max_charge_rate = 0
-    
-    return round(max_charge_rate, 1)
-
-def calculate_standard_generator_specs(standard_generator_size, continuous_load, max_peak_load):
-    """Calculate specifications for standard diesel generator comparison using authentic interpolation"""
-    if not standard_generator_size or standard_generator_size not in STANDARD_GENERATOR_DATA:
-        return {}
-    
-    gen_data = STANDARD_GENERATOR_DATA[standard_generator_size]
-    gen_kw = gen_data["kw"]
-    
-    # Calculate engine load percentage based on continuous load (since it runs 24/7)
-    engine_load_percent = (continuous_load / gen_kw * 100) if gen_kw > 0 else 0
-    load_percentage = continuous_load / gen_kw if gen_kw > 0 else 0
-    
-    # Use same interpolation method as EBOSS for consistency
-    fuel_gph_data = gen_data["fuel_consumption_gph"]
-    if load_percentage <= 0.5:
-        fuel_per_hour = fuel_gph_data["50%"]
-    elif load_percentage <= 0.75:
-        fuel_per_hour = fuel_gph_data["75%"]
-    else:
-        fuel_per_hour = fuel_gph_data["100%"]
-    
-    # Calculate daily, weekly, monthly consumption (runs 24/7)
-    fuel_per_day = fuel_per_hour * 24
-    fuel_per_week = fuel_per_day * 7
-    fuel_per_month = fuel_per_day * 30
-    
-    # Calculate CO2 emissions (22.4 lbs CO2 per gallon of diesel)
-    co2_per_day = fuel_per_day * gen_data["co2_per_gal"]
-    
-    # Runtime is continuous (24 hours) since no battery backup
-    runtime_per_day = 24.0
-    
-    # Tank runtime calculation
-    tank_runtime = gen_data["fuel_tank_gal"] / fuel_per_hour if fuel_per_hour > 0 else 0
-    
-    return {
-        "generator_type": "Standard Diesel Generator",
-        "generator_size": standard_generator_size,
-        "engine_load_percent": engine_load_percent,
-        "continuous_load_percent": load_percentage * 100,
-        "fuel_consumption_gph": fuel_per_hour,
-        "fuel_per_hour": fuel_per_hour,
-        "fuel_per_day": fuel_per_day,
-        "fuel_per_week": fuel_per_week,
-        "fuel_per_month": fuel_per_month,
-        "co2_per_day": co2_per_day,
-        "runtime_per_day": runtime_per_day,
-        "tank_runtime_hours": tank_runtime,
-        "noise_level": gen_data["noise_level_db"],
-        "dimensions": gen_data["dimensions"],
-        "weight_lbs": gen_data["weight_lbs"],
-        "fuel_tank_capacity": gen_data["fuel_tank_gal"]
-            }
-
-
-
-def calculate_load_specs(eboss_model, eboss_type, continuous_load, max_peak_load, generator_kva=None, custom_charge_rate=None):
-    """Calculate load-based specifications using authentic EBOSS reference data"""
+        standard_monthly_rate = st.number_input(
+            "Monthly Rate ($)",
+            min_value=0.0,
+            max_value=100000.0,
+            value=0.0,
+            step=50.0,
+            format="%.2f",
+            key="standard_monthly_rate"
+        )
     
-    # Get EBOSS model capacity based on generator size and max continuous load
-    generator_kw_mapping = {
-        "EB25 kVA": 14.5,   # Gen Size 25 kVA
-        "EB70 kVA": 24.5,   # Gen Size 45 kVA  
-        "EB125 kVA": 49,    # Gen Size 65 kVA
-        "EB220 kVA": 74,    # Gen Size 125 kVA
-        "EB400 kVA": 125    # Gen Size 220 kVA
+    st.session_state.cost_params = {
+        "local_fuel_price": local_fuel_price,
+        "fuel_delivery_fee": fuel_delivery_fee,
+        "pm_interval_hrs": pm_interval_hrs,
+        "cost_per_pm": cost_per_pm,
+        "eboss_weekly_rate": eboss_weekly_rate,
+        "eboss_monthly_rate": eboss_monthly_rate,
+        "standard_weekly_rate": standard_weekly_rate,
+        "standard_monthly_rate": standard_monthly_rate,
     }
-    model_capacity = generator_kw_mapping.get(eboss_model, 0)
-    
-    # Find matching generator data
-    generator_data = None
-    if generator_kva:
-        gen_size = int(generator_kva.replace("kVA", ""))
-        generator_data = EBOSS_LOAD_REFERENCE["generator_sizes"].get(gen_size)
-    
-    # Calculate utilization
-    peak_utilization = (max_peak_load / model_capacity * 100) if model_capacity > 0 else 0
-    continuous_utilization = (continuous_load / model_capacity * 100) if model_capacity > 0 else 0
-    
-    # Calculate charge rate using new formula
-    charge_rate = calculate_charge_rate(eboss_model, eboss_type, generator_kva, custom_charge_rate)
-    
-    # Calculate fuel consumption and engine load based on EBOSS model's paired generator
-    fuel_consumption = None
-    engine_load_percent = 0
-    
-    # Get the appropriate generator size for this EBOSS model
-    paired_generator_kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(eboss_model, 0)
-    if paired_generator_kva > 0:
-        # Get paired generator data
-        paired_gen_data = EBOSS_LOAD_REFERENCE["generator_sizes"].get(paired_generator_kva)
-        if paired_gen_data:
-            gen_kw = paired_gen_data["gen_kw"]
-            charge_rate_kw = charge_rate  # charge rate is already in kW
-            engine_load_percent = (charge_rate_kw / gen_kw * 100) if gen_kw > 0 else 0
-            
-            # Use charge rate for GPH interpolation
-            load_percentage = charge_rate_kw / gen_kw if gen_kw > 0 else 0
-            
-            # Interpolate GPH based on paired generator size and load percentage
-            gph_data = EBOSS_LOAD_REFERENCE["gph_interpolation"].get(paired_generator_kva, {})
-            
-            if load_percentage <= 0.25:
-                fuel_consumption = gph_data.get("25%", 0)
-            elif load_percentage <= 0.5:
-                fuel_consumption = gph_data.get("50%", 0)
-            elif load_percentage <= 0.75:
-                fuel_consumption = gph_data.get("75%", 0)
-            else:
-                fuel_consumption = gph_data.get("100%", 0)
-    
-    # Calculate battery specs - always use model-specific capacity
-    battery_capacity = EBOSS_LOAD_REFERENCE["battery_capacities"].get(eboss_model, 0)
-    charge_time = (battery_capacity / charge_rate) if charge_rate > 0 else 0
     
-    # Calculate environmental impact
-    co2_per_day = fuel_consumption * 24 * 19.6 if fuel_consumption else 0  # 19.6 lbs CO2 per gallon
+    # Action buttons
+    st.divider()
+    action_col1, action_col2, action_col3 = st.columns([1, 1, 1])
     
+    with action_col1:
+        if st.button("Generate Analysis", key="generate_cost_analysis", use_container_width=True):
+            st.session_state.show_cost_dialog = False
+            st.session_state.show_cost_analysis = True
+            st.rerun()
     
+    with action_col2:
+        if st.button("Reset Form", key="reset_cost_form", use_container_width=True):
+            # Reset all form values
+            for key in COST_PARAM_KEYS:
+                if key in st.session_state:
+                    del st.session_state[key]
+            st.rerun(scope="fragment")
+    
+    with action_col3:
+        if st.button("Cancel", key="cancel_cost_dialog", use_container_width=True):
+            st.session_state.show_cost_dialog = False
+            st.rerun()
 
-
-# Initialize session state
-if 'eboss_model' not in st.session_state:
-    st.session_state.eboss_model = None
-if 'eboss_type' not in st.session_state:
-    st.session_state.eboss_type = None
-if 'generator_kva' not in st.session_state:
-    st.session_state.generator_kva = None
-if 'continuous_load' not in st.session_state:
-    st.session_state.continuous_load = None
-if 'max_peak_load' not in st.session_state:
-    st.session_state.max_peak_load = None
-if 'show_specs' not in st.session_state:
-    st.session_state.show_specs = False
-if 'show_load_specs' not in st.session_state:
-    st.session_state.show_load_specs = False
-if 'show_comparison' not in st.session_state:
-    st.session_state.show_comparison = False
-if 'standard_generator' not in st.session_state:
-    st.session_state.standard_generator = None
-if 'custom_charge_rate' not in st.session_state:
-    st.session_state.custom_charge_rate = None
-if 'use_custom_charge' not in st.session_state:
-    st.session_state.use_custom_charge = False
-if 'show_generator_dialog' not in st.session_state:
-    st.session_state.show_generator_dialog = False
-if 'paired_generator' not in st.session_state:
-    st.session_state.paired_generator = None
-
-# EBOSS to Standard Generator Pairing (ascending order: 25, 65, 125, 220, 400 kVA)
-EBOSS_STANDARD_PAIRING = {
-    "EB25 kVA": "25 kVA / 20 kW",
-    "EB70 kVA": "65 kVA / 52 kW", 
-    "EB125 kVA": "125 kVA / 100 kW",
-    "EB220 kVA": "220 kVA / 176 kW",
-    "EB400 kVA": "400 kVA / 320 kW"
-}
+section("cost parameters")
+cost_parameters_form()
 
 
 def format_difference_value(difference, spec_name):
@@ -1418,6 +339,7 @@ def format_difference_value(difference, spec_name):
     return diff_str, "var(--alpine-white)"
 
 
+section("configuration form")
 col1, col2 = st.columns([1, 1])
 
 with col1:
@@ -1500,6 +422,7 @@ with col2:
     
     st.markdown('</div>', unsafe_allow_html=True)
 
+section("action buttons")
 # Button section
 st.markdown('<br>', unsafe_allow_html=True)
 button_col1, button_col2, button_col3, button_col4, button_col5 = st.columns([1, 1, 1, 1, 1])
@@ -1557,6 +480,7 @@ with button_col5:
         st.session_state.show_cost_analysis = False
         st.rerun()
 
+section("spec tables")
 # Specifications Display
 if st.session_state.show_specs and st.session_state.eboss_model:
     st.markdown('<br>', unsafe_allow_html=True)
@@ -1857,8 +781,14 @@ elif st.session_state.show_load_specs and st.session_state.eboss_model and st.se
 
 # Charge Rate Modal Dialog
 @st.dialog("⚡ Charge Rate Configuration")
-
-def charge_rate_modal():
+@fragment_run("charge_rate_modal")
+def charge_rate_modal(current_rate, max_rate, default_rate, battery_kwh, battery_life):
+    """
+    Dialogs run as fragments: typing a custom rate reruns only this function, so
+    everything it shows comes in through the arguments (captured when the modal
+    opened). Output: use_custom_charge / custom_charge_rate in session state,
+    applied with a full rerun.
+    """
     # Apply custom styling for better readability
     st.markdown("""
     <style>
@@ -1878,14 +808,13 @@ def charge_rate_modal():
     # Current and max rates display
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown(f'<span style="color: #ffffff;"><strong>Current Rate:</strong> {st.session_state.get("current_charge_rate", 0)} kW</span>', unsafe_allow_html=True)
+        st.markdown(f'<span style="color: #ffffff;"><strong>Current Rate:</strong> {current_rate} kW</span>', unsafe_allow_html=True)
     with col2:
-        st.markdown(f'<span style="color: #ffffff;"><strong>Maximum Allowed:</strong> {st.session_state.get("max_charge_rate", 0)} kW</span>', unsafe_allow_html=True)
+        st.markdown(f'<span style="color: #ffffff;"><strong>Maximum Allowed:</strong> {max_rate} kW</span>', unsafe_allow_html=True)
     
     st.markdown("---")
     
     # Option 1: Use Recommended
-    default_rate = st.session_state.get("default_charge_rate", 0)
     if st.button(f"✓ Use Recommended ({default_rate} kW)", key="dialog_recommended", use_container_width=True):
         st.session_state.use_custom_charge = False
         st.session_state.custom_charge_rate = None
@@ -1896,7 +825,6 @@ def charge_rate_modal():
     
     # Custom rate input
     current_custom = st.session_state.custom_charge_rate or default_rate
-    max_rate = st.session_state.get("max_charge_rate", 100)
     
     custom_rate = st.number_input(
         "Custom Charge Rate (kW)",
@@ -1909,10 +837,6 @@ def charge_rate_modal():
     )
     
     # Preview calculations
-    battery_kwh = st.session_state.get("battery_capacity_kwh", 0)
-    battery_life = st.session_state.get("battery_longevity", 0)
-    current_rate = st.session_state.get("current_charge_rate", 0)
-    
     if custom_rate != current_rate and battery_kwh > 0:
         new_charge_time = battery_kwh / custom_rate if custom_rate > 0 else 0
         new_charges_day = 24 / (new_charge_time + battery_life) if (new_charge_time + battery_life) > 0 else 0
@@ -1943,9 +867,16 @@ def charge_rate_modal():
             st.session_state.show_charge_modal = False
             st.rerun()
 
+section("dialogs and comparison table")
 # Show modal if requested
 if st.session_state.get('show_charge_modal', False):
-    charge_rate_modal()
+    charge_rate_modal(
+        current_rate=st.session_state.get("current_charge_rate", 0),
+        max_rate=st.session_state.get("max_charge_rate", 100),
+        default_rate=st.session_state.get("default_charge_rate", 0),
+        battery_kwh=st.session_state.get("battery_capacity_kwh", 0),
+        battery_life=st.session_state.get("battery_longevity", 0),
+    )
 
 # Show generator selection dialog
 elif st.session_state.get('show_generator_dialog', False):
@@ -1991,23 +922,18 @@ elif st.session_state.get('show_comparison', False) and st.session_state.eboss_m
     # Only show comparison table if standard generator is selected
     if st.session_state.standard_generator:
         # Calculate specifications for both systems
+        # (a slice of the precomputed comparison matrix unless a custom charge rate is set)
         custom_charge = st.session_state.custom_charge_rate if st.session_state.use_custom_charge else None
-        eboss_specs = calculate_load_specs(
+        comparison = compare(
             st.session_state.eboss_model,
             st.session_state.eboss_type,
-            st.session_state.continuous_load,
-            st.session_state.max_peak_load,
             st.session_state.generator_kva,
-            custom_charge
-        )
-        
-        standard_specs = calculate_standard_generator_specs(
             st.session_state.standard_generator,
             st.session_state.continuous_load,
-            st.session_state.max_peak_load
+            custom_charge
         )
         
-        if eboss_specs and standard_specs:
+        if comparison:
             # Create 4-column layout: Labels, EBOSS® Values, Standard Generator Values, Difference
             col1, col2, col3, col4 = st.columns([2, 1.5, 1.5, 1])
         
@@ -2039,240 +965,36 @@ elif st.session_state.get('show_comparison', False) and st.session_state.eboss_m
                 </div>
                 """, unsafe_allow_html=True)
         
-            # Calculate EBOSS® fuel consumption values
-            eboss_fuel_per_hour = eboss_specs.get('fuel_consumption_gph', 0) or 0
-            battery_capacity = eboss_specs.get('battery_capacity', 0)
-            charge_time = eboss_specs.get('charge_time', 0)
-            battery_life = battery_capacity / st.session_state.continuous_load if st.session_state.continuous_load > 0 else 0
-            
-            if charge_time > 0 and battery_life > 0:
-                eboss_runtime_hours = charge_time
-                eboss_cycles_per_day = 24 / (charge_time + battery_life)
-                eboss_fuel_per_day = eboss_fuel_per_hour * eboss_runtime_hours * eboss_cycles_per_day
-            else:
-                eboss_fuel_per_day = 0
-                
-            eboss_fuel_per_month = eboss_fuel_per_day * 30
-            eboss_co2_per_day = eboss_fuel_per_day * 22.4
-            
-            # Calculate differences
-            fuel_diff_day = eboss_fuel_per_day - standard_specs['fuel_per_day']
-            fuel_diff_month = eboss_fuel_per_month - standard_specs['fuel_per_month']
-            co2_diff_day = eboss_co2_per_day - standard_specs['co2_per_day']
-            
-            # Get EBOSS® engine load percentage from specs (based on paired generator)
-            eboss_engine_load = eboss_specs.get('engine_load_percent', 0)
-            standard_engine_load = 100  # Standard generators run at 100% of rated load
-            engine_load_diff = eboss_engine_load - standard_engine_load
+            # EBOSS® and standard fuel/emissions figures at this load
+            eboss_fuel_per_hour = comparison.eboss_fuel_gph
+            eboss_fuel_per_day = comparison.eboss_fuel_per_day
+            eboss_fuel_per_month = comparison.eboss_fuel_per_month
+            eboss_co2_per_day = comparison.eboss_co2_per_day
+            eboss_engine_load = comparison.eboss_engine_load_percent
             
             # Get paired generator info for display
             paired_generator_kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(st.session_state.eboss_model, 0)
             paired_gen_name = f"{paired_generator_kva} kVA" if paired_generator_kva > 0 else "N/A"
             
-            # Calculate standard generator engine load based on continuous load
-            standard_gen_data = STANDARD_GENERATOR_DATA.get(st.session_state.standard_generator, {})
-            standard_gen_kw = standard_gen_data.get('kw', 20)
-            standard_engine_load_percent = (st.session_state.continuous_load / standard_gen_kw * 100) if standard_gen_kw > 0 else 0
+            standard_engine_load_percent = comparison.standard_engine_load_percent
             
             # Get EBOSS® specs based on model
             eboss_model_specs = EBOSS_SPECS.get(st.session_state.eboss_model, {})
             
-            # Get EBOSS® max continuous output kW from specifications
-            eboss_max_continuous_kw = {
-                "EB25 kVA": 22,    # From Max Continuous amp-load 480V: 28 A / 22 kW
-                "EB70 kVA": 56,    # From Max Continuous amp-load 480V: 67 A / 56 kW  
-                "EB125 kVA": 80,   # From Max Continuous amp-load 480V: 192 A / 80 kW
-                "EB220 kVA": 176,  # From Max Continuous amp-load 480V: 211 A / 176 kW
-                "EB400 kVA": 320   # From Max Continuous amp-load 480V: 385 A / 320 kW
-            }.get(st.session_state.eboss_model, 0)
-            
-            # Authentic comparison data from Excel table (all values except GPH and engine load %)
-            authentic_comparison_specs = {
-                "EB25 kVA": {
-                    "Three-phase Max Power": "30 kVA / 24 kW",
-                    "Single-phase Max Power": "12 kW",
-                    "Frequency": "60 Hz",
-                    "Simultaneous voltage": "Yes", 
-                    "Voltage regulation": "Adjustable",
-                    "Max Intermittent amp-load 208V": "83 A",
-                    "Max Intermittent amp-load 480V": "36 A",
-                    "Motor start rating - 3 second 208V": "166 A",
-                    "Motor start rating - 3 second 480V": "72 A",
-                    "Three-phase Continuous": "14.5 kW",
-                    "Single-phase Continuous": "12 kW", 
-                    "Max Continuous amp-load 208V": "40 A",
-                    "Max Continuous amp-load 480V": "17 A",
-                    "Parallelable": "Yes"
-                },
-                "EB70 kVA": {
-                    "Three-phase Max Power": "85 kVA / 68 kW",
-                    "Single-phase Max Power": "30 kW",
-                    "Frequency": "60 Hz",
-                    "Simultaneous voltage": "Yes",
-                    "Voltage regulation": "Adjustable", 
-                    "Max Intermittent amp-load 208V": "236 A",
-                    "Max Intermittent amp-load 480V": "102 A",
-                    "Motor start rating - 3 second 208V": "472 A",
-                    "Motor start rating - 3 second 480V": "204 A",
-                    "Three-phase Continuous": "24.5 kW",
-                    "Single-phase Continuous": "30 kW",
-                    "Max Continuous amp-load 208V": "68 A", 
-                    "Max Continuous amp-load 480V": "29 A",
-                    "Parallelable": "Yes"
-                },
-                "EB125 kVA": {
-                    "Three-phase Max Power": "151 kVA / 121 kW",
-                    "Single-phase Max Power": "50 kW",
-                    "Frequency": "60 Hz",
-                    "Simultaneous voltage": "Yes",
-                    "Voltage regulation": "Adjustable",
-                    "Max Intermittent amp-load 208V": "419 A",
-                    "Max Intermittent amp-load 480V": "181 A", 
-                    "Motor start rating - 3 second 208V": "838 A",
-                    "Motor start rating - 3 second 480V": "362 A",
-                    "Three-phase Continuous": "49 kW",
-                    "Single-phase Continuous": "50 kW",
-                    "Max Continuous amp-load 208V": "136 A",
-                    "Max Continuous amp-load 480V": "59 A",
-                    "Parallelable": "Yes"
-                },
-                "EB220 kVA": {
-                    "Three-phase Max Power": "266 kVA / 213 kW", 
-                    "Single-phase Max Power": "75 kW",
-                    "Frequency": "60 Hz",
-                    "Simultaneous voltage": "Yes",
-                    "Voltage regulation": "Adjustable",
-                    "Max Intermittent amp-load 208V": "739 A",
-                    "Max Intermittent amp-load 480V": "319 A",
-                    "Motor start rating - 3 second 208V": "1478 A", 
-                    "Motor start rating - 3 second 480V": "638 A",
-                    "Three-phase Continuous": "74 kW",
-                    "Single-phase Continuous": "75 kW", 
-                    "Max Continuous amp-load 208V": "206 A",
-                    "Max Continuous amp-load 480V": "89 A",
-                    "Parallelable": "Yes"
-                },
-                "EB400 kVA": {
-                    "Three-phase Max Power": "484 kVA / 387 kW",
-                    "Single-phase Max Power": "125 kW",
-                    "Frequency": "60 Hz", 
-                    "Simultaneous voltage": "Yes",
-                    "Voltage regulation": "Adjustable",
-                    "Max Intermittent amp-load 208V": "1347 A",
-                    "Max Intermittent amp-load 480V": "582 A",
-                    "Motor start rating - 3 second 208V": "2694 A",
-                    "Motor start rating - 3 second 480V": "1164 A",
-                    "Three-phase Continuous": "125 kW",
-                    "Single-phase Continuous": "125 kW",
-                    "Max Continuous amp-load 208V": "347 A", 
-                    "Max Continuous amp-load 480V": "150 A",
-                    "Parallelable": "Yes"
-                }
-            }
-            
-            # Authentic standard generator specifications from Excel table (complete data)
-            authentic_standard_specs = {
-                "25 kVA / 20 kW": {
-                    "Three-phase Max Power": "25 kVA / 20 kW",
-                    "Single-phase Max Power": "16 kW",
-                    "Frequency": "60 Hz",
-                    "Simultaneous voltage": "No",
-                    "Voltage regulation": "Adjustable",
-                    "Max Intermittent amp-load 208V": "69 A",
-                    "Max Intermittent amp-load 480V": "30 A",
-                    "Motor start rating - 3 second 208V": "138 A",
-                    "Motor start rating - 3 second 480V": "60 A",
-                    "Three-phase Continuous": "20 kW",
-                    "Single-phase Continuous": "16 kW",
-                    "Max Continuous amp-load 208V": "56 A",
-                    "Max Continuous amp-load 480V": "24 A",
-                    "Parallelable": "No"
-                },
-                "45 kVA / 36 kW": {
-                    "Three-phase Max Power": "45 kVA / 36 kW", 
-                    "Single-phase Max Power": "29 kW",
-                    "Frequency": "60 Hz",
-                    "Simultaneous voltage": "No",
-                    "Voltage regulation": "Adjustable",
-                    "Max Intermittent amp-load 208V": "125 A",
-                    "Max Intermittent amp-load 480V": "54 A",
-                    "Motor start rating - 3 second 208V": "250 A",
-                    "Motor start rating - 3 second 480V": "108 A",
-                    "Three-phase Continuous": "36 kW",
-                    "Single-phase Continuous": "29 kW",
-                    "Max Continuous amp-load 208V": "100 A",
-                    "Max Continuous amp-load 480V": "43 A",
-                    "Parallelable": "No"
-                },
-                "65 kVA / 52 kW": {
-                    "Three-phase Max Power": "65 kVA / 52 kW",
-                    "Single-phase Max Power": "42 kW", 
-                    "Frequency": "60 Hz",
-                    "Simultaneous voltage": "No",
-                    "Voltage regulation": "Adjustable",
-                    "Max Intermittent amp-load 208V": "181 A",
-                    "Max Intermittent amp-load 480V": "78 A",
-                    "Motor start rating - 3 second 208V": "361 A",
-                    "Motor start rating - 3 second 480V": "156 A",
-                    "Three-phase Continuous": "52 kW",
-                    "Single-phase Continuous": "42 kW",
-                    "Max Continuous amp-load 208V": "144 A",
-                    "Max Continuous amp-load 480V": "62 A",
-                    "Parallelable": "No"
-                },
-                "125 kVA / 100 kW": {
-                    "Three-phase Max Power": "125 kVA / 100 kW",
-                    "Single-phase Max Power": "80 kW",
-                    "Frequency": "60 Hz",
-                    "Simultaneous voltage": "No", 
-                    "Voltage regulation": "Adjustable",
-                    "Max Intermittent amp-load 208V": "347 A",
-                    "Max Intermittent amp-load 480V": "150 A",
-                    "Motor start rating - 3 second 208V": "694 A",
-                    "Motor start rating - 3 second 480V": "300 A",
-                    "Three-phase Continuous": "100 kW",
-                    "Single-phase Continuous": "80 kW",
-                    "Max Continuous amp-load 208V": "278 A",
-                    "Max Continuous amp-load 480V": "120 A",
-                    "Parallelable": "No"
-                },
-                "220 kVA / 176 kW": {
-                    "Three-phase Max Power": "220 kVA / 176 kW",
-                    "Single-phase Max Power": "141 kW",
-                    "Frequency": "60 Hz",
-                    "Simultaneous voltage": "No",
-                    "Voltage regulation": "Adjustable",
-                    "Max Intermittent amp-load 208V": "611 A",
-                    "Max Intermittent amp-load 480V": "264 A", 
-                    "Motor start rating - 3 second 208V": "1222 A",
-                    "Motor start rating - 3 second 480V": "528 A",
-                    "Three-phase Continuous": "176 kW",
-                    "Single-phase Continuous": "141 kW",
-                    "Max Continuous amp-load 208V": "489 A",
-                    "Max Continuous amp-load 480V": "211 A",
-                    "Parallelable": "No"
-                },
-                "400 kVA / 320 kW": {
-                    "Three-phase Max Power": "400 kVA / 320 kW",
-                    "Single-phase Max Power": "256 kW",
-                    "Frequency": "60 Hz",
-                    "Simultaneous voltage": "No",
-                    "Voltage regulation": "Adjustable",
-                    "Max Intermittent amp-load 208V": "1111 A",
-                    "Max Intermittent amp-load 480V": "481 A",
-                    "Motor start rating - 3 second 208V": "2222 A",
-                    "Motor start rating - 3 second 480V": "962 A",
-                    "Three-phase Continuous": "320 kW", 
-                    "Single-phase Continuous": "256 kW",
-                    "Max Continuous amp-load 208V": "889 A",
-                    "Max Continuous amp-load 480V": "385 A",
-                    "Parallelable": "No"
-                }
-            }
+            # Get EBOSS® max continuous output kW from specifications (Max Continuous amp-load 480V)
+            eboss_max_continuous_kw = spec_table("EBOSS_SPEC_SHEET").get(
+                st.session_state.eboss_model, "Max Continuous amp-load 480V", unit="kW") or 0
             
-            # Get authentic specs for current models
-            eboss_authentic_specs = authentic_comparison_specs.get(st.session_state.eboss_model, {})
-            standard_authentic_specs = authentic_standard_specs.get(st.session_state.standard_generator, {})
+            # Get authentic specs for current models (Excel comparison sheets, compiled once per process)
+            eboss_authentic_specs = spec_table("EBOSS_COMPARISON_SPECS").sheets().get(st.session_state.eboss_model, {})
+            standard_authentic_specs = spec_table("STANDARD_COMPARISON_SPECS").sheets().get(
+                st.session_state.standard_generator, {})
+            spec_rows = {}   # comparison row label -> sheet label, for the Difference column
+
+            def _spec_row(row_label, sheet_label):
+                spec_rows[row_label] = sheet_label
+                return (row_label, eboss_authentic_specs.get(sheet_label, "N/A"),
+                        standard_authentic_specs.get(sheet_label, "N/A"))
             
             # Build comparison data with authentic values (except GPH and engine load %)
             comparison_data = [
@@ -2283,45 +1005,54 @@ elif st.session_state.get('show_comparison', False) and st.session_state.eboss_m
                 ("header", "Maximum Intermittent Power Output", ""),
                 
                 # Rows 5-13: Intermittent power specifications (authentic values for both EBOSS® and standard)
-                ("Three-phase", eboss_authentic_specs.get("Three-phase Max Power", "N/A"), standard_authentic_specs.get("Three-phase Max Power", "N/A")),
-                ("Single-phase", eboss_authentic_specs.get("Single-phase Max Power", "N/A"), standard_authentic_specs.get("Single-phase Max Power", "N/A")),
-                ("Frequency", eboss_authentic_specs.get("Frequency", "N/A"), standard_authentic_specs.get("Frequency", "N/A")),
-                ("Simultaneous voltage", eboss_authentic_specs.get("Simultaneous voltage", "N/A"), standard_authentic_specs.get("Simultaneous voltage", "N/A")),
-                ("Voltage regulation", eboss_authentic_specs.get("Voltage regulation", "N/A"), standard_authentic_specs.get("Voltage regulation", "N/A")),
-                ("Max. Intermittent amp-load 208V", eboss_authentic_specs.get("Max Intermittent amp-load 208V", "N/A"), standard_authentic_specs.get("Max Intermittent amp-load 208V", "N/A")),
-                ("Max. Intermittent amp-load 480V", eboss_authentic_specs.get("Max Intermittent amp-load 480V", "N/A"), standard_authentic_specs.get("Max Intermittent amp-load 480V", "N/A")),
-                ("Motor start rating - 3 second 208V", eboss_authentic_specs.get("Motor start rating - 3 second 208V", "N/A"), standard_authentic_specs.get("Motor start rating - 3 second 208V", "N/A")),
-                ("Motor start rating - 3 second 480V", eboss_authentic_specs.get("Motor start rating - 3 second 480V", "N/A"), standard_authentic_specs.get("Motor start rating - 3 second 480V", "N/A")),
+                _spec_row("Three-phase", "Three-phase Max Power"),
+                _spec_row("Single-phase", "Single-phase Max Power"),
+                _spec_row("Frequency", "Frequency"),
+                _spec_row("Simultaneous voltage", "Simultaneous voltage"),
+                _spec_row("Voltage regulation", "Voltage regulation"),
+                _spec_row("Max. Intermittent amp-load 208V", "Max Intermittent amp-load 208V"),
+                _spec_row("Max. Intermittent amp-load 480V", "Max Intermittent amp-load 480V"),
+                _spec_row("Motor start rating - 3 second 208V", "Motor start rating - 3 second 208V"),
+                _spec_row("Motor start rating - 3 second 480V", "Motor start rating - 3 second 480V"),
                 
                 # Row 14: Maximum Continuous Power Output header
                 ("header", "Maximum Continuous Power Output", ""),
                 
                 # Rows 15-19: Continuous power specifications (authentic values for both EBOSS® and standard)
-                ("Three-phase output", eboss_authentic_specs.get("Three-phase Continuous", "N/A"), standard_authentic_specs.get("Three-phase Continuous", "N/A")),
-                ("Single-phase output", eboss_authentic_specs.get("Single-phase Continuous", "N/A"), standard_authentic_specs.get("Single-phase Continuous", "N/A")),
-                ("Simultaneous voltage", eboss_authentic_specs.get("Simultaneous voltage", "N/A"), standard_authentic_specs.get("Simultaneous voltage", "N/A")),
-                ("Max. Continuous amp-load 208V", eboss_authentic_specs.get("Max Continuous amp-load 208V", "N/A"), standard_authentic_specs.get("Max Continuous amp-load 208V", "N/A")),
-                ("Max. Continuous amp-load 480V", eboss_authentic_specs.get("Max Continuous amp-load 480V", "N/A"), standard_authentic_specs.get("Max Continuous amp-load 480V", "N/A")),
+                _spec_row("Three-phase output", "Three-phase Continuous"),
+                _spec_row("Single-phase output", "Single-phase Continuous"),
+                _spec_row("Simultaneous voltage", "Simultaneous voltage"),
+                _spec_row("Max. Continuous amp-load 208V", "Max Continuous amp-load 208V"),
+                _spec_row("Max. Continuous amp-load 480V", "Max Continuous amp-load 480V"),
                 
                 # Row 21: Fuel Consumption header
                 ("header", "Fuel Consumption", ""),
                 
                 # Rows 22-28: Fuel consumption specifications (calculated GPH and engine load %)
                 ("% Engine Load", f"{eboss_engine_load:.1f}%" if eboss_engine_load > 0 else "N/A", f"{standard_engine_load_percent:.1f}%" if standard_engine_load_percent > 0 else "N/A"),
-                ("Gallons per Hour", f"{eboss_fuel_per_hour:.2f} GPH" if eboss_fuel_per_hour else "N/A", f"{standard_specs.get('fuel_consumption_gph', 0):.2f} GPH" if standard_specs.get('fuel_consumption_gph') else "N/A"),
-                ("Gallons per Day", f"{eboss_fuel_per_day:.1f} gallons" if eboss_fuel_per_day else "N/A", f"{standard_specs.get('fuel_per_day', 0):.1f} gallons" if standard_specs.get('fuel_per_day') else "N/A"),
-                ("Gallons per Month", f"{eboss_fuel_per_month:.1f} gallons" if eboss_fuel_per_month else "N/A", f"{standard_specs.get('fuel_per_month', 0):.1f} gallons" if standard_specs.get('fuel_per_month') else "N/A"),
-                ("Carbon Emissions per Day", f"{eboss_co2_per_day:.1f} lbs" if eboss_co2_per_day else "N/A", f"{standard_specs.get('co2_per_day', 0):.1f} lbs" if standard_specs.get('co2_per_day') else "N/A"),
-                ("Parallelable", eboss_authentic_specs.get("Parallelable", "N/A"), standard_authentic_specs.get("Parallelable", "N/A")),
+                ("Gallons per Hour", f"{eboss_fuel_per_hour:.2f} GPH" if eboss_fuel_per_hour else "N/A", f"{comparison.standard_fuel_gph:.2f} GPH" if comparison.standard_fuel_gph else "N/A"),
+                ("Gallons per Day", f"{eboss_fuel_per_day:.1f} gallons" if eboss_fuel_per_day else "N/A", f"{comparison.standard_fuel_per_day:.1f} gallons" if comparison.standard_fuel_per_day else "N/A"),
+                ("Gallons per Month", f"{eboss_fuel_per_month:.1f} gallons" if eboss_fuel_per_month else "N/A", f"{comparison.standard_fuel_per_month:.1f} gallons" if comparison.standard_fuel_per_month else "N/A"),
+                ("Carbon Emissions per Day", f"{eboss_co2_per_day:.1f} lbs" if eboss_co2_per_day else "N/A", f"{comparison.standard_co2_per_day:.1f} lbs" if comparison.standard_co2_per_day else "N/A"),
+                _spec_row("Parallelable", "Parallelable"),
             ]
             
-            # Calculate mathematical differences for each row
+            # Differences: calculated rows come straight from the matrix, spec rows from the compiled value arrays
+            computed_differences = spec_differences(
+                st.session_state.eboss_model, st.session_state.standard_generator, spec_rows)
+            computed_differences.update({
+                "% Engine Load": f"{comparison.diff_engine_load_percent:+.1f}%",
+                "Gallons per Hour": f"{comparison.diff_fuel_gph:+.2f} GPH",
+                "Gallons per Day": f"{comparison.diff_fuel_per_day:+.1f} gallons",
+                "Gallons per Month": f"{comparison.diff_fuel_per_month:+.1f} gallons",
+                "Carbon Emissions per Day": f"{comparison.diff_co2_per_day:+.1f} lbs",
+            })
             comparison_rows = []
             for spec_name, eboss_value, standard_value in comparison_data:
                 if spec_name == "header":
                     comparison_rows.append((spec_name, eboss_value, standard_value, ""))
                 else:
-                    difference = calculate_mathematical_difference(eboss_value, standard_value, spec_name)
+                    difference = computed_differences.get(spec_name, "N/A")
                     comparison_rows.append((spec_name, eboss_value, standard_value, difference))
         
             # Display comparison table with proper header rendering
@@ -2394,19 +1125,4 @@ elif st.session_state.get('show_comparison', False) and st.session_state.eboss_m
     st.markdown('</div>', unsafe_allow_html=True)
     
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+finish_run()
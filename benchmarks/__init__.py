@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# Run with `python -m benchmarks` (see benchmarks/__main__.py).
@@ -0,0 +1,64 @@
+# benchmarks/__main__.py
+from __future__ import annotations
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks import cases  # noqa: F401  (registers the cases)
+from benchmarks.runner import (BASELINE_PATH, CASES, DEFAULT_THRESHOLD, compare, format_table,
+                               load_baseline, run, save_baseline)
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(prog="python -m benchmarks",
+                                description="Throughput and peak-memory benchmarks for the sizing, cost and interpolation code.")
+    p.add_argument("patterns", nargs="*", help="glob(s) over case names, e.g. 'interp/*' (default: all)")
+    p.add_argument("--list", action="store_true", help="list case names and exit")
+    p.add_argument("--baseline", type=Path, default=BASELINE_PATH, help=f"baseline JSON (default: {BASELINE_PATH.name})")
+    p.add_argument("--save", action="store_true", help="write these results into the baseline")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                   help="allowed ops/sec drop vs baseline before failing (default: %(default).2f)")
+    p.add_argument("--min-time", type=float, default=0.2, help="seconds per timing round (default: %(default)s)")
+    p.add_argument("--rounds", type=int, default=5, help="timing rounds; the best is kept (default: %(default)s)")
+    p.add_argument("--json", type=Path, help="also write the raw results to this file")
+    p.add_argument("--strict", action="store_true",
+                   help="CI mode: also fail when the baseline is missing or lacks a case that ran")
+    args = p.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+
+    results = run(args.patterns or None, min_time_s=args.min_time, rounds=args.rounds)
+    if not results:
+        print("No cases match.", file=sys.stderr)
+        return 2
+
+    baseline = load_baseline(args.baseline)
+    rows = compare(results, baseline, args.threshold)
+    print(format_table(rows))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if args.save:
+        print(f"\nBaseline written to {save_baseline(results, args.baseline)}")
+        return 0
+
+    status = 0
+    unchecked = [r["case"] for r in rows if r["baseline_ops_per_sec"] is None]
+    if baseline is None:
+        print(f"\nWARNING: no baseline at {args.baseline}; nothing was checked for regressions "
+              "(run with --save to record one).", file=sys.stderr)
+        status = 1 if args.strict else 0
+    elif unchecked:
+        print(f"\nWARNING: {len(unchecked)} case(s) not in the baseline, not checked: " + ", ".join(unchecked),
+              file=sys.stderr)
+        status = 1 if args.strict else 0
+    regressed = [r["case"] for r in rows if r["regressed"]]
+    if regressed:
+        print(f"\n{len(regressed)} case(s) slower than baseline by more than {args.threshold:.0%}: "
+              + ", ".join(regressed), file=sys.stderr)
+        status = 1
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+# benchmarks/cases.py
+from __future__ import annotations
+
+import numpy as np
+
+from benchmarks.runner import case
+
+# Realistic inputs: the five EBOSS models at loads between 10% and 100% of their
+# continuous rating, swept over 10k points, plus a mixed fleet inventory for the
+# paralleling search. Random inputs use a fixed seed so runs are comparable.
+# Batch cases (and the service batch path) check against the scalar path before
+# they are timed.
+
+SWEEP_N = 10_000
+_RNG_SEED = 20240601
+
+def _sweep():
+    from utils.data import SPECS
+    rng = np.random.default_rng(_RNG_SEED)
+    kvas = np.array(sorted(SPECS), dtype=np.float64)
+    gen_kva = rng.choice(kvas, SWEEP_N)
+    load = rng.uniform(0.1, 1.0, SWEEP_N)
+    return gen_kva, load
+
+def _jobs():
+    from utils.data import SPECS
+    rng = np.random.default_rng(_RNG_SEED)
+    max_cont = {rec["eboss_model"]: rec["max_cont_kw"] for rec in SPECS.values()}
+    model = rng.choice(list(max_cont), SWEEP_N)
+    cont = np.array([max_cont[m] for m in model]) * rng.uniform(0.1, 1.0, SWEEP_N)
+    # every tenth job spells its model as an alias ("EBOSS 125 kVA", "eb125kva")
+    alias = np.array([m.replace("EB", "EBOSS ") if i % 20 else m.replace(" ", "").lower()
+                      for i, m in enumerate(model)], dtype=object)
+    model = np.where(np.arange(SWEEP_N) % 10 == 0, alias, model)
+    etype = rng.choice(["Full Hybrid", "Power Module"], SWEEP_N)
+    pm_gen = np.where(etype == "Power Module", rng.choice(sorted(SPECS), SWEEP_N), 0)
+    return {"model": model, "type": etype, "cont_kw": cont, "pm_gen": pm_gen}
+
+# ── Interpolation ────────────────────────────────────────────────────────────
+@case("fuel_gph_at_load", "interp")
+def _fuel_gph_single():
+    from utils.sizing import fuel_gph_at_load
+    return (lambda: fuel_gph_at_load(65, 0.62)), 1
+
+@case("fuel_gph_at_load x10k loop", "interp")
+def _fuel_gph_loop():
+    from utils.sizing import fuel_gph_at_load
+    kva, load = _sweep()
+    pairs = list(zip(kva.astype(int).tolist(), load.tolist()))
+    return (lambda: [fuel_gph_at_load(k, x) for k, x in pairs]), SWEEP_N
+
+@case("fuel_gph_at_load_many x10k", "interp")
+def _fuel_gph_many():
+    from utils.sizing import fuel_gph_at_load_many
+    kva, load = _sweep()
+    return (lambda: fuel_gph_at_load_many(kva, load)), SWEEP_N
+
+@case("calculations.interpolate_gph", "interp")
+def _interpolate_gph_single():
+    from calculations import interpolate_gph
+    return (lambda: interpolate_gph(65, 62)), 1
+
+@case("calculations.interpolate_gph x10k loop", "interp")
+def _interpolate_gph_loop():
+    from calculations import interpolate_gph
+    kva, load = _sweep()
+    pairs = list(zip(kva.astype(int).tolist(), (load * 100).tolist()))
+    return (lambda: [interpolate_gph(k, x) for k, x in pairs]), SWEEP_N
+
+@case("app.py interpolate_gph x10k (float kVA)", "interp")
+def _interpolate_gph_app():
+    # app.py's fuel panel passes generator_kw / 0.8 (a float kVA) and a float
+    # engine-load percent, and skips the call at 0% load.
+    from calculations import interpolate_gph
+    kva, load = _sweep()
+    pairs = list(zip(kva.tolist(), (load * 100).tolist()))
+    return (lambda: [interpolate_gph(k, x) if x > 0 else 0 for k, x in pairs]), SWEEP_N
+
+# ── Sizing ───────────────────────────────────────────────────────────────────
+@case("gph_for", "sizing")
+def _gph_for():
+    from utils.sizing import gph_for
+    return (lambda: gph_for(model="EB125 kVA", type="Full Hybrid", cont_kw=40.0)), 1
+
+@case("gph_for_many x10k", "sizing")
+def _gph_for_many():
+    from utils.sizing import gph_for, gph_for_many
+    jobs = _jobs()
+    batch = gph_for_many(jobs)
+    for i in range(0, SWEEP_N, 7):   # includes alias rows (every tenth)
+        scalar = gph_for(model=jobs["model"][i], type=jobs["type"][i], cont_kw=float(jobs["cont_kw"][i]),
+                         pm_gen=int(jobs["pm_gen"][i]))
+        row = batch.iloc[i]
+        if not (np.isclose(row.gph, scalar[0]) and np.isclose(row.engine_load_percent, scalar[1])
+                and row.gen_kva_used == scalar[2]):
+            raise AssertionError(f"gph_for_many row {i} ({jobs['model'][i]!r}) {tuple(row)} != gph_for {scalar}")
+    return (lambda: gph_for_many(jobs)), SWEEP_N
+
+@case("compute_and_store_derived", "sizing")
+def _derived():
+    import logging
+    import streamlit as st
+    # Outside `streamlit run` every session_state access logs a bare-mode warning.
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit."):
+            logging.getLogger(name).setLevel(logging.ERROR)
+    from utils.derived import compute_and_store_derived
+    from utils.keys import CANON as K
+    st.session_state[K["model"]] = "EB125 kVA"
+    st.session_state[K["type"]] = "Full Hybrid"
+    st.session_state[K["actual_cont_kw"]] = 40.0
+    st.session_state[K["current_spec"]] = {"gen_kva_used": 65}
+    st.session_state[K["std_gen_kw"]] = 100.0
+    st.session_state[K["std_gen_kva"]] = 125
+    return compute_and_store_derived, 1
+
+# ── Cost ─────────────────────────────────────────────────────────────────────
+@case("monthly_costs", "cost")
+def _monthly_costs():
+    from utils.cost import monthly_costs
+    return (lambda: monthly_costs(9.5, 3.1, 3.85, 4200.0, 350.0, 180.0, 30)), 1
+
+@case("monthly_costs x10k loop", "cost")
+def _monthly_costs_loop():
+    from utils.cost import monthly_costs
+    rng = np.random.default_rng(_RNG_SEED)
+    rows = list(zip(rng.uniform(2, 24, SWEEP_N).tolist(), rng.uniform(0.5, 12, SWEEP_N).tolist()))
+    return (lambda: [monthly_costs(h, g, 3.85, 4200.0, 350.0, 180.0, 30) for h, g in rows]), SWEEP_N
+
+@case("monthly_costs_many x10k", "cost")
+def _monthly_costs_many():
+    from utils.cost import monthly_costs_many
+    rng = np.random.default_rng(_RNG_SEED)
+    hours, gph = rng.uniform(2, 24, SWEEP_N), rng.uniform(0.5, 12, SWEEP_N)
+    return (lambda: monthly_costs_many(hours, gph, 3.85, 4200.0, 350.0, 180.0, 30)), SWEEP_N
+
+@case("cost_sweep 50 sites x 5.7k scenarios", "cost")
+def _cost_sweep():
+    from utils.cost import cost_sweep, span
+    rng = np.random.default_rng(_RNG_SEED)
+    sites = {f"site {i}": g for i, g in enumerate(rng.uniform(0.5, 12, 50).tolist())}
+    ranges = dict(fuel_price=span(3.0, 5.0, 9), rental=span(3000, 6000, 7), delivery=[300.0, 500.0],
+                  pm_cost=span(100, 300, 5), daily_runtime_hr=span(8, 24, 9))
+    return (lambda: cost_sweep(fuel_gph=sites, **ranges)), 50 * 9 * 7 * 2 * 5 * 9
+
+# ── Paralleling ──────────────────────────────────────────────────────────────
+_FLEET_INVENTORY = {"EB25 kVA": 9, "EB70 kVA": 9, "EB125 kVA": 7, "EB220 kVA": 7, "EB400 kVA": 3}
+
+@case("_blocks split + prune (fleet-wide)", "paralleling")
+def _fleet_blocks():
+    from utils.paralleling import _blocks, _unit_table
+    models = list(_FLEET_INVENTORY)
+    bounds = list(_FLEET_INVENTORY.values())
+    units = _unit_table(models, "Full Hybrid", None)
+    return (lambda: _blocks(bounds, units, 600.0, 1400.0)), 1
+
+@case("_score_block (one block, cost objective)", "paralleling")
+def _fleet_score_block():
+    from utils.paralleling import _blocks, _score_block, _unit_table
+    models = list(_FLEET_INVENTORY)
+    units = _unit_table(models, "Full Hybrid", None)
+    prefixes, rest = _blocks(list(_FLEET_INVENTORY.values()), units, 600.0, 1400.0)
+    rates = np.array([95.0, 140.0, 210.0, 320.0, 520.0])
+    job = (prefixes[len(prefixes) // 2], rest, units, 600.0, 1400.0, 3.85, rates, "cost", 3)
+    return (lambda: _score_block(job)), int(np.prod([b + 1 for b in rest]))
+
+@case("optimize_fleet small (1k mixes)", "paralleling")
+def _fleet_small():
+    from utils.paralleling import optimize_fleet
+    inventory = {"EB25 kVA": 3, "EB70 kVA": 3, "EB125 kVA": 3, "EB220 kVA": 3, "EB400 kVA": 3}
+    return (lambda: optimize_fleet(180.0, 400.0, inventory, max_workers=1)), 4 ** 5
+
+@case("optimize_fleet fleet-wide (25.6k mixes)", "paralleling")
+def _fleet_wide():
+    from utils.paralleling import optimize_fleet
+    inventory = _FLEET_INVENTORY
+    rates = {"EB25 kVA": 95.0, "EB70 kVA": 140.0, "EB125 kVA": 210.0, "EB220 kVA": 320.0, "EB400 kVA": 520.0}
+    return (lambda: optimize_fleet(600.0, 1400.0, inventory, objective="cost", fuel_price=3.85,
+                                   daily_rates=rates, max_workers=1)), 10 * 10 * 8 * 8 * 4
+
+# ── Service ──────────────────────────────────────────────────────────────────
+@case("gph batch x64 (/v1/gph)", "service")
+def _service_gph_batch():
+    from service.app import GPH_BATCH_VECTORIZE_AT, _gph_batch
+    from utils.sizing import gph_for
+    n = max(64, GPH_BATCH_VECTORIZE_AT)   # large enough to take the vectorized path
+    cols = _jobs()
+    jobs = [{"model": str(cols["model"][i]), "type": str(cols["type"][i]), "cont_kw": float(cols["cont_kw"][i]),
+             "gen_kw": None, "size_kva": None, "pm_gen": int(cols["pm_gen"][i]) or None} for i in range(n)]
+    batch = _gph_batch(jobs)
+    for job, row in zip(jobs, batch):   # rows 0, 10, 20, ... spell the model as an alias
+        scalar = gph_for(**job)
+        if not (np.isclose(row["gph"], scalar[0]) and np.isclose(row["engine_load_percent"], scalar[1])
+                and row["gen_kva_used"] == scalar[2]):
+            raise AssertionError(f"/v1/gph batch row {job['model']!r} {row} != gph_for {scalar}")
+    return (lambda: _gph_batch(jobs)), n
@@ -0,0 +1,116 @@
+# benchmarks/runner.py
+from __future__ import annotations
+import fnmatch
+import gc
+import json
+import platform
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Minimal benchmark harness on timeit + tracemalloc.
+#
+# A case is a setup function returning (fn, ops): `fn` is the zero-argument call
+# being timed and `ops` how many logical operations one call performs (1 for a
+# single lookup, 10_000 for a sweep), so results compare as ops/sec across
+# single-call and batch APIs. Setup runs once, outside the timed region.
+#
+# benchmarks/baseline.json is committed with the numbers (and environment) it
+# was recorded on; re-record it with --save when the reference machine changes.
+# --strict (CI) fails when the baseline is missing or lacks a case that ran.
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.20     # fail when ops/sec drops by more than 20%
+DEFAULT_MIN_TIME_S = 0.2     # per timing round
+DEFAULT_ROUNDS = 5
+
+Case = Callable[[], Tuple[Callable[[], Any], int]]
+CASES: Dict[str, Tuple[str, Case]] = {}
+
+def case(name: str, group: str) -> Callable[[Case], Case]:
+    """Register a benchmark setup function under `group/name`."""
+    def deco(setup: Case) -> Case:
+        CASES[f"{group}/{name}"] = (group, setup)
+        return setup
+    return deco
+
+def _peak_alloc(fn: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_case(name: str, *, min_time_s: float = DEFAULT_MIN_TIME_S, rounds: int = DEFAULT_ROUNDS) -> Dict[str, Any]:
+    group, setup = CASES[name]
+    fn, ops = setup()
+    fn()  # warm caches / lazy imports outside the timed region
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * min_time_s / max(elapsed, 1e-9)))
+    per_call = min(timer.repeat(repeat=rounds, number=number)) / number
+    return {
+        "group": group,
+        "ops": ops,
+        "calls_per_round": number,
+        "sec_per_call": per_call,
+        "ops_per_sec": ops / per_call if per_call > 0 else float("inf"),
+        "peak_alloc_bytes": _peak_alloc(fn),
+    }
+
+def run(patterns: Optional[List[str]] = None, **kwargs) -> Dict[str, Dict[str, Any]]:
+    names = [n for n in CASES if not patterns or any(fnmatch.fnmatch(n, p) for p in patterns)]
+    return {name: run_case(name, **kwargs) for name in names}
+
+# ── Baseline ─────────────────────────────────────────────────────────────────
+def environment() -> Dict[str, str]:
+    import numpy
+    return {"python": platform.python_version(), "numpy": numpy.__version__,
+            "machine": platform.machine(), "platform": platform.platform(terse=True)}
+
+def save_baseline(results: Dict[str, Dict[str, Any]], path: Path = BASELINE_PATH) -> Path:
+    """Merge `results` into the baseline file (cases not run this time are kept)."""
+    path = Path(path)
+    data = load_baseline(path) or {}
+    data.setdefault("results", {}).update(results)
+    data["environment"] = environment()
+    data["saved_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Any]],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """One row per case: ops/sec now vs baseline, and whether it regressed past `threshold`."""
+    base = (baseline or {}).get("results", {})
+    rows = []
+    for name, res in results.items():
+        prev = base.get(name)
+        change = (res["ops_per_sec"] / prev["ops_per_sec"] - 1.0) if prev and prev.get("ops_per_sec") else None
+        rows.append({"case": name, "ops_per_sec": res["ops_per_sec"], "peak_alloc_bytes": res["peak_alloc_bytes"],
+                     "baseline_ops_per_sec": prev["ops_per_sec"] if prev else None, "change": change,
+                     "regressed": change is not None and change < -threshold})
+    return rows
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    def rate(v: Optional[float]) -> str:
+        return "-" if v is None else f"{v:,.0f}"
+    lines = [f"{'case':<50} {'ops/sec':>14} {'baseline':>14} {'change':>8} {'peak mem':>10}"]
+    for r in rows:
+        change = "-" if r["change"] is None else f"{r['change'] * 100:+.1f}%"
+        flag = "  REGRESSED" if r["regressed"] else ""
+        lines.append(f"{r['case']:<50} {rate(r['ops_per_sec']):>14} {rate(r['baseline_ops_per_sec']):>14} "
+                     f"{change:>8} {r['peak_alloc_bytes'] / 1024:>8.1f}kB{flag}")
+    return "\n".join(lines)
+
+__all__ = ["BASELINE_PATH", "CASES", "DEFAULT_THRESHOLD", "case", "compare", "format_table",
+           "load_baseline", "run", "run_case", "save_baseline"]
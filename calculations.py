@@ -1,45 +1,252 @@
 # calculations.py
 
-from config import EBOSS_LOAD_REFERENCE
+from utils.cache import memoize
+from utils.data import EBOSS_LOAD_REFERENCE, STANDARD_GENERATOR_DATA
+from utils.results import LoadSpecs, StandardGeneratorSpecs
 
 def interpolate_gph(generator_kva, load_percent):
+    """
+    Interpolate GPH fuel consumption based on generator kVA and load percentage
+    Uses authentic EBOSS GPH interpolation data from working_Accurate_Fuel_Calc_1752711064907.xlsx
+    """
+    # Convert load percent to decimal if needed
     if load_percent > 1:
         load_percent = load_percent / 100
-
-    gph_map = EBOSS_LOAD_REFERENCE["gph_interpolation"]
-    if generator_kva not in gph_map:
-        closest = min(gph_map.keys(), key=lambda x: abs(x - generator_kva))
-        gph_data = gph_map[closest]
+    
+    # Get GPH interpolation data
+    gph_data_map = EBOSS_LOAD_REFERENCE["gph_interpolation"]
+    
+    # Find the correct generator size data or closest match
+    if generator_kva not in gph_data_map:
+        # Find closest generator size
+        available_sizes = list(gph_data_map.keys())
+        closest_size = min(available_sizes, key=lambda x: abs(x - generator_kva))
+        gph_data = gph_data_map[closest_size]
     else:
-        gph_data = gph_map[generator_kva]
-
-    points = [0.25, 0.50, 0.75, 1.00]
-    values = [gph_data["25%"], gph_data["50%"], gph_data["75%"], gph_data["100%"]]
+        gph_data = gph_data_map[generator_kva]
+    
+    # Define load percentage breakpoints and corresponding GPH values
+    load_points = [0.25, 0.50, 0.75, 1.00]
+    gph_values = [gph_data["25%"], gph_data["50%"], gph_data["75%"], gph_data["100%"]]
+    
+    # Clamp load_percent to valid range
     load_percent = max(0.25, min(1.00, load_percent))
-
-    for i in range(len(points) - 1):
-        if points[i] <= load_percent <= points[i + 1]:
-            x1, x2 = points[i], points[i + 1]
-            y1, y2 = values[i], values[i + 1]
-            return round(y1 + (load_percent - x1) * (y2 - y1) / (x2 - x1), 4)
-    return values[0]
+    
+    # Handle edge cases
+    if load_percent <= 0.25:
+        return gph_values[0]
+    elif load_percent >= 1.00:
+        return gph_values[3]
+    
+    # Find the two points to interpolate between
+    for i in range(len(load_points) - 1):
+        if load_points[i] <= load_percent <= load_points[i + 1]:
+            # Linear interpolation formula: y = y1 + (x - x1) * (y2 - y1) / (x2 - x1)
+            x1, x2 = load_points[i], load_points[i + 1]
+            y1, y2 = gph_values[i], gph_values[i + 1]
+            
+            interpolated_gph = y1 + (load_percent - x1) * (y2 - y1) / (x2 - x1)
+            return round(interpolated_gph, 4)
+    
+    return 0
 
 def calculate_charge_rate(eboss_model, eboss_type, generator_kva=None, custom_rate=None):
+    """Calculate charge rate using authentic formulas"""
     if custom_rate:
         return custom_rate
-
+        
+    # Get generator kW capacity
     generator_kw = 0
     if eboss_type == "Full Hybrid":
-        kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(eboss_model, 0)
-        generator_kw = kva * 0.8
-        return round(generator_kw * 0.98, 1)
-    
+        # Use paired generator for hybrid
+        hybrid_kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(eboss_model, 0)
+        generator_kw = hybrid_kva * 0.8  # kW = kVA * 0.8
     elif eboss_type == "Power Module" and generator_kva:
+        # Use selected generator for power module
         try:
-            kva = float(generator_kva.replace("kVA", ""))
-            generator_kw = kva * 0.8
-            return round(generator_kw * 0.90 * 0.98, 1)
+            gen_kva = float(generator_kva.replace("kVA", ""))
         except ValueError:
             return 0.0
+        generator_kw = gen_kva * 0.8  # kW = kVA * 0.8
+    
+    # Calculate charge rate based on formulas
+    if eboss_type == "Full Hybrid":
+        # Full Hybrid: 98% of generator kW
+        charge_rate = generator_kw * 0.98
+    elif eboss_type == "Power Module":
+        # Power Module: 98% of (90% of generator kW)
+        charge_rate = generator_kw * 0.90 * 0.98
+    else:
+        charge_rate = 0
+        
+    return round(charge_rate, 1)
 
-    return 0.0
+def get_max_charge_rate(eboss_model, eboss_type, generator_kva=None):
+    """Get maximum allowed charge rate using model-specific limits, with 98% generator kW as fallback"""
+    
+    # EBOSS model specific maximum charge rates from the table
+    model_max_charge_rates = {
+        "EB25 kVA": 20,
+        "EB70 kVA": 45,
+        "EB125 kVA": 65,
+        "EB220 kVA": 125,
+        "EB400 kVA": 220
+    }
+    
+    # Get model-specific max charge rate
+    model_max = model_max_charge_rates.get(eboss_model, 0)
+    
+    # Calculate 98% of generator kW as secondary limit
+    generator_kw = 0
+    if eboss_type == "Full Hybrid":
+        hybrid_kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(eboss_model, 0)
+        generator_kw = hybrid_kva * 0.8
+    elif eboss_type == "Power Module" and generator_kva:
+        gen_kva = float(generator_kva.replace("kVA", ""))
+        generator_kw = gen_kva * 0.8
+    
+    generator_98_percent = generator_kw * 0.98
+    
+    # Use the lower of the two limits (model max or 98% generator kW)
+    if model_max > 0 and generator_98_percent > 0:
+        max_charge_rate = min(model_max, generator_98_percent)
+    elif model_max > 0:
+        max_charge_rate = model_max
+    elif generator_98_percent > 0:
+        max_charge_rate = generator_98_percent
+    else:
+        max_charge_rate = 0
+    
+    return round(max_charge_rate, 1)
+
+@memoize
+def calculate_standard_generator_specs(standard_generator_size, continuous_load, max_peak_load):
+    """Calculate specifications for standard diesel generator comparison using authentic interpolation"""
+    if not standard_generator_size or standard_generator_size not in STANDARD_GENERATOR_DATA:
+        return None  # memoized results are shared: never hand out a mutable {}
+    
+    gen_data = STANDARD_GENERATOR_DATA[standard_generator_size]
+    gen_kw = gen_data["kw"]
+    
+    # Calculate engine load percentage based on continuous load (since it runs 24/7)
+    engine_load_percent = (continuous_load / gen_kw * 100) if gen_kw > 0 else 0
+    load_percentage = continuous_load / gen_kw if gen_kw > 0 else 0
+    
+    # Use same interpolation method as EBOSS for consistency
+    fuel_gph_data = gen_data["fuel_consumption_gph"]
+    if load_percentage <= 0.5:
+        fuel_per_hour = fuel_gph_data["50%"]
+    elif load_percentage <= 0.75:
+        fuel_per_hour = fuel_gph_data["75%"]
+    else:
+        fuel_per_hour = fuel_gph_data["100%"]
+    
+    # Calculate daily, weekly, monthly consumption (runs 24/7)
+    fuel_per_day = fuel_per_hour * 24
+    fuel_per_week = fuel_per_day * 7
+    fuel_per_month = fuel_per_day * 30
+    
+    # Calculate CO2 emissions (22.4 lbs CO2 per gallon of diesel)
+    co2_per_day = fuel_per_day * gen_data["co2_per_gal"]
+    
+    # Runtime is continuous (24 hours) since no battery backup
+    runtime_per_day = 24.0
+    
+    # Tank runtime calculation
+    tank_runtime = gen_data["fuel_tank_gal"] / fuel_per_hour if fuel_per_hour > 0 else 0
+    
+    return StandardGeneratorSpecs(
+        generator_type="Standard Diesel Generator",
+        generator_size=standard_generator_size,
+        engine_load_percent=engine_load_percent,
+        continuous_load_percent=load_percentage * 100,
+        fuel_consumption_gph=fuel_per_hour,
+        fuel_per_hour=fuel_per_hour,
+        fuel_per_day=fuel_per_day,
+        fuel_per_week=fuel_per_week,
+        fuel_per_month=fuel_per_month,
+        co2_per_day=co2_per_day,
+        runtime_per_day=runtime_per_day,
+        tank_runtime_hours=tank_runtime,
+        noise_level=gen_data["noise_level_db"],
+        dimensions=gen_data["dimensions"],
+        weight_lbs=gen_data["weight_lbs"],
+        fuel_tank_capacity=gen_data["fuel_tank_gal"],
+    )
+
+@memoize
+def calculate_load_specs(eboss_model, eboss_type, continuous_load, max_peak_load, generator_kva=None, custom_charge_rate=None):
+    """Calculate load-based specifications using authentic EBOSS® reference data"""
+    
+    # Get EBOSS® model capacity based on generator size and max continuous load
+    generator_kw_mapping = {
+        "EB25 kVA": 14.5,   # Gen Size 25 kVA
+        "EB70 kVA": 24.5,   # Gen Size 45 kVA  
+        "EB125 kVA": 49,    # Gen Size 65 kVA
+        "EB220 kVA": 74,    # Gen Size 125 kVA
+        "EB400 kVA": 125    # Gen Size 220 kVA
+    }
+    model_capacity = generator_kw_mapping.get(eboss_model, 0)
+    
+    # Find matching generator data
+    generator_data = None
+    if generator_kva:
+        gen_size = int(generator_kva.replace("kVA", ""))
+        generator_data = EBOSS_LOAD_REFERENCE["generator_sizes"].get(gen_size)
+    
+    # Calculate utilization
+    peak_utilization = (max_peak_load / model_capacity * 100) if model_capacity > 0 else 0
+    continuous_utilization = (continuous_load / model_capacity * 100) if model_capacity > 0 else 0
+    
+    # Calculate charge rate using new formula
+    charge_rate = calculate_charge_rate(eboss_model, eboss_type, generator_kva, custom_charge_rate)
+    
+    # Calculate fuel consumption and engine load based on EBOSS® model's paired generator
+    fuel_consumption = None
+    engine_load_percent = 0
+    
+    # Get the appropriate generator size for this EBOSS® model
+    paired_generator_kva = EBOSS_LOAD_REFERENCE["generator_kva_hybrid"].get(eboss_model, 0)
+    if paired_generator_kva > 0:
+        # Get paired generator data
+        paired_gen_data = EBOSS_LOAD_REFERENCE["generator_sizes"].get(paired_generator_kva)
+        if paired_gen_data:
+            gen_kw = paired_gen_data["gen_kw"]
+            charge_rate_kw = charge_rate  # charge rate is already in kW
+            engine_load_percent = (charge_rate_kw / gen_kw * 100) if gen_kw > 0 else 0
+            
+            # Use charge rate for GPH interpolation
+            load_percentage = charge_rate_kw / gen_kw if gen_kw > 0 else 0
+            
+            # Interpolate GPH based on paired generator size and load percentage
+            gph_data = EBOSS_LOAD_REFERENCE["gph_interpolation"].get(paired_generator_kva, {})
+            
+            if load_percentage <= 0.25:
+                fuel_consumption = gph_data.get("25%", 0)
+            elif load_percentage <= 0.5:
+                fuel_consumption = gph_data.get("50%", 0)
+            elif load_percentage <= 0.75:
+                fuel_consumption = gph_data.get("75%", 0)
+            else:
+                fuel_consumption = gph_data.get("100%", 0)
+    
+    # Calculate battery specs - always use model-specific capacity
+    battery_capacity = EBOSS_LOAD_REFERENCE["battery_capacities"].get(eboss_model, 0)
+    charge_time = (battery_capacity / charge_rate) if charge_rate > 0 else 0
+    
+    # Calculate environmental impact
+    co2_per_day = fuel_consumption * 24 * 19.6 if fuel_consumption else 0  # 19.6 lbs CO2 per gallon
+    
+    return LoadSpecs(
+        model_capacity=model_capacity,
+        peak_utilization=peak_utilization,
+        continuous_utilization=continuous_utilization,
+        charge_rate=charge_rate,
+        battery_capacity=battery_capacity,
+        charge_time=charge_time,
+        fuel_consumption_gph=fuel_consumption,
+        fuel_per_day=fuel_consumption * 24 if fuel_consumption else 0,
+        co2_per_day=co2_per_day,
+        engine_load_percent=engine_load_percent,
+        generator_data=generator_data,
+    )
@@ -0,0 +1,152 @@
+# components/table.py
+from __future__ import annotations
+from dataclasses import dataclass
+from html import escape
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import streamlit as st
+
+from utils.style import ensure_stylesheet
+
+# Class-based HTML tables for the cost breakdowns.
+#
+# The cost tables used to be one f-string per rerun with the same inline
+# `style="..."` repeated on every cell (tens of KB for a 9x5 table). Here the
+# look lives once in TABLE_CSS (linked once per session, utils.style) and cells
+# only carry a short class, so the markup sent per rerun is a small fraction
+# of that.
+#
+# A TableRenderer is built once per (key, columns) and kept in session state:
+# the header and the per-cell opening tags are compiled when it is created, and
+# every cell's formatted HTML is cached against the value it was formatted from.
+# On a rerun only cells whose value (or format) changed are formatted and
+# escaped again, unchanged rows reuse their <tr> string, and a table with no
+# changes returns the previous markup as is.
+
+TABLE_CSS = """
+.eb-table-wrap{background:var(--alpine-white,#fff);padding:1rem;margin:1rem 0;border-radius:8px;
+  border:2px solid var(--charcoal,#636569);box-shadow:0 8px 16px rgba(0,0,0,.3);overflow-x:auto}
+.eb-table{width:100%;border-collapse:collapse;font:.9rem Arial,sans-serif;color:var(--black-asphalt,#000)}
+.eb-table th,.eb-table td{padding:.5rem;border:1px solid var(--charcoal,#636569)}
+.eb-table th{background:var(--energy-green,#80BD47);color:var(--alpine-white,#fff);text-align:center;
+  font-weight:bold;text-shadow:1px 1px 2px rgba(0,0,0,.7)}
+.eb-table .label{text-align:left;font-weight:bold}
+.eb-table .num{text-align:right}
+.eb-table tbody tr:nth-child(even){background:#f9f9f9}
+.eb-table tr.total td{background:var(--energy-green,#80BD47);color:var(--alpine-white,#fff);font-weight:bold;
+  padding:.75rem;text-shadow:2px 2px 4px rgba(0,0,0,.7)}
+.eb-banner{background:var(--energy-green,#80BD47);color:#fff;padding:1rem;margin:1rem 0;border-radius:8px;
+  text-align:center;font-weight:bold;border:2px solid var(--charcoal,#636569);box-shadow:0 6px 12px rgba(0,0,0,.4);
+  text-shadow:2px 2px 4px rgba(0,0,0,.7)}
+.eb-banner.loss{background:#FF6B6B}
+.eb-banner h4{margin:0;color:#fff}
+.eb-banner p{margin:.5rem 0;font-size:1.1rem}
+"""
+
+_STATE_KEY = "_tables"
+
+@dataclass(frozen=True, slots=True)
+class Row:
+    """One body row: a label cell, then `values` formatted with `fmt` (strings are shown as is)."""
+    label: str
+    values: Tuple[Any, ...]
+    fmt: str = "{}"
+    cls: str = ""
+
+class TableRenderer:
+    __slots__ = ("key", "columns", "groups", "_head", "_td", "_cells", "_rows", "_html", "_order",
+                 "cells_rendered", "cells_reused")
+
+    def __init__(self, key: str, columns: Sequence[str], groups: Sequence[Tuple[str, int]] = ()):
+        self.key = key
+        self.columns = tuple(columns)
+        self.groups = tuple(groups)
+        head = []
+        if self.groups:
+            head.append("<tr>" + "".join(
+                f"<th colspan='{span}'>{escape(text)}</th>" if span > 1 else f"<th class='label'>{escape(text)}</th>"
+                for text, span in self.groups) + "</tr>")
+        head.append("<tr>" + "".join(
+            f"<th class='label'>{escape(c)}</th>" if i == 0 else f"<th>{escape(c)}</th>"
+            for i, c in enumerate(self.columns)) + "</tr>")
+        self._head = f"<div class='eb-table-wrap'><table class='eb-table'><thead>{''.join(head)}</thead><tbody>"
+        self._td = ("<td class='label'>",) + ("<td class='num'>",) * (len(self.columns) - 1)
+        self._cells: Dict[Tuple[str, int], Tuple[Any, str, str]] = {}   # (row, col) -> (value, fmt, html)
+        self._rows: Dict[str, Tuple[Row, str]] = {}
+        self._html: Optional[str] = None
+        self._order: Tuple[str, ...] = ()
+        self.cells_rendered = 0
+        self.cells_reused = 0
+
+    def _cell(self, label: str, col: int, value: Any, fmt: str) -> str:
+        cached = self._cells.get((label, col))
+        if cached is not None and cached[1] == fmt and cached[0] == value:
+            self.cells_reused += 1
+            return cached[2]
+        text = value if isinstance(value, str) else fmt.format(value)
+        html = f"{self._td[col]}{escape(text)}</td>"
+        self._cells[(label, col)] = (value, fmt, html)
+        self.cells_rendered += 1
+        return html
+
+    def _row(self, row: Row) -> str:
+        cached = self._rows.get(row.label)
+        if cached is not None and cached[0] == row:
+            self.cells_reused += len(row.values) + 1
+            return cached[1]
+        if len(row.values) != len(self.columns) - 1:
+            raise ValueError(f"Row {row.label!r} has {len(row.values)} values for {len(self.columns) - 1} columns.")
+        cells = [self._cell(row.label, 0, row.label, "{}")]
+        cells.extend(self._cell(row.label, i, v, row.fmt) for i, v in enumerate(row.values, start=1))
+        html = (f"<tr class='{row.cls}'>" if row.cls else "<tr>") + "".join(cells) + "</tr>"
+        self._rows[row.label] = (row, html)
+        return html
+
+    def render(self, rows: Sequence[Row]) -> str:
+        """Table markup for `rows`; only cells that changed since the last call are re-rendered."""
+        order = tuple(r.label for r in rows)
+        if self._html is not None and order == self._order and all(
+                self._rows.get(r.label, (None,))[0] == r for r in rows):
+            self.cells_reused += sum(len(r.values) + 1 for r in rows)
+            return self._html
+        body = "".join(self._row(r) for r in rows)
+        if order != self._order:   # drop cached cells of rows that are gone
+            keep = set(order)
+            self._rows = {k: v for k, v in self._rows.items() if k in keep}
+            self._cells = {k: v for k, v in self._cells.items() if k[0] in keep}
+        self._order = order
+        self._html = f"{self._head}{body}</tbody></table></div>"
+        return self._html
+
+def table_css() -> None:
+    """Link the shared table/banner stylesheet (a no-op once this session has it)."""
+    ensure_stylesheet("tables", TABLE_CSS)
+
+def renderer(key: str, columns: Sequence[str], groups: Sequence[Tuple[str, int]] = ()) -> TableRenderer:
+    """The session's renderer for `key`, rebuilt only if its columns change."""
+    tables: Dict[str, TableRenderer] = st.session_state.setdefault(_STATE_KEY, {})
+    r = tables.get(key)
+    if r is None or r.columns != tuple(columns) or r.groups != tuple(groups):
+        r = tables[key] = TableRenderer(key, columns, groups)
+    return r
+
+def render_table(key: str, columns: Sequence[str], rows: Sequence[Row],
+                 groups: Sequence[Tuple[str, int]] = ()) -> str:
+    """Draw a class-based table through the session's cached renderer and return its markup."""
+    html = renderer(key, columns, groups).render(rows)
+    st.markdown(html, unsafe_allow_html=True)
+    return html
+
+def render_banner(title: str, text: str, loss: bool = False) -> None:
+    st.markdown(f"<div class='eb-banner{' loss' if loss else ''}'><h4>{escape(title)}</h4>"
+                f"<p>{escape(text)}</p></div>", unsafe_allow_html=True)
+
+__all__ = [
+    "Row",
+    "TABLE_CSS",
+    "TableRenderer",
+    "render_banner",
+    "render_table",
+    "renderer",
+    "table_css",
+]
@@ -0,0 +1,178 @@
+import asyncio, json, threading, time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # requests is imported on the first fetch, not when the widget loads
+    import requests
+
+# ---- remote JSON fetch: concurrent race, pooled connections, disk cache ----
+# All candidate URLs are requested at once (asyncio + worker threads over one
+# pooled requests.Session); the first usable answer wins. The payload is kept on
+# disk with its ETag / Last-Modified, so later fetches are conditional (304 = keep
+# the cached copy). When a cached copy exists it is returned immediately and, if
+# older than max_age_s, refreshed on a background thread (stale-while-revalidate).
+
+DEFAULT_TIMEOUT_S = 6.0
+DEFAULT_MAX_AGE_S = 6 * 3600
+
+_SESSION: Optional["requests.Session"] = None
+_SESSION_LOCK = threading.Lock()
+# Not asyncio's default executor: asyncio.run() would wait for the slow losers on exit.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="remote-fetch")
+
+def pooled_session() -> "requests.Session":
+    """One keep-alive session per process, sized for a few hosts in parallel."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _SESSION = s
+        return _SESSION
+
+class RemoteJSONCache:
+    def __init__(self, urls: Sequence[str], cache_dir: Path, name: str = "remote", *,
+                 timeout_s: float = DEFAULT_TIMEOUT_S, max_age_s: float = DEFAULT_MAX_AGE_S,
+                 session: Optional["requests.Session"] = None):
+        self.urls = list(urls)
+        self.data_path = Path(cache_dir) / f"{name}.json"
+        self.meta_path = Path(cache_dir) / f"{name}.meta.json"
+        self.timeout_s = timeout_s
+        self.max_age_s = max_age_s
+        self._session = session
+        self._refreshing = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        return self._session or pooled_session()
+
+    # ---- disk cache ----
+    def _read_meta(self) -> dict:
+        try:
+            return json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _read_cached(self) -> Optional[Any]:
+        try:
+            return json.loads(self.data_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, payload: Any, meta: dict) -> None:
+        self.data_path.parent.mkdir(parents=True, exist_ok=True)
+        for path, obj in ((self.data_path, payload), (self.meta_path, meta)):
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+
+    def _touch(self, meta: dict) -> None:
+        meta = dict(meta, fetched_at=time.time())
+        tmp = self.meta_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        tmp.replace(self.meta_path)
+
+    @property
+    def version(self) -> Optional[int]:
+        """Changes whenever a new payload is written (used to invalidate parsed copies)."""
+        try:
+            return self.data_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    # ---- network ----
+    def _get(self, url: str, headers: dict) -> Tuple[str, int, Optional[Any], dict]:
+        r = self.session.get(url, headers=headers, timeout=self.timeout_s)
+        if r.status_code == 304:
+            return url, 304, None, {}
+        r.raise_for_status()
+        return url, r.status_code, r.json(), {"etag": r.headers.get("ETag"),
+                                              "last_modified": r.headers.get("Last-Modified")}
+
+    async def _race(self, meta: dict) -> Optional[Tuple[str, int, Optional[Any], dict]]:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        elif meta.get("fetched_at"):
+            headers["If-Modified-Since"] = formatdate(meta["fetched_at"], usegmt=True)
+
+        def attempt(url: str):
+            # Validators belong to the URL that produced the cached copy.
+            return self._get(url, headers if url == meta.get("url") else {})
+
+        loop = asyncio.get_running_loop()
+        pending = {loop.run_in_executor(_EXECUTOR, attempt, url) for url in self.urls}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for other in pending:
+                        other.cancel()   # losers finish in their threads; results ignored
+                    return task.result()
+        return None
+
+    def _run(self, coro):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # Called from inside an event loop: run the race on a helper thread.
+        box = {}
+        t = threading.Thread(target=lambda: box.setdefault("r", asyncio.run(coro)))
+        t.start(); t.join()
+        return box.get("r")
+
+    def refresh(self) -> Optional[Any]:
+        """Fetch now (conditionally); returns the fresh or still-valid payload, else None."""
+        meta = self._read_meta()
+        won = self._run(self._race(meta))
+        if won is None:
+            return None
+        url, status, payload, validators = won
+        if status == 304:
+            cached = self._read_cached()
+            if cached is not None:
+                self._touch(meta)
+                return cached
+            won = self._run(self._race({}))   # cache vanished: fetch unconditionally
+            if won is None or won[1] == 304:
+                return None
+            url, status, payload, validators = won
+        self._write(payload, {"url": url, "fetched_at": time.time(), **validators})
+        return payload
+
+    def _refresh_in_background(self) -> None:
+        if not self._refreshing.acquire(blocking=False):
+            return  # a refresh is already running
+        def run():
+            try:
+                self.refresh()
+            except Exception:
+                pass
+            finally:
+                self._refreshing.release()
+        threading.Thread(target=run, name=f"refresh-{self.data_path.stem}", daemon=True).start()
+
+    def maybe_refresh(self) -> None:
+        """Start a background refresh if the cached copy is older than max_age_s (cheap: reads metadata only)."""
+        if time.time() - float(self._read_meta().get("fetched_at") or 0) > self.max_age_s:
+            self._refresh_in_background()
+
+    def get(self) -> Optional[Any]:
+        """Cached payload right away (refreshing it in the background when stale), else fetch."""
+        cached = self._read_cached()
+        if cached is None:
+            return self.refresh()
+        self.maybe_refresh()
+        return cached
+
+def fetch_json(urls: List[str], cache_dir: Path, name: str = "remote", **kwargs) -> Optional[Any]:
+    return RemoteJSONCache(urls, cache_dir, name, **kwargs).get()
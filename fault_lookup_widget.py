@@ -1,6 +1,10 @@
-import io, json, re, requests, streamlit as st
+import io, json, re, threading, time, streamlit as st
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict
+from fault_fetch import RemoteJSONCache
+from fault_search import FaultSearchIndex, load_or_build
+from utils.profiling import fragment_run, span, timed
+from utils.snapshot import load_faults
 
 # ---- (copy these from your app; unchanged) ----
 UI_EQUIPMENTS = ["AFE", "DC-DC", "Grid"]
@@ -41,23 +45,14 @@ def bullets_from_text(s: str) -> List[str]:
         if t: out.append(re.sub(r"\b(\w+)\s+\1\b", r"\1", t, flags=re.IGNORECASE))
     return out
 
-def try_load_local() -> Optional[List[dict]]:
-    for p in LOCAL_CANDIDATES:
-        try:
-            if p.exists():
-                return json.loads(Path(p).read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    return None
+# Candidates are raced concurrently; the winner is cached under .cache/ and revalidated by ETag.
+REMOTE = RemoteJSONCache(REMOTE_CANDIDATES, Path.cwd() / ".cache", "inverter_fault_codes")
 
 def try_load_remote() -> Optional[List[dict]]:
-    for url in REMOTE_CANDIDATES:
-        try:
-            r = requests.get(url, timeout=10)
-            if r.ok: return r.json()
-        except Exception:
-            pass
-    return None
+    try:
+        return REMOTE.get()
+    except Exception:
+        return None
 
 def parse_rows_to_faults(rows: List[dict]) -> Dict[str, Dict[str, dict]]:
     faults: Dict[str, Dict[str, dict]] = {"AFE": {}, "DC-DC": {}, "Grid": {}}
@@ -87,19 +82,127 @@ def parse_rows_to_faults(rows: List[dict]) -> Dict[str, Dict[str, dict]]:
                                 "description": desc, "causes": "", "fixes": ""}
     return faults
 
+# ---- indexed store, parsed once per process ----
+def code_number(code: Optional[str]) -> Optional[int]:
+    """'F091' / 'F91' -> 91."""
+    m = re.fullmatch(r"F0*(\d+)", (code or "").strip().upper())
+    return int(m.group(1)) if m else None
+
+class FaultStore:
+    """Parsed fault dictionary with lookups by equipment, code and numeric code; text search via FaultSearchIndex."""
+
+    def __init__(self, faults: Dict[str, Dict[str, dict]], origin: str = "local"):
+        self.faults = faults
+        self.origin = origin
+        self._index: Optional[FaultSearchIndex] = None
+        self.by_code: Dict[str, List[dict]] = {}
+        self.by_number: Dict[int, List[dict]] = {}
+        for table in faults.values():
+            for code, entry in table.items():
+                self.by_code.setdefault(code, []).append(entry)
+                num = code_number(code)
+                if num is not None:
+                    self.by_number.setdefault(num, []).append(entry)
+
+    @classmethod
+    def from_rows(cls, rows: List[dict], origin: str = "local") -> "FaultStore":
+        return cls(parse_rows_to_faults(rows), origin)
+
+    def __len__(self) -> int:
+        return sum(len(t) for t in self.faults.values())
+
+    def get(self, equipment: str, code: str) -> Optional[dict]:
+        return self.faults.get(equipment, {}).get(code)
+
+    def find(self, selected_equip: str, code: str) -> Tuple[Optional[dict], List[dict]]:
+        """Exact code in the selected equipment first, else the same code (or number) elsewhere."""
+        primary = self.get(selected_equip, code)
+        if primary:
+            return primary, []
+        num = code_number(code)
+        matches = self.by_code.get(code) or (self.by_number.get(num, []) if num is not None else [])
+        same = [e for e in matches if e["equipment"] == selected_equip]
+        if same:
+            return same[0], []
+        return None, [e for e in matches if e["equipment"] != selected_equip]
+
+    @property
+    def index(self) -> FaultSearchIndex:
+        """Full-text/fuzzy index, loaded from (or written to) the on-disk cache on first use."""
+        if self._index is None:
+            self._index = load_or_build(self.faults)
+        return self._index
+
+    def search(self, query: str, limit: int = 10, equipment: Optional[str] = None) -> List[dict]:
+        """Ranked entries for a symptom query like 'overvoltage dc bus'."""
+        return [self.faults[e][c] for _, e, c in self.index.search(query, limit=limit, equipment=equipment)]
+
+REMOTE_RETRY_S = 300   # how long a failed remote fetch is remembered before retrying
+
+_STORE_LOCK = threading.Lock()
+_STORE: Dict[str, object] = {"sig": None, "store": None, "checked": 0.0, "bad": None}
+
+def _local_signature() -> Optional[Tuple[str, int, int]]:
+    for p in LOCAL_CANDIDATES:
+        try:
+            st_ = p.stat()
+            return (str(p), st_.st_mtime_ns, st_.st_size)
+        except OSError:
+            continue
+    return None
+
+@timed()
+def get_fault_store() -> Optional[FaultStore]:
+    """
+    Process-wide FaultStore. A local JSON file is re-parsed only when its path,
+    mtime or size changes (a file that fails to parse is skipped until it
+    does); remote data is re-parsed only when the disk cache gets a new
+    payload (failures retried after REMOTE_RETRY_S). Every rerun in every
+    session otherwise reuses the same store.
+    """
+    sig = _local_signature()
+    with _STORE_LOCK:
+        if sig is not None and sig == _STORE["bad"]:
+            sig = None  # same broken local file as last time: go straight to the remote store
+        if sig is not None and _STORE["sig"] == sig:
+            return _STORE["store"]
+        prev = _STORE["sig"]
+        if sig is None and isinstance(prev, tuple) and prev[0] == "remote":
+            if _STORE["store"] is not None:
+                REMOTE.maybe_refresh()
+                if prev[1] == REMOTE.version:
+                    return _STORE["store"]
+            elif time.monotonic() - _STORE["checked"] < REMOTE_RETRY_S:
+                return None
+
+        store = None
+        if sig is not None:
+            try:
+                faults = load_faults(Path(sig[0]))  # pre-parsed copy from the binary snapshot
+                store = (FaultStore(faults, "local") if faults is not None else
+                         FaultStore.from_rows(json.loads(Path(sig[0]).read_text(encoding="utf-8")), "local"))
+            except Exception:
+                _STORE["bad"] = sig
+                sig = None
+        if store is None:
+            rows = try_load_remote()
+            store = FaultStore.from_rows(rows, "remote") if rows else None
+            sig = ("remote", REMOTE.version)
+        if store is not None:
+            store.index  # build (or load) the search index once, with the data
+        _STORE.update(sig=sig, store=store, checked=time.monotonic())
+        return store
+
 def load_faults_with_fallback():
-    rows = try_load_local()
-    if rows is None: rows = try_load_remote()
-    return (parse_rows_to_faults(rows), ("local" if rows else "missing")) if rows else (None, "missing")
+    store = get_fault_store()
+    return (store.faults, store.origin) if store else (None, "missing")
 
-def find_fault(faults, selected_equip, code):
-    primary = faults.get(selected_equip, {}).get(code)
-    alts = [] if primary else [t[code] for k,t in faults.items() if k!=selected_equip and code in t]
-    return primary, alts
+def find_fault(faults: FaultStore, selected_equip, code):
+    return faults.find(selected_equip, code)
 
 # ---- inline renderer (no page_config, no global background CSS) ----
 def render_fault_code_lookup_inline():
-    faults, origin = load_faults_with_fallback()
+    faults = get_fault_store()
     st.markdown("""
     <style>
       .fc-card {border:1px solid #939598;border-radius:10px;padding:12px;background:rgba(0,0,0,.35);}
@@ -110,14 +213,25 @@ def render_fault_code_lookup_inline():
         st.error("Fault code data file not found.")
         up = st.file_uploader("Upload inverter fault JSON", type=["json"], key="fc_upload_inline")
         if up:
-            try:
-                rows = json.load(io.StringIO(up.getvalue().decode("utf-8")))
-                faults = parse_rows_to_faults(rows)
-                st.success("Loaded data from uploaded file.")
-            except Exception as e:
-                st.exception(e)
+            cached = st.session_state.get("fc_upload_store")
+            if cached and cached[0] == up.file_id:
+                faults = cached[1]
+            else:
+                try:
+                    rows = json.load(io.StringIO(up.getvalue().decode("utf-8")))
+                    faults = FaultStore.from_rows(rows, "upload")
+                    st.session_state["fc_upload_store"] = (up.file_id, faults)
+                    st.success("Loaded data from uploaded file.")
+                except Exception as e:
+                    st.exception(e)
         if not faults: return
 
+    _fault_lookup_forms(faults)
+
+@st.fragment
+@fragment_run("fault_lookup")
+def _fault_lookup_forms(faults: FaultStore):
+    # Searching reruns only this fragment; the store is passed in, not reloaded.
     with st.form("fc_form_inline", clear_on_submit=False):
         c1, c2 = st.columns(2)
         with c1:
@@ -126,6 +240,20 @@ def render_fault_code_lookup_inline():
             user_code_raw = st.text_input("Fault Code", placeholder="e.g., F91", key="fc_code_raw_inline")
         submitted = st.form_submit_button("Search")
 
+    with st.form("fc_search_inline", clear_on_submit=False):
+        query = st.text_input("Search symptoms", placeholder="e.g., overvoltage dc bus", key="fc_query_inline")
+        any_equipment = st.checkbox("All equipment", value=True, key="fc_query_all_inline")
+        searched = st.form_submit_button("Search symptoms")
+
+    if searched and query.strip():
+        with span("fault_search.search"):
+            hits = faults.search(query, limit=10, equipment=None if any_equipment else selected)
+        if not hits:
+            st.warning(f"No faults match “{query}”.")
+        for entry in hits:
+            with st.expander(f"{entry['equipment']} {entry['code']} — {entry['description'] or entry['fault_code_full']}"):
+                _render_result_inline(entry)
+
     if not submitted:
         return
 
@@ -133,7 +261,7 @@ def render_fault_code_lookup_inline():
     if not code:
         st.error("Please enter a fault code (e.g., F91)."); return
 
-    primary, alts = find_fault(faults, selected, code)
+    primary, alts = faults.find(selected, code)
     if primary:
         _render_result_inline(primary)
     elif alts:
@@ -0,0 +1,163 @@
+import hashlib, json, math, re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# ---- symptom search over parsed fault dictionaries ----
+# Inverted index over code / description / causes / fixes with per-field weights
+# and BM25 ranking. Query words that are not in the vocabulary are expanded to
+# vocabulary words sharing a prefix or enough trigrams within a small edit
+# distance, so "overvolt" and "ovrevoltage" still hit "overvoltage".
+# The built index is written as JSON under .cache/, keyed by a hash of the
+# faults dict, and reloaded instead of rebuilt when the data has not changed.
+
+INDEX_VERSION = 1
+CACHE_DIR = Path.cwd() / ".cache"
+FIELD_WEIGHTS = {"fault_code_full": 2.0, "description": 3.0, "causes": 1.5, "fixes": 1.0}
+BM25_K1, BM25_B = 1.2, 0.75
+STOPWORDS = frozenset("a an and are as at be by for from in is it of on or the to with".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+def trigrams(token: str) -> set:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, giving up (returns limit + 1) once it must exceed `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+        if min(cur) > limit:
+            return limit + 1
+        prev = cur
+    return prev[-1]
+
+def faults_digest(faults: Dict[str, Dict[str, dict]]) -> str:
+    blob = json.dumps(faults, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(blob).hexdigest()[:16]
+
+class FaultSearchIndex:
+    def __init__(self, docs: List[Tuple[str, str]], postings: Dict[str, Dict[int, float]],
+                 doc_len: List[float], digest: str = ""):
+        self.docs = docs
+        self.postings = postings
+        self.doc_len = doc_len
+        self.digest = digest
+        self.avg_len = (sum(doc_len) / len(doc_len)) if doc_len else 0.0
+        n = len(docs)
+        self.idf = {t: math.log(1 + (n - len(p) + 0.5) / (len(p) + 0.5)) for t, p in postings.items()}
+        self.vocab = sorted(postings)
+        self.grams: Dict[str, List[str]] = {}
+        for tok in self.vocab:
+            for g in trigrams(tok):
+                self.grams.setdefault(g, []).append(tok)
+
+    @classmethod
+    def build(cls, faults: Dict[str, Dict[str, dict]]) -> "FaultSearchIndex":
+        docs, postings, doc_len = [], {}, []
+        for equip in sorted(faults):
+            for code in sorted(faults[equip]):
+                entry = faults[equip][code]
+                doc_id = len(docs)
+                docs.append((equip, code))
+                length = 0.0
+                for field, weight in FIELD_WEIGHTS.items():
+                    for tok in tokenize(entry.get(field, "")):
+                        row = postings.setdefault(tok, {})
+                        row[doc_id] = row.get(doc_id, 0.0) + weight
+                        length += weight
+                doc_len.append(length)
+        return cls(docs, postings, doc_len, faults_digest(faults))
+
+    # ---- persistence ----
+    def to_json(self) -> dict:
+        return {"version": INDEX_VERSION, "digest": self.digest, "docs": self.docs, "doc_len": self.doc_len,
+                "postings": {t: {str(d): w for d, w in p.items()} for t, p in self.postings.items()}}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "FaultSearchIndex":
+        postings = {t: {int(d): float(w) for d, w in p.items()} for t, p in data["postings"].items()}
+        return cls([tuple(d) for d in data["docs"]], postings, [float(x) for x in data["doc_len"]], data["digest"])
+
+    # ---- query ----
+    def expand(self, qtok: str) -> List[Tuple[str, float]]:
+        """Vocabulary words for a query word with a similarity weight (1.0 = exact)."""
+        if qtok in self.postings:
+            return [(qtok, 1.0)]
+        out: Dict[str, float] = {}
+        if len(qtok) >= 3:
+            for tok in self.vocab:
+                if tok.startswith(qtok):
+                    out[tok] = 0.8
+        limit = 1 if len(qtok) <= 5 else 2
+        qgrams = trigrams(qtok)
+        counts: Dict[str, int] = {}
+        for g in qgrams:
+            for tok in self.grams.get(g, ()):
+                counts[tok] = counts.get(tok, 0) + 1
+        for tok, shared in counts.items():
+            if tok in out or shared / len(qgrams | trigrams(tok)) < 0.3:
+                continue
+            dist = edit_distance(qtok, tok, limit)
+            if dist <= limit:
+                out[tok] = 0.7 - 0.15 * (dist - 1)
+        return sorted(out.items(), key=lambda kv: -kv[1])[:8]
+
+    def search(self, query: str, limit: int = 10, equipment: Optional[str] = None) -> List[Tuple[float, str, str]]:
+        """Ranked (score, equipment, code) for a free-text query; best first."""
+        qtoks = tokenize(query)
+        if not qtoks or not self.docs:
+            return []
+        scores: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        for qtok in dict.fromkeys(qtoks):
+            seen = set()
+            for tok, sim in self.expand(qtok):
+                idf = self.idf[tok]
+                for doc_id, tf in self.postings[tok].items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_len[doc_id] / (self.avg_len or 1.0))
+                    scores[doc_id] = scores.get(doc_id, 0.0) + sim * idf * tf * (BM25_K1 + 1) / (tf + norm)
+                    seen.add(doc_id)
+            for doc_id in seen:
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+        n_q = len(dict.fromkeys(qtoks))
+        ranked = []
+        for doc_id, score in scores.items():
+            equip, code = self.docs[doc_id]
+            if equipment and equip != equipment:
+                continue
+            ranked.append((score * (matched[doc_id] / n_q) ** 2, equip, code))  # favour full coverage
+        ranked.sort(key=lambda r: (-r[0], r[1], r[2]))
+        return ranked[:limit]
+
+def load_or_build(faults: Dict[str, Dict[str, dict]], cache_dir: Optional[Path] = CACHE_DIR) -> FaultSearchIndex:
+    """Reuse the persisted index for this exact data, else build it and persist it."""
+    digest = faults_digest(faults)
+    path = Path(cache_dir) / f"fault_index_v{INDEX_VERSION}_{digest}.json" if cache_dir else None
+    if path is not None and path.exists():
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") == INDEX_VERSION and data.get("digest") == digest:
+                return FaultSearchIndex.from_json(data)
+        except Exception:
+            pass
+    index = FaultSearchIndex.build(faults)
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(index.to_json(), ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+            for old in path.parent.glob("fault_index_v*_*.json"):
+                if old != path:
+                    old.unlink(missing_ok=True)
+        except OSError:
+            pass   # read-only deploys: keep the in-memory index
+    return index
@@ -1,7 +1,11 @@
 # pages/01_Tech_Specs.py
 import streamlit as st
 from utils.data import EBOSS_SPECS          # your dict by model → {label: value}
+from utils.registry import sheet_for        # accepts "EB125 kVA" or "EBOSS 125 kVA"
 from utils.spec_store import compute_and_store_spec
+from utils.profiling import finish_run, section, start_run
+
+start_run("Tech Specs")
 
 # ------ Section headers you gave ------
 SPEC_LABELS = [
@@ -125,10 +129,13 @@ def _open_change_model_modal(models):
                     st.rerun()  # closes modal & refreshes page
 
 # ===== Page render =====
+section("spec sheet")
 model = st.session_state.get("eboss_model")
 eboss_type = st.session_state.get("eboss_type")
 
-if not model or model not in EBOSS_SPECS:
+sheet = sheet_for(model)
+
+if not model or sheet is None:
     st.warning("Select an EBOSS configuration from the modal to view Technical Specs.")
 else:
     # Top: model & type (centered)
@@ -152,9 +159,11 @@ else:
             _open_change_model_modal(list(EBOSS_SPECS.keys()))
 
     # Sections: labels fixed, values per selected model
-    buckets = _bucket_by_section(EBOSS_SPECS[model])
+    buckets = _bucket_by_section(sheet)
     for sec in SPEC_LABELS:
         items = buckets.get(sec, [])
         if sec == "Warranty" and not items:
             items = [("Warranty", "Contact ANA Energy for current warranty terms")]
         _render_two_col_section(sec, items)
+
+finish_run()
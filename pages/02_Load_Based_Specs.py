@@ -0,0 +1,69 @@
+import streamlit as st
+from utils.theme import apply_theme, render_logo
+from utils.state import ensure_state
+from utils.data import SPECS
+from utils.keys import CANON as K
+from utils.spec_store import compute_and_store_spec
+from utils.profiling import finish_run, start_run
+
+start_run("Load Based Specs")
+apply_theme(); ensure_state(); render_logo()
+st.header("Load Based Specs")
+
+# ------ Size from metered load data ------
+st.subheader("Size from metered load data")
+up = st.file_uploader("Interval-meter log (CSV or Parquet)", type=["csv", "parquet", "pq"], key="meter_upload")
+interval = st.number_input("Sample interval (minutes, 0 = infer from timestamps)",
+                           min_value=0.0, step=1.0, value=0.0, key="meter_interval")
+
+if up is not None:
+    from utils.meter import meter_load_stats  # pandas is only loaded once a log is uploaded
+    # Streaming the file is the expensive part: do it once per upload, not on every rerun.
+    cache_key = (up.file_id, interval)
+    if st.session_state.get("meter_stats_key") != cache_key:
+        try:
+            with st.spinner(f"Reading {up.name}…"):
+                st.session_state["meter_stats"] = meter_load_stats(up, interval_minutes=interval or None)
+            st.session_state["meter_stats_key"] = cache_key
+        except (ValueError, KeyError) as e:
+            st.session_state.pop("meter_stats", None)
+            st.session_state.pop("meter_stats_key", None)
+            st.error(str(e))
+
+stats = st.session_state.get("meter_stats") if up is not None else None
+if stats:
+    from utils.meter import sizing_inputs_from_stats
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric(f"Continuous ({stats['continuous_window_minutes']:.0f}-min avg)", f"{stats['continuous_kw']:.1f} kW")
+    c2.metric("Peak", f"{stats['peak_kw']:.1f} kW")
+    c3.metric("Average", f"{stats['mean_kw']:.1f} kW")
+    c4.metric("Logged", f"{stats['hours'] / 24:.1f} days")
+    st.caption(" • ".join(f"P{q:g}: {v:.1f} kW" for q, v in stats["percentiles_kw"].items())
+               + f" • column: {stats['kw_column']} • {stats['samples']:,} samples")
+
+    basis = st.radio("Size continuous load on", ["Rolling average", "P95", "P99"], horizontal=True, key="meter_basis")
+    pct = {"P95": 95, "P99": 99}.get(basis)
+    inputs = sizing_inputs_from_stats(stats, continuous_percentile=pct)
+
+    models = [rec["eboss_model"] for rec in SPECS.values()]
+    m1, m2 = st.columns(2)
+    with m1:
+        model = st.selectbox("EBOSS Model", models, key="meter_model")
+    with m2:
+        eb_type = st.selectbox("EBOSS Type", ["Full Hybrid", "Power Module"], key="meter_type")
+    pm_gen = None
+    if eb_type == "Power Module":
+        pm_gen = st.selectbox("Power Module generator (kVA)", sorted(SPECS.keys()), key="meter_pm_gen")
+
+    if st.button("Use metered load for sizing", key="meter_apply"):
+        st.session_state[K["actual_cont_kw"]] = inputs["cont_kw"]
+        st.session_state[K["actual_peak_kw"]] = inputs["peak_kw"]
+        st.session_state[K["model"]] = model
+        st.session_state[K["type"]] = eb_type
+        st.session_state[K["pm_gen"]] = pm_gen
+        compute_and_store_spec(model=model, type=eb_type, cont_kw=inputs["cont_kw"],
+                               pm_gen=pm_gen, size_kva=pm_gen)
+        st.success(f"Sizing {model} ({eb_type}) at {inputs['cont_kw']:.1f} kW continuous / "
+                   f"{inputs['peak_kw']:.1f} kW peak.")
+
+finish_run()
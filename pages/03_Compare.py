@@ -0,0 +1,81 @@
+import streamlit as st
+from utils.theme import apply_theme, render_logo
+from utils.state import ensure_state
+from utils.compare import MAX_LOAD_KW, PM_GENERATOR_OPTIONS, comparison_matrix
+from utils.data import EBOSS_STANDARD_PAIRING
+from utils.profiling import finish_run, section, start_run
+
+start_run("Compare")
+apply_theme(); ensure_state(); render_logo()
+st.header("EBOSS® to Standard Comparison")
+
+matrix = comparison_matrix()   # built once per process; everything below is a slice
+
+def _default_index(options, value, fallback=0):
+    return options.index(value) if value in options else fallback
+
+# ------ Configuration (defaults follow the main app's selection) ------
+section("configuration")
+c1, c2, c3 = st.columns(3)
+with c1:
+    model = st.selectbox("EBOSS® Model", matrix.models,
+                         index=_default_index(matrix.models, st.session_state.get("eboss_model")),
+                         key="cmp_model")
+with c2:
+    types = ["Full Hybrid", "Power Module"]
+    eboss_type = st.selectbox("EBOSS® Type", types,
+                              index=_default_index(types, st.session_state.get("eboss_type")),
+                              key="cmp_type")
+with c3:
+    generator_kva = None
+    if eboss_type == "Power Module":
+        generator_kva = st.selectbox("Generator Size", PM_GENERATOR_OPTIONS,
+                                     index=_default_index(PM_GENERATOR_OPTIONS, st.session_state.get("generator_kva")),
+                                     key="cmp_generator_kva")
+
+sizes = list(matrix.sizes)
+standard = st.selectbox(
+    "Standard Generator", sizes,
+    index=_default_index(sizes, st.session_state.get("standard_generator")
+                         or EBOSS_STANDARD_PAIRING.get(model)),
+    key="cmp_standard",
+)
+current_load = st.session_state.get("continuous_load") or 0
+load_kw = st.slider("Continuous Load (kW)", 0, MAX_LOAD_KW,
+                    value=int(current_load) if 0 <= current_load <= MAX_LOAD_KW else 0, key="cmp_load")
+
+# ------ Side by side at this load ------
+section("comparison")
+ix = matrix.index(model, eboss_type, generator_kva, standard, load_kw)
+row = matrix.row(ix)
+LINES = [
+    ("% Engine Load", "engine_load_percent", "{:.1f}%"),
+    ("Gallons per Hour", "fuel_gph", "{:.2f} GPH"),
+    ("Gallons per Day", "fuel_per_day", "{:.1f} gal"),
+    ("Gallons per Month", "fuel_per_month", "{:,.0f} gal"),
+    ("Carbon Emissions per Day", "co2_per_day", "{:,.1f} lbs"),
+]
+table = {
+    "Specification": [label for label, _, _ in LINES],
+    f"EBOSS {model}": [fmt.format(row[f"eboss_{name}"]) for _, name, fmt in LINES],
+    f"Standard {standard}": [fmt.format(row[f"standard_{name}"]) for _, name, fmt in LINES],
+    "Difference": [("+" if row[f"diff_{name}"] >= 0 else "") + fmt.format(row[f"diff_{name}"])
+                   for _, name, fmt in LINES],
+}
+st.dataframe(table, hide_index=True, use_container_width=True)
+
+m1, m2 = st.columns(2)
+m1.metric("Fuel saved per month", f"{-row.diff_fuel_per_month:,.0f} gal")
+m2.metric("CO₂ avoided per day", f"{-row.diff_co2_per_day:,.0f} lbs")
+
+# ------ Across every load ------
+section("load curve")
+metric_labels = {label: name for label, name, _ in LINES}
+pick = st.selectbox("Chart", list(metric_labels), index=2, key="cmp_chart_metric")
+curve = matrix.along_load(model, eboss_type, generator_kva, standard, metric_labels[pick])
+st.line_chart(
+    {"Load (kW)": curve["load_kw"], "EBOSS": curve["eboss"], "Standard": curve["standard"]},
+    x="Load (kW)", y=["EBOSS", "Standard"],
+)
+
+finish_run()
@@ -1,18 +1,35 @@
 import streamlit as st
 from datetime import date
-from theme import apply_global_theme
-from nav import render_global_header
+from utils.theme import apply_theme, render_logo
+from utils.state import ensure_state
 from utils.keys import CANON
-from utils.data import SPECS, STANDARD_GENERATORS, interpolate_gph
+from utils.data import SPECS, EBOSS_STANDARD_PAIRING, STANDARD_GENERATOR_DATA as STANDARD_GENERATORS
+from utils.sizing import fuel_gph_at_load
+from utils.paralleling import optimize_fleet
+from utils.profiling import finish_run, start_run
 
-def render_parallel_calculator_page():    # Apply global theme and logo    
-apply_theme()
-render_global_header()
+start_run("Paralleling")
+apply_theme(); ensure_state(); render_logo()
+
+def interpolate_gph(gen_kw, load_fraction):
+    # Fuel burn of a generator rated gen_kw (kVA = kW / 0.8) at a 0-1 load fraction.
+    return fuel_gph_at_load(int(round(gen_kw / 0.8)), min(max(load_fraction, 0.0), 1.0))
+
+def charge_time_lines(data):
+    # Greedy combos use inf for "cannot recharge"; the optimizer reports None (no surplus).
+    charge_time = data["charge_time"]
+    if charge_time is None:
+        st.write("Charge Time: N/A")
+    elif charge_time == float("inf"):
+        st.write("Charge Time: Insufficient charge rate")
+    else:
+        st.write(f"Charge Time per Unit: {charge_time:.2f} hours")
+        st.write(f"Total Engine Runtime: {data['runtime_hrs']:.2f} hours/day")
 
 st.markdown('<div class="form-container">', unsafe_allow_html=True)
 st.markdown("## Parallel/Hybrid Sizing Tool")
 
-   # --- System type selection
+# --- System type selection
 st.markdown("### System Type")
 system_type = st.radio(
     "Select system to calculate:",
@@ -21,7 +38,7 @@ system_type = st.radio(
     key="system_type",
 )
 
-   # --- Redundant generators option (for Power Module)
+# --- Redundant generators option (for Power Module)
 use_redundant_generators = False
 if system_type in ["EBOSS Power Module", "Compare EBOSS vs Standard Diesel"]:
     use_redundant_generators = st.checkbox(
@@ -95,6 +112,41 @@ if system_type in ["EBOSS Power Module", "Standard Diesel", "Compare EBOSS vs St
 else:
     gen_inventory = {}
 
+# --- Optimizer settings (mixed-size EBOSS combinations)
+opt_objective, opt_fuel_price, opt_daily_rates = "Fuel (GPH)", 0.0, {}
+if system_type != "Standard Diesel" and view_mode != "Individual size class":
+    st.markdown("### Optimized Combination")
+    opt_objective = st.radio(
+        "Minimize:",
+        ["Fuel (GPH)", "Daily cost"],
+        horizontal=True,
+        key="opt_objective",
+    )
+    opt_fuel_price = st.number_input("Fuel price ($/gal)", min_value=0.0, step=0.05, value=4.0, key="opt_fuel_price")
+    if opt_objective == "Daily cost":
+        for model_name, qty in eboss_inventory.items():
+            if qty:
+                opt_daily_rates[model_name] = st.number_input(
+                    f"{model_name} rental ($/day)",
+                    min_value=0.0,
+                    step=10.0,
+                    key=f"opt_rate_{model_name.replace(' ', '_')}",
+                )
+
+def _optimized_combo(eboss_type):
+    # Exhaustive search over the inventory; runs in a process pool for large fleets.
+    best = optimize_fleet(
+        required_cont_kw,
+        required_peak_kw,
+        eboss_inventory,
+        eboss_type=eboss_type,
+        objective="cost" if opt_objective == "Daily cost" else "gph",
+        fuel_price=opt_fuel_price,
+        daily_rates=opt_daily_rates,
+        top_n=1,
+    )
+    return best[0] if best else None
+
 # --- Calculate
 if st.button(" Calculate System", key="calculate_system"):
     # Validate load against inventory
@@ -118,7 +170,7 @@ if st.button(" Calculate System", key="calculate_system"):
     if system_type in ["EBOSS Full Hybrid", "Compare EBOSS vs Standard Diesel"]:
         results["Full Hybrid"] = {}
         charge_key = "fh_charge_rate"
-        gen_key = "fh_gen_kw"
+        gen_key = "gen_kw"
         if view_mode == "Individual size class" and selected_model:
             # Single model calculation
             model_kva = next(kva for kva, rec in SPECS.items() if rec["eboss_model"] == selected_model)
@@ -195,6 +247,12 @@ if st.button(" Calculate System", key="calculate_system"):
                     "total_gph": total_gph,
                 }
 
+            optimized = _optimized_combo("Full Hybrid")
+            if optimized:
+                results["Full Hybrid"]["Optimized"] = optimized
+            else:
+                st.warning("No Full Hybrid combination in inventory carries this load.")
+
     # --- EBOSS Power Module Calculations
     if system_type in ["EBOSS Power Module", "Compare EBOSS vs Standard Diesel"]:
         results["Power Module"] = {}
@@ -304,13 +362,24 @@ if st.button(" Calculate System", key="calculate_system"):
                     "total_gph": total_gph,
                 }
 
+            optimized = _optimized_combo("Power Module")
+            if optimized:
+                # One paired generator per Power Module, sized to the module's class.
+                optimized["generators"] = {
+                    f"{kva} kVA generator": optimized["units"][rec["eboss_model"]]
+                    for kva, rec in SPECS.items() if rec["eboss_model"] in optimized["units"]
+                }
+                results["Power Module"]["Optimized"] = optimized
+            else:
+                st.warning("No Power Module combination in inventory carries this load.")
+
     # --- Standard Diesel Calculations
     if system_type in ["Standard Diesel", "Compare EBOSS vs Standard Diesel"]:
         results["Standard Diesel"] = {}
         if view_mode == "Individual size class" and selected_model:
             # Map selected EBOSS model to corresponding generator
             model_kva = next(kva for kva, rec in SPECS.items() if rec["eboss_model"] == selected_model)
-            gen_name = f"GEN{model_kva}/{SPECS[model_kva]['max_cont_kw']}kW"
+            gen_name = EBOSS_STANDARD_PAIRING.get(selected_model, "")
             gen_data = STANDARD_GENERATORS.get(gen_name)
             if gen_data:
                 qty = max(1, int((required_cont_kw + gen_data["kw"] - 1) // gen_data["kw"]))
@@ -326,7 +395,7 @@ if st.button(" Calculate System", key="calculate_system"):
                     "total_gph": total_gph,
                 }
             else:
-                st.error(f"No generator found for {selected_model}. Please check STANDARD_GENERATORS.")
+                st.error(f"No generator found for {selected_model}. Please check EBOSS_STANDARD_PAIRING.")
         else:
             # Mixed-size combinations
             combo1 = {}  # Larger units
@@ -375,11 +444,7 @@ if st.button(" Calculate System", key="calculate_system"):
                     st.write(f"{model}: {qty}")
                 st.write(f"Total kW: {data['total_kw']:.1f}")
                 st.write(f"Battery Longevity: {data['battery_life']:.2f} hours")
-                if data['charge_time'] == float("inf"):
-                    st.write("Charge Time: Insufficient charge rate")
-                else:
-                    st.write(f"Charge Time per Unit: {data['charge_time']:.2f} hours")
-                    st.write(f"Total Engine Runtime: {data['runtime_hrs']:.2f} hours/day")
+                charge_time_lines(data)
                 st.write(f"Total GPH: {data['total_gph']:.2f}")
                 st.write(f"Gallons per Day: {data['total_gph'] * 24:.1f}")
                 st.write(f"Gallons per Week: {data['total_gph'] * 24 * 7:.1f}")
@@ -392,11 +457,7 @@ if st.button(" Calculate System", key="calculate_system"):
                     st.write(f"{model}: {qty}")
                 st.write(f"Total kW: {data['total_kw']:.1f}")
                 st.write(f"Battery Longevity: {data['battery_life']:.2f} hours")
-                if data['charge_time'] == float("inf"):
-                    st.write("Charge Time: Insufficient charge rate")
-                else:
-                    st.write(f"Charge Time per Unit: {data['charge_time']:.2f} hours")
-                    st.write(f"Total Engine Runtime: {data['runtime_hrs']:.2f} hours/day")
+                charge_time_lines(data)
                 st.write("**Generators Required:**")
                 for gen, qty in data["generators"].items():
                     st.write(f"{gen}: {qty}")
@@ -424,11 +485,7 @@ if st.button(" Calculate System", key="calculate_system"):
             st.write(f"Total kW: {data['total_kw']:.1f}")
             if system_key in ["Full Hybrid", "Power Module"]:
                 st.write(f"Battery Longevity: {data['battery_life']:.2f} hours")
-                if data['charge_time'] == float("inf"):
-                    st.write("Charge Time: Insufficient charge rate")
-                else:
-                    st.write(f"Charge Time per Unit: {data['charge_time']:.2f} hours")
-                    st.write(f"Total Engine Runtime: {data['runtime_hrs']:.2f} hours/day")
+                charge_time_lines(data)
             if system_key == "Power Module":
                 st.write("**Generators Required:**")
                 for gen, qty in data["generators"].items():
@@ -485,4 +542,4 @@ if st.button(" Calculate System", key="calculate_system"):
 
 st.markdown('</div>', unsafe_allow_html=True)
 
-if name == "main":    render_parallel_calculator_page()
+finish_run()
@@ -1,9 +1,13 @@
 import streamlit as st
 from utils.theme import apply_theme, render_logo
 from utils.state import ensure_state
-from components.fault_lookup_widget import render_fault_lookup_widget
+from fault_lookup_widget import render_fault_code_lookup_inline
+from utils.profiling import finish_run, start_run
 
+start_run("Troubleshooting")
 apply_theme(); ensure_state(); render_logo()
 st.header("Troubleshooting")
 
-render_fault_lookup_widget()
+render_fault_code_lookup_inline()
+
+finish_run()
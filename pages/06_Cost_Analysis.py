@@ -1,10 +1,14 @@
 import streamlit as st
 from utils.theme import apply_theme, render_logo
 from utils.state import ensure_state
-from utils.sizing import calculate_load_specs
+from calculations import calculate_load_specs
+from components.table import Row, render_table, table_css
+from utils.compare import eboss_runtime_per_day
 from utils.cost import monthly_costs
+from utils.profiling import finish_run, start_run
 
-apply_theme(); ensure_state(); render_logo()
+start_run("Cost Analysis")
+apply_theme(); ensure_state(); render_logo(); table_css()
 st.header("Cost Analysis")
 
 ui = st.session_state.user_inputs
@@ -28,36 +32,23 @@ if submit:
     if "error" in specs:
         st.error(specs["error"])
     else:
-        rt_day = specs.get("engine_run_per_day", 0.0)
-        gph    = specs.get("fuel_consumption_gph", 0.0)
+        rt_day = float(eboss_runtime_per_day(specs["battery_capacity"], specs["charge_time"], cont_kw))
+        gph    = specs.get("fuel_consumption_gph") or 0.0
 
         if rt_day <= 0 or gph <= 0:
             st.warning("Runtime or fuel burn not available. Configure a model and run sizing first.")
         else:
             res = monthly_costs(rt_day, gph, fuel_cost, rental, delivery, pm_cost, days)
             st.subheader("Monthly Cost Breakdown")
-            st.markdown(
-                f"""
-                <table style='width:100%; border:1px solid #444; border-collapse:collapse;'>
-                  <tr><th style='text-align:left;padding:6px;border:1px solid #444;'>Metric</th>
-                      <th style='text-align:right;padding:6px;border:1px solid #444;'>Value</th></tr>
-                  <tr><td style='padding:6px;border:1px solid #444;'>Rental</td>
-                      <td style='text-align:right;padding:6px;border:1px solid #444;'>${rental:,.2f}</td></tr>
-                  <tr><td style='padding:6px;border:1px solid #444;'>Fuel</td>
-                      <td style='text-align:right;padding:6px;border:1px solid #444;'>${res['fuel_total']:,.2f}</td></tr>
-                  <tr><td style='padding:6px;border:1px solid #444;'>Delivery</td>
-                      <td style='text-align:right;padding:6px;border:1px solid #444;'>${delivery:,.2f}</td></tr>
-                  <tr><td style='padding:6px;border:1px solid #444;'>PM Service</td>
-                      <td style='text-align:right;padding:6px;border:1px solid #444;'>${pm_cost:,.2f}</td></tr>
-                  <tr><td style='padding:6px;border:1px solid #444;'><strong>Total Monthly</strong></td>
-                      <td style='text-align:right;padding:6px;border:1px solid #444;'><strong>${res['total_cost']:,.2f}</strong></td></tr>
-                  <tr><td style='padding:6px;border:1px solid #444;'>Est. CO₂ Emissions (tons)</td>
-                      <td style='text-align:right;padding:6px;border:1px solid #444;'>{res['co2_tons']:,.2f}</td></tr>
-                  <tr><td style='padding:6px;border:1px solid #444;'>Monthly Runtime (hours)</td>
-                      <td style='text-align:right;padding:6px;border:1px solid #444;'>{res['monthly_hours']:,.1f}</td></tr>
-                  <tr><td style='padding:6px;border:1px solid #444;'>Fuel Used (gal)</td>
-                      <td style='text-align:right;padding:6px;border:1px solid #444;'>{res['gallons']:,.1f}</td></tr>
-                </table>
-                """,
-                unsafe_allow_html=True
-            )
+            render_table("cost_breakdown", ("Metric", "Value"), [
+                Row("Rental", (rental,), "${:,.2f}"),
+                Row("Fuel", (res.fuel_total,), "${:,.2f}"),
+                Row("Delivery", (delivery,), "${:,.2f}"),
+                Row("PM Service", (pm_cost,), "${:,.2f}"),
+                Row("Total Monthly", (res.total_cost,), "${:,.2f}", "total"),
+                Row("Est. CO₂ Emissions (tons)", (res.co2_tons,), "{:,.2f}"),
+                Row("Monthly Runtime (hours)", (res.monthly_hours,), "{:,.1f}"),
+                Row("Fuel Used (gal)", (res.gallons,), "{:,.1f}"),
+            ])
+
+finish_run()
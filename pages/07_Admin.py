@@ -0,0 +1,59 @@
+import subprocess
+import pandas as pd
+import streamlit as st
+from utils.theme import apply_theme, render_logo
+from utils.state import ensure_state
+from utils.cache import MEMO_MAXSIZE, clear_memos, memo_stats
+from utils.spec_store import get_spec_cache
+from utils.importtime import ENTRY_MODULES, profile_imports, summarize
+from utils.profiling import finish_run, start_run
+
+start_run("Admin")
+apply_theme(); ensure_state(); render_logo()
+st.header("Admin")
+
+# ------ Process-wide memo caches (shared by all sessions) ------
+st.subheader("Sizing memo caches")
+st.caption(f"Shared by every session on this server • default size {MEMO_MAXSIZE} (EBOSS_MEMO_MAXSIZE)")
+stats = memo_stats()
+if stats:
+    df = pd.DataFrame.from_dict(stats, orient="index")
+    df.index = [name.rsplit(":", 1)[-1] + "  (" + name.rsplit(":", 1)[0].rsplit("/", 1)[-1] + ")" for name in df.index]
+    df["hit_rate"] = (df["hit_rate"] * 100).round(1).astype(str) + "%"
+    st.dataframe(df, use_container_width=True)
+else:
+    st.info("No memoized functions have been loaded yet.")
+
+if st.button("Clear memo caches", key="admin_clear_memos"):
+    clear_memos()
+    st.rerun()
+
+# ------ This session's spec cache ------
+st.subheader("Session spec cache")
+st.json(get_spec_cache().stats())
+
+# ------ Import cost (fresh interpreter, like python -X importtime) ------
+st.subheader("Import cost")
+st.caption("Cold-start cost of the modules the pages import. Measured in a separate interpreter, "
+           "since this server already has them loaded.")
+if st.button("Profile imports", key="admin_profile_imports"):
+    try:
+        with st.spinner("Importing entry modules under -X importtime…"):
+            st.session_state["admin_import_rows"] = profile_imports()
+    except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+        st.error(str(e))
+
+rows = st.session_state.get("admin_import_rows")
+if rows:
+    c1, c2 = st.columns(2)
+    with c1:
+        top = st.number_input("Show top", min_value=5, max_value=500, value=25, step=5, key="admin_import_top")
+    with c2:
+        depth = st.selectbox("Depth", ["Top-level only", "Two levels", "All"], key="admin_import_depth")
+    max_depth = {"Top-level only": 0, "Two levels": 1}.get(depth)
+    entry = [r for r in rows if r["module"] in ENTRY_MODULES and r["depth"] == 0]
+    st.metric("Entry modules, cold", f"{sum(r['cumulative_ms'] for r in entry):.0f} ms")
+    st.dataframe(pd.DataFrame(summarize(rows, top=int(top), max_depth=max_depth)),
+                 use_container_width=True, hide_index=True)
+
+finish_run()
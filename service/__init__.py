@@ -0,0 +1,2 @@
+# service/__init__.py
+# Headless HTTP API over the sizing calculators: `uvicorn service.app:app`.
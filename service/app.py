@@ -0,0 +1,258 @@
+# service/app.py
+from __future__ import annotations
+import math
+from typing import Any, Callable, Dict, List, Sequence
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from calculations import calculate_load_specs
+from service.batching import MicroBatcher
+from utils.cost import monthly_costs
+from utils.paralleling import optimize_fleet
+from utils.sizing import gph_for, gph_for_many
+
+# Headless JSON API over the same calculators the Streamlit pages use.
+#
+#   uvicorn service.app:app --host 0.0.0.0 --port 8080 --workers 4
+#
+# Every POST endpoint accepts one job object or a JSON list of them; a list is
+# computed in one worker-thread call and answered as a list in the same order.
+# Single /v1/gph requests are additionally coalesced across concurrent clients
+# (service/batching.py). All calculators are pure (the heavier ones memoized
+# process-wide), so the handlers never touch Streamlit state. The fault
+# endpoints load the fault store (and streamlit, which the widget module
+# imports) on first use only.
+
+GPH_BATCH_VECTORIZE_AT = 32   # below this a loop over gph_for beats building a DataFrame
+MAX_BATCH = 10_000
+MAX_FLEET_COMBOS = 2_000_000   # inventory-bounded mixes one /v1/fleet job may search (~0.6 s serial)
+
+class BadRequest(ValueError):
+    pass
+
+# ── Input parsing ────────────────────────────────────────────────────────────
+def _number(job: Dict[str, Any], name: str, default: Any = ..., *, integer: bool = False) -> Any:
+    value = job.get(name, default)
+    if value is ...:
+        raise BadRequest(f"'{name}' is required.")
+    if value is None:
+        return None
+    raw = value
+    try:
+        value = float(value)
+    except OverflowError:   # an int too big for a float
+        raise BadRequest(f"'{name}' must be finite.") from None
+    except (TypeError, ValueError):
+        raise BadRequest(f"'{name}' must be a number, got {raw!r}.") from None
+    if not math.isfinite(value):   # e.g. 1e400 in the JSON
+        raise BadRequest(f"'{name}' must be finite.")
+    if integer:
+        # int() would truncate: 2.5 units or "2.5" is a client error, not 2.
+        if not value.is_integer():
+            raise BadRequest(f"'{name}' must be a whole number, got {raw!r}.")
+        return raw if type(raw) is int else int(value)
+    return value
+
+def _text(job: Dict[str, Any], name: str, default: Any = ...) -> Any:
+    value = job.get(name, default)
+    if value is ...:
+        raise BadRequest(f"'{name}' is required.")
+    return None if value is None else str(value)
+
+async def _jobs(request: Request) -> tuple:
+    """(list of job dicts, whether the body was a list)."""
+    try:
+        body = await request.json()
+    except ValueError:
+        raise BadRequest("Body must be JSON.") from None
+    many = isinstance(body, list)
+    jobs = body if many else [body]
+    if not all(isinstance(j, dict) for j in jobs):
+        raise BadRequest("Each job must be a JSON object.")
+    if len(jobs) > MAX_BATCH:
+        raise BadRequest(f"At most {MAX_BATCH} jobs per request.")
+    return jobs, many
+
+def _json_safe(value: Any) -> Any:
+    """JSON has no inf/NaN: non-finite floats become null."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return value
+
+def _answer(results: List[Any], many: bool) -> JSONResponse:
+    return JSONResponse(_json_safe(results if many else results[0]))
+
+def endpoint(fn: Callable) -> Callable:
+    async def handler(request: Request) -> JSONResponse:
+        try:
+            return await fn(request)
+        except BadRequest as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+    return handler
+
+# ── Calculators ──────────────────────────────────────────────────────────────
+def _load_specs(job: Dict[str, Any]) -> Dict[str, Any]:
+    args = (_text(job, "eboss_model"), _text(job, "eboss_type"),
+            _number(job, "continuous_load"), _number(job, "max_peak_load"),
+            _text(job, "generator_kva", None), _number(job, "custom_charge_rate", None))
+    try:
+        return calculate_load_specs(*args).as_dict()
+    except ValueError as e:  # e.g. generator_kva not like "65kVA"
+        raise BadRequest(str(e)) from None
+
+def _gph_kwargs(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "model": _text(job, "model", None),
+        "type": _text(job, "type"),
+        "cont_kw": _number(job, "cont_kw"),
+        "gen_kw": _number(job, "gen_kw", None),
+        "size_kva": _number(job, "size_kva", None, integer=True),
+        "pm_gen": _number(job, "pm_gen", None, integer=True),
+    }
+
+def _gph_row(gph: float, load_pct: float, kva: int) -> Dict[str, Any]:
+    return {"gph": float(gph), "engine_load_percent": float(load_pct), "gen_kva_used": int(kva)}
+
+def _gph_batch(kwargs_list: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    if len(kwargs_list) < GPH_BATCH_VECTORIZE_AT:
+        return [_gph_row(*gph_for(**kw)) for kw in kwargs_list]
+    # gph_for only uses gen_kw/size_kva for standard units when both are given.
+    columns = {
+        "model": [kw["model"] or "" for kw in kwargs_list],
+        "type": [kw["type"] for kw in kwargs_list],
+        "cont_kw": [kw["cont_kw"] for kw in kwargs_list],
+        "pm_gen": [kw["pm_gen"] or 0 for kw in kwargs_list],
+        "std_gen_kw": [kw["gen_kw"] if kw["size_kva"] is not None and kw["gen_kw"] is not None else 0.0
+                       for kw in kwargs_list],
+        "std_gen_kva": [kw["size_kva"] if kw["gen_kw"] is not None and kw["size_kva"] is not None else 0
+                        for kw in kwargs_list],
+    }
+    frame = gph_for_many(columns)
+    return [_gph_row(*row) for row in frame.itertuples(index=False, name=None)]
+
+def _monthly(job: Dict[str, Any]) -> Dict[str, Any]:
+    return monthly_costs(
+        _number(job, "daily_runtime_hr"), _number(job, "fuel_gph"), _number(job, "fuel_cost_per_gal"),
+        _number(job, "rental", 0.0), _number(job, "delivery", 0.0), _number(job, "pm_cost", 0.0),
+        _number(job, "days_in_month", 30, integer=True),
+    ).as_dict()
+
+def _fleet(job: Dict[str, Any]) -> List[Dict[str, Any]]:
+    inventory = job.get("inventory")
+    if not isinstance(inventory, dict):
+        raise BadRequest("'inventory' must be an object of {model: quantity}.")
+    counts = {str(m): _number(inventory, m, integer=True) or 0 for m in inventory}
+    if any(q < 0 for q in counts.values()):
+        raise BadRequest("Inventory quantities must be 0 or more.")
+    if math.prod(q + 1 for q in counts.values()) > MAX_FLEET_COMBOS:
+        raise BadRequest(f"Inventory allows more than {MAX_FLEET_COMBOS:,} unit mixes; reduce the quantities.")
+    rates = job.get("daily_rates")
+    top_n = _number(job, "top_n", 3, integer=True)
+    if top_n < 1:
+        raise BadRequest("'top_n' must be 1 or more.")
+    try:
+        mixes = optimize_fleet(
+            _number(job, "required_cont_kw"), _number(job, "required_peak_kw"),
+            counts,
+            eboss_type=_text(job, "eboss_type", "Full Hybrid"),
+            objective=_text(job, "objective", "gph"),
+            pm_gen_kva=_number(job, "pm_gen_kva", None, integer=True),
+            fuel_price=_number(job, "fuel_price", 0.0),
+            daily_rates={str(m): float(r) for m, r in rates.items()} if isinstance(rates, dict) else None,
+            top_n=top_n,
+        )
+    except KeyError as e:   # unknown model name
+        raise BadRequest(str(e.args[0])) from None
+    except (TypeError, ValueError) as e:
+        raise BadRequest(str(e)) from None
+    return mixes
+
+def _map(fn: Callable[[Dict[str, Any]], Any], jobs: List[Dict[str, Any]]) -> List[Any]:
+    return [fn(job) for job in jobs]
+
+# ── Routes ───────────────────────────────────────────────────────────────────
+_gph_batcher = MicroBatcher(_gph_batch)
+
+async def health(request: Request) -> JSONResponse:
+    return JSONResponse({"status": "ok"})
+
+@endpoint
+async def load_specs(request: Request) -> JSONResponse:
+    jobs, many = await _jobs(request)
+    return _answer(await run_in_threadpool(_map, _load_specs, jobs), many)
+
+@endpoint
+async def gph(request: Request) -> JSONResponse:
+    jobs, many = await _jobs(request)
+    kwargs_list = [_gph_kwargs(job) for job in jobs]
+    if many:
+        return _answer(await run_in_threadpool(_gph_batch, kwargs_list), many)
+    return _answer([await _gph_batcher.submit(kwargs_list[0])], many)
+
+@endpoint
+async def monthly(request: Request) -> JSONResponse:
+    jobs, many = await _jobs(request)
+    return _answer(_map(_monthly, jobs), many)   # arithmetic only: no thread hop
+
+@endpoint
+async def fleet(request: Request) -> JSONResponse:
+    jobs, many = await _jobs(request)
+    return _answer(await run_in_threadpool(_map, _fleet, jobs), many)
+
+def _fault_store():
+    from fault_lookup_widget import get_fault_store
+    store = get_fault_store()
+    if store is None:
+        raise LookupError("Fault code data is not available.")
+    return store
+
+async def fault_lookup(request: Request) -> JSONResponse:
+    from fault_lookup_widget import normalize_user_input_code
+    equipment = request.path_params["equipment"]
+    code = normalize_user_input_code(request.path_params["code"])
+    if not code:
+        return JSONResponse({"error": "Invalid fault code."}, status_code=400)
+    try:
+        store = await run_in_threadpool(_fault_store)
+    except LookupError as e:
+        return JSONResponse({"error": str(e)}, status_code=503)
+    primary, alts = store.find(equipment, code)
+    if primary is None and not alts:
+        return JSONResponse({"error": f"No fault {code} found."}, status_code=404)
+    return JSONResponse({"result": primary, "alternatives": alts})
+
+async def fault_search(request: Request) -> JSONResponse:
+    query = request.query_params.get("q", "").strip()
+    if not query:
+        return JSONResponse({"error": "'q' is required."}, status_code=400)
+    try:
+        limit = max(1, min(100, int(request.query_params.get("limit", 10))))
+    except ValueError:
+        return JSONResponse({"error": "'limit' must be an integer."}, status_code=400)
+    equipment = request.query_params.get("equipment") or None
+    try:
+        store = await run_in_threadpool(_fault_store)
+    except LookupError as e:
+        return JSONResponse({"error": str(e)}, status_code=503)
+    hits = await run_in_threadpool(store.search, query, limit, equipment)
+    return JSONResponse({"results": hits})
+
+routes = [
+    Route("/health", health),
+    Route("/v1/load-specs", load_specs, methods=["POST"]),
+    Route("/v1/gph", gph, methods=["POST"]),
+    Route("/v1/monthly-costs", monthly, methods=["POST"]),
+    Route("/v1/fleet", fleet, methods=["POST"]),
+    Route("/v1/faults/search", fault_search),
+    Route("/v1/faults/{equipment}/{code}", fault_lookup),
+]
+
+app = Starlette(routes=routes)
@@ -0,0 +1,84 @@
+# test_fault_fetch.py
+# RemoteJSONCache against a local HTTP stand-in (no network): the fastest URL
+# wins the race, an unchanged payload is revalidated by ETag (304), and a set of
+# URLs that all fail yields None.
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from fault_fetch import RemoteJSONCache
+
+SLOW_S = 1.0
+
+class _Handler(BaseHTTPRequestHandler):
+    log: list = []
+
+    def log_message(self, *args):  # keep pytest output clean
+        pass
+
+    def _json(self, payload, etag=None):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.log.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/slow":
+            time.sleep(SLOW_S)
+            self._json({"src": "slow"})
+        elif self.path == "/fast":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+            else:
+                self._json({"src": "fast"}, etag='"v1"')
+        else:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+@pytest.fixture
+def server():
+    _Handler.log = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+@pytest.fixture
+def session():
+    with requests.Session() as s:
+        yield s
+
+def test_fastest_url_wins(server, session, tmp_path):
+    cache = RemoteJSONCache([f"{server}/slow", f"{server}/fast"], tmp_path, "faults", session=session)
+    start = time.perf_counter()
+    assert cache.refresh() == {"src": "fast"}
+    assert time.perf_counter() - start < SLOW_S
+    assert json.loads((tmp_path / "faults.meta.json").read_text())["url"] == f"{server}/fast"
+
+def test_unchanged_payload_is_revalidated_by_etag(server, session, tmp_path):
+    cache = RemoteJSONCache([f"{server}/fast"], tmp_path, "faults", session=session)
+    assert cache.refresh() == {"src": "fast"}
+    version = cache.version
+    assert cache.refresh() == {"src": "fast"}          # served from disk after a 304
+    assert _Handler.log == [("/fast", None), ("/fast", '"v1"')]
+    assert cache.version == version                    # payload not rewritten
+
+def test_all_failing_urls_return_none(server, session, tmp_path):
+    cache = RemoteJSONCache([f"{server}/missing", f"{server}/error"], tmp_path, "faults",
+                            session=session, timeout_s=2.0)
+    assert cache.refresh() is None
+    assert cache.get() is None
+    assert not (tmp_path / "faults.json").exists()
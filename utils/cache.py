@@ -0,0 +1,158 @@
+# utils/cache.py
+from __future__ import annotations
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Small bounded LRU cache with optional max age.
+#
+# Entries are evicted least-recently-used first once `maxsize` is reached, and an
+# entry older than `ttl` seconds counts as a miss (and is dropped) when read.
+# Operations take a lock, so one instance can be shared between threads.
+
+_MISSING = object()
+
+class LRUCache:
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = int(maxsize)
+        self.ttl = float(ttl) if ttl else None
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expired(self, stamp: float, now: float) -> bool:
+        return self.ttl is not None and now - stamp > self.ttl
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING and self._expired(entry[1], time.monotonic()):
+                del self._data[key]
+                self.expirations += 1
+                entry = _MISSING
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value, computing and storing it with factory() on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+            return default if entry is _MISSING else entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            return entry is not _MISSING and not self._expired(entry[1], time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __repr__(self) -> str:
+        s = self.stats()
+        return f"LRUCache(size={s['size']}/{s['maxsize']}, hits={s['hits']}, misses={s['misses']})"
+
+# ── Process-wide memoization ────────────────────────────────────────────────
+# Caches live in this module (imported once per server process), keyed by the
+# function's source file + qualname, so they survive Streamlit reruns that
+# re-define the function and are shared by every session. A changed function
+# body (hot reload) gets a fresh cache. Results are shared objects: treat them
+# as read-only.
+
+MEMO_MAXSIZE = int(os.environ.get("EBOSS_MEMO_MAXSIZE", "1024"))
+
+_MEMO_CACHES: Dict[str, Tuple[tuple, LRUCache]] = {}
+_MEMO_LOCK = threading.Lock()
+
+def _memo_cache(func: Callable, maxsize: Optional[int], ttl: Optional[float]) -> LRUCache:
+    code = getattr(func, "__code__", None)
+    name = f"{code.co_filename if code else func.__module__}:{func.__qualname__}"
+    # Constants and global names too: a hot reload that only edits a literal
+    # (say the 0.8 power factor) leaves co_code unchanged.
+    fingerprint = (code.co_code, code.co_consts, code.co_names) if code else ()
+    with _MEMO_LOCK:
+        entry = _MEMO_CACHES.get(name)
+        if entry is None or entry[0] != fingerprint:
+            entry = (fingerprint, LRUCache(maxsize=maxsize or MEMO_MAXSIZE, ttl=ttl))
+            _MEMO_CACHES[name] = entry
+        return entry[1]
+
+def memoize(func: Optional[Callable] = None, *, maxsize: Optional[int] = None, ttl: Optional[float] = None):
+    """
+    Cache a pure function's results per process (all sessions share them).
+    Size defaults to EBOSS_MEMO_MAXSIZE; calls with unhashable arguments run uncached.
+    """
+    def decorate(f: Callable) -> Callable:
+        cache = _memo_cache(f, maxsize, ttl)
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            try:
+                hash(key)
+            except TypeError:
+                return f(*args, **kwargs)
+            return cache.get_or_set(key, lambda: f(*args, **kwargs))
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+def memo_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every memoized function, keyed by 'file:qualname'."""
+    with _MEMO_LOCK:
+        items = list(_MEMO_CACHES.items())
+    return {name: cache.stats() for name, (_, cache) in items}
+
+def clear_memos() -> None:
+    with _MEMO_LOCK:
+        items = list(_MEMO_CACHES.values())
+    for _, cache in items:
+        cache.clear()
+
+__all__ = ["LRUCache", "MEMO_MAXSIZE", "clear_memos", "memo_stats", "memoize"]
@@ -0,0 +1,217 @@
+# utils/compare.py
+from __future__ import annotations
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+from calculations import calculate_load_specs, calculate_standard_generator_specs
+from utils.data import STANDARD_GENERATOR_DATA
+from utils.registry import MODEL_NAMES
+from utils.results import Comparison
+from utils.spec_table import spec_table
+
+# EBOSS-vs-standard comparison, materialized.
+#
+# The comparison table used to call calculate_load_specs and
+# calculate_standard_generator_specs and redo the per-day arithmetic on every
+# rerun. Its inputs are all small discrete sets, so comparison_matrix() evaluates
+# every combination once per process:
+#
+#   EBOSS model  x  configuration (Full Hybrid, or Power Module + generator kVA)
+#                x  STANDARD_GENERATOR_DATA size  x  integer continuous kW 0..MAX_LOAD_KW
+#
+# The load-independent EBOSS and standard-generator figures come from the
+# calculators themselves (a few dozen calls); the load axis is NumPy. A rerun is
+# then an index lookup. Anything off the grid (custom charge rate, fractional kW)
+# goes through compare() the slow way, with identical formulas.
+
+MAX_LOAD_KW = 500                      # the app's continuous-load input range
+DAYS_PER_MONTH = 30
+EBOSS_CO2_LB_PER_GAL = 22.4
+PM_GENERATOR_OPTIONS = ("25kVA", "45kVA", "65kVA", "125kVA", "220kVA", "400kVA")
+
+# (eboss_type, generator_kva) pairs along the configuration axis
+CONFIGS: Tuple[Tuple[str, Optional[str]], ...] = (("Full Hybrid", None),) + tuple(
+    ("Power Module", kva) for kva in PM_GENERATOR_OPTIONS)
+
+_METRICS = ("engine_load_percent", "fuel_gph", "fuel_per_day", "fuel_per_month", "co2_per_day")
+
+# ── Per-day rollups (shared by the matrix and the scalar path) ───────────────
+def _eboss_per_day(gph, battery_kwh, charge_time_h, load_kw):
+    """Fuel/day when the generator only runs to recharge: charge hours x cycles/day."""
+    load_kw = np.asarray(load_kw, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        battery_life = np.where(load_kw > 0, battery_kwh / load_kw, 0.0)
+        runs = (charge_time_h > 0) & (battery_life > 0)
+        per_day = np.where(runs, gph * charge_time_h * 24.0 / (charge_time_h + battery_life), 0.0)
+    return per_day
+
+def eboss_runtime_per_day(battery_kwh, charge_time_h, load_kw):
+    """Generator hours per day for an EBOSS at `load_kw` (its fuel/day at 1 GPH)."""
+    return _eboss_per_day(1.0, battery_kwh, charge_time_h, load_kw)
+
+def _standard_gph(gen: dict, load_kw):
+    gen_kw = float(gen["kw"])
+    frac = np.asarray(load_kw, dtype=np.float64) / gen_kw if gen_kw > 0 else np.zeros(np.shape(load_kw))
+    curve = gen["fuel_consumption_gph"]
+    return np.select([frac <= 0.5, frac <= 0.75], [curve["50%"], curve["75%"]], curve["100%"]), frac * 100.0
+
+# ── Matrix ───────────────────────────────────────────────────────────────────
+class ComparisonMatrix:
+    """
+    eboss[metric] has shape (model, config, load); standard[metric] (size, load);
+    diff[metric] (model, config, size, load) = EBOSS minus standard.
+    """
+    __slots__ = ("models", "configs", "sizes", "loads", "eboss", "standard", "diff",
+                 "_model_ix", "_config_ix", "_size_ix")
+
+    def __init__(self, models=MODEL_NAMES, configs=CONFIGS, sizes=None, max_load_kw: int = MAX_LOAD_KW):
+        self.models = tuple(models)
+        self.configs = tuple(configs)
+        self.sizes = tuple(sizes if sizes is not None else STANDARD_GENERATOR_DATA)
+        self.loads = np.arange(int(max_load_kw) + 1, dtype=np.float64)
+        self._model_ix = {m: i for i, m in enumerate(self.models)}
+        self._config_ix = {c: i for i, c in enumerate(self.configs)}
+        self._size_ix = {s: i for i, s in enumerate(self.sizes)}
+
+        shape = (len(self.models), len(self.configs), 1)
+        gph, load_pct, kwh, charge_h = (np.zeros(shape) for _ in range(4))
+        for i, model in enumerate(self.models):
+            for j, (eboss_type, gen_kva) in enumerate(self.configs):
+                specs = calculate_load_specs(model, eboss_type, 0, 0, gen_kva, None)
+                gph[i, j] = specs["fuel_consumption_gph"] or 0.0
+                load_pct[i, j] = specs["engine_load_percent"]
+                kwh[i, j] = specs["battery_capacity"]
+                charge_h[i, j] = specs["charge_time"]
+        per_day = _eboss_per_day(gph, kwh, charge_h, self.loads)
+        full = per_day.shape
+        self.eboss: Dict[str, np.ndarray] = {
+            "engine_load_percent": np.broadcast_to(load_pct, full),
+            "fuel_gph": np.broadcast_to(gph, full),
+            "fuel_per_day": per_day,
+            "fuel_per_month": per_day * DAYS_PER_MONTH,
+            "co2_per_day": per_day * EBOSS_CO2_LB_PER_GAL,
+        }
+
+        std = {name: np.zeros((len(self.sizes), len(self.loads))) for name in _METRICS}
+        for k, size in enumerate(self.sizes):
+            gen = STANDARD_GENERATOR_DATA[size]
+            s_gph, s_pct = _standard_gph(gen, self.loads)
+            std["engine_load_percent"][k] = s_pct
+            std["fuel_gph"][k] = s_gph
+            std["fuel_per_day"][k] = s_gph * 24.0
+            std["fuel_per_month"][k] = s_gph * 24.0 * DAYS_PER_MONTH
+            std["co2_per_day"][k] = s_gph * 24.0 * gen["co2_per_gal"]
+        self.standard = std
+
+        self.diff = {name: self.eboss[name][:, :, None, :] - std[name][None, None, :, :] for name in _METRICS}
+        for arr in (*self.eboss.values(), *self.standard.values(), *self.diff.values()):
+            arr.flags.writeable = False
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for d in (self.eboss, self.standard, self.diff) for a in d.values()
+                   if a.base is None)
+
+    def index(self, model: str, eboss_type: str, generator_kva: Optional[str],
+              standard_size: str, load_kw: float) -> Optional[Tuple[int, int, int, int]]:
+        """(model, config, size, load) indices, or None when the point is not on the grid."""
+        config = (eboss_type, generator_kva if eboss_type == "Power Module" else None)
+        i, j, k = self._model_ix.get(model), self._config_ix.get(config), self._size_ix.get(standard_size)
+        try:
+            load = float(load_kw)
+        except (TypeError, ValueError):
+            return None
+        if i is None or j is None or k is None or not load.is_integer() or not 0 <= load < len(self.loads):
+            return None
+        return i, j, k, int(load)
+
+    def row(self, ix: Tuple[int, int, int, int]) -> Comparison:
+        i, j, k, n = ix
+        values = {}
+        for name in _METRICS:
+            values[f"eboss_{name}"] = float(self.eboss[name][i, j, n])
+            values[f"standard_{name}"] = float(self.standard[name][k, n])
+            values[f"diff_{name}"] = float(self.diff[name][i, j, k, n])
+        return Comparison(**values)
+
+    def along_load(self, model: str, eboss_type: str, generator_kva: Optional[str],
+                   standard_size: str, metric: str = "fuel_per_day") -> Optional[Dict[str, np.ndarray]]:
+        """{"load_kw", "eboss", "standard", "diff"} arrays over every load for one pairing (views)."""
+        ix = self.index(model, eboss_type, generator_kva, standard_size, 0)
+        if ix is None:
+            return None
+        i, j, k, _ = ix
+        return {"load_kw": self.loads, "eboss": self.eboss[metric][i, j], "standard": self.standard[metric][k],
+                "diff": self.diff[metric][i, j, k]}
+
+_MATRIX: Optional[ComparisonMatrix] = None
+
+def comparison_matrix() -> ComparisonMatrix:
+    """The process-wide matrix, built on first use."""
+    global _MATRIX
+    if _MATRIX is None:
+        _MATRIX = ComparisonMatrix()
+    return _MATRIX
+
+def _compare_direct(model, eboss_type, generator_kva, standard_size, load_kw, custom_charge_rate) -> Optional[Comparison]:
+    standard = calculate_standard_generator_specs(standard_size, load_kw, 0)
+    if not standard:
+        return None
+    specs = calculate_load_specs(model, eboss_type, load_kw, 0, generator_kva, custom_charge_rate)
+    gph = specs["fuel_consumption_gph"] or 0.0
+    per_day = float(_eboss_per_day(gph, specs["battery_capacity"], specs["charge_time"], load_kw))
+    gen = STANDARD_GENERATOR_DATA[standard_size]
+    eboss = {"engine_load_percent": specs["engine_load_percent"], "fuel_gph": gph, "fuel_per_day": per_day,
+             "fuel_per_month": per_day * DAYS_PER_MONTH, "co2_per_day": per_day * EBOSS_CO2_LB_PER_GAL}
+    std = {"engine_load_percent": (load_kw / gen["kw"] * 100) if gen["kw"] > 0 else 0.0,
+           "fuel_gph": standard["fuel_consumption_gph"], "fuel_per_day": standard["fuel_per_day"],
+           "fuel_per_month": standard["fuel_per_month"], "co2_per_day": standard["co2_per_day"]}
+    values = {}
+    for name in _METRICS:
+        values[f"eboss_{name}"] = float(eboss[name])
+        values[f"standard_{name}"] = float(std[name])
+        values[f"diff_{name}"] = float(eboss[name] - std[name])
+    return Comparison(**values)
+
+def compare(model: str, eboss_type: str, generator_kva: Optional[str], standard_size: str,
+            load_kw: float, custom_charge_rate: Optional[float] = None) -> Optional[Comparison]:
+    """
+    EBOSS vs standard generator at one continuous load. A slice of the matrix when
+    the inputs are on its grid, otherwise computed directly. None for an unknown
+    standard size.
+    """
+    if not custom_charge_rate:
+        matrix = comparison_matrix()
+        ix = matrix.index(model, eboss_type, generator_kva, standard_size, load_kw)
+        if ix is not None:
+            return matrix.row(ix)
+    return _compare_direct(model, eboss_type, generator_kva, standard_size, float(load_kw or 0), custom_charge_rate)
+
+def spec_differences(model: str, standard_size: str, rows: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Difference column of the spec comparison, {row: "+9 A"}, for `rows` = {row: sheet label}.
+    Taken from the compiled comparison sheets' value arrays, on the first unit both sides
+    share; "N/A" when there is nothing to subtract.
+    """
+    eboss, standard = spec_table("EBOSS_COMPARISON_SPECS"), spec_table("STANDARD_COMPARISON_SPECS")
+    diffs, units = eboss.differences(model, standard, standard_size, list(rows.values()))
+    out = {}
+    for row, diff, unit in zip(rows, diffs.tolist(), units):
+        if np.isnan(diff):
+            out[row] = "N/A"
+        else:
+            text = f"{diff:+,.0f}" if float(diff).is_integer() else f"{diff:+,.1f}"
+            out[row] = f"{text} {unit}".rstrip()
+    return out
+
+__all__ = [
+    "CONFIGS",
+    "ComparisonMatrix",
+    "MAX_LOAD_KW",
+    "PM_GENERATOR_OPTIONS",
+    "compare",
+    "comparison_matrix",
+    "eboss_runtime_per_day",
+    "spec_differences",
+]
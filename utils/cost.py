@@ -1,17 +1,35 @@
+# utils/cost.py
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+if TYPE_CHECKING:  # pandas is only needed by the sweep API; imported there on first use
+    import pandas as pd
+
+from utils.results import MonthlyCosts
+
+CO2_LB_PER_GAL = 22.4  # diesel approx
+MAX_SWEEP_POINTS = 5_000_000   # ~0.5 GB of float64 columns in the tidy frame
+
+# The swept inputs, in grid-axis order (after the optional site axis).
+SWEEP_PARAMS = ("fuel_price", "rental", "delivery", "pm_cost", "daily_runtime_hr")
+
+Range = Union[float, Sequence[float], np.ndarray]
+
 def monthly_costs(daily_runtime_hr: float,
                   fuel_gph: float,
                   fuel_cost_per_gal: float,
                   rental: float,
                   delivery: float,
                   pm_cost: float,
-                  days_in_month: int):
+                  days_in_month: int) -> MonthlyCosts:
     monthly_hours = float(daily_runtime_hr) * float(days_in_month)
     gallons = monthly_hours * float(fuel_gph)
     fuel_total = gallons * float(fuel_cost_per_gal)
     total_cost = float(rental) + float(delivery) + float(pm_cost) + fuel_total
-    CO2_LB_PER_GAL = 22.4  # diesel approx
     co2_tons = (gallons * CO2_LB_PER_GAL) / 2000.0
-    return dict(
+    return MonthlyCosts(
         monthly_hours=monthly_hours,
         gallons=gallons,
         fuel_total=fuel_total,
@@ -19,3 +37,144 @@ def monthly_costs(daily_runtime_hr: float,
         co2_tons=co2_tons,
     )
 
+def monthly_costs_many(daily_runtime_hr, fuel_gph, fuel_cost_per_gal,
+                       rental, delivery, pm_cost, days_in_month=30) -> Dict[str, np.ndarray]:
+    """
+    monthly_costs() over arrays, with NumPy broadcasting (scalars, equal-length
+    arrays or mutually broadcastable grids). Returns {MonthlyCosts field: array}.
+    """
+    monthly_hours = np.asarray(daily_runtime_hr, dtype=np.float64) * np.asarray(days_in_month, dtype=np.float64)
+    gallons = monthly_hours * np.asarray(fuel_gph, dtype=np.float64)
+    fuel_total = gallons * np.asarray(fuel_cost_per_gal, dtype=np.float64)
+    fixed = (np.asarray(rental, dtype=np.float64) + np.asarray(delivery, dtype=np.float64)
+             + np.asarray(pm_cost, dtype=np.float64))
+    return {
+        "monthly_hours": monthly_hours,
+        "gallons": gallons,
+        "fuel_total": fuel_total,
+        "total_cost": fixed + fuel_total,
+        "co2_tons": gallons * (CO2_LB_PER_GAL / 2000.0),
+    }
+
+# ── Sensitivity sweeps ───────────────────────────────────────────────────────
+def span(low: float, high: float, steps: int = 5) -> np.ndarray:
+    """Evenly spaced sweep values from low to high inclusive, e.g. span(3.5, 5.0, 7)."""
+    if steps < 1:
+        raise ValueError("steps must be at least 1.")
+    return np.linspace(float(low), float(high), int(steps))
+
+def _axis(name: str, values: Range) -> np.ndarray:
+    arr = np.atleast_1d(np.asarray(values, dtype=np.float64))
+    if arr.ndim != 1 or arr.size == 0:
+        raise ValueError(f"'{name}' must be a number or a non-empty 1-D range.")
+    if not np.isfinite(arr).all():
+        raise ValueError(f"'{name}' must be finite.")
+    return arr
+
+def _site_axis(fuel_gph: Union[float, Mapping[str, float]]) -> Tuple[Optional[List[str]], np.ndarray]:
+    if isinstance(fuel_gph, Mapping):
+        if not fuel_gph:
+            raise ValueError("'fuel_gph' needs at least one site.")
+        return [str(s) for s in fuel_gph], _axis("fuel_gph", list(fuel_gph.values()))
+    return None, _axis("fuel_gph", fuel_gph)
+
+def sweep_grid(*, fuel_gph: Union[float, Mapping[str, float]],
+               fuel_price: Range, rental: Range = 0.0, delivery: Range = 0.0,
+               pm_cost: Range = 0.0, daily_runtime_hr: Range = 24.0,
+               days_in_month: int = 30) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Evaluate monthly_costs over the full Cartesian grid of the given ranges.
+
+    `fuel_gph` is one burn rate or {site name: GPH} to price many sites at once;
+    every other input is a number or a range of values (see span()).
+    Returns (axes, results): axes maps each grid dimension ("site"/"fuel_gph",
+    then SWEEP_PARAMS) to its values, and results holds one N-D array per
+    MonthlyCosts field, shaped by those axes in order. Nothing is materialized
+    beyond the result arrays: inputs broadcast as 1-D vectors along their axis.
+    """
+    sites, gph = _site_axis(fuel_gph)
+    axes: Dict[str, np.ndarray] = {"site" if sites is not None else "fuel_gph":
+                                   np.array(sites, dtype=object) if sites is not None else gph}
+    ranges = dict(fuel_price=fuel_price, rental=rental, delivery=delivery,
+                  pm_cost=pm_cost, daily_runtime_hr=daily_runtime_hr)
+    for name in SWEEP_PARAMS:
+        axes[name] = _axis(name, ranges[name])
+
+    shape = tuple(len(v) for v in axes.values())
+    points = int(np.prod(shape))
+    if points > MAX_SWEEP_POINTS:
+        raise ValueError(f"Sweep has {points:,} points; the limit is {MAX_SWEEP_POINTS:,}. Use fewer steps.")
+
+    def along(i: int, values: np.ndarray) -> np.ndarray:
+        return values.reshape([-1 if j == i else 1 for j in range(len(shape))])
+
+    grid = {name: along(i + 1, axes[name]) for i, name in enumerate(SWEEP_PARAMS)}
+    results = monthly_costs_many(grid["daily_runtime_hr"], along(0, gph), grid["fuel_price"],
+                                 grid["rental"], grid["delivery"], grid["pm_cost"], days_in_month)
+    results = {k: np.broadcast_to(v, shape) for k, v in results.items()}
+    return axes, results
+
+def cost_sweep(*, fuel_gph: Union[float, Mapping[str, float]],
+               fuel_price: Range, rental: Range = 0.0, delivery: Range = 0.0,
+               pm_cost: Range = 0.0, daily_runtime_hr: Range = 24.0,
+               days_in_month: int = 30) -> "pd.DataFrame":
+    """
+    Tidy DataFrame of sweep_grid(): one row per grid point, one column per
+    input ("site" as a categorical when sites were given, plus "fuel_gph")
+    and per MonthlyCosts field.
+    """
+    import pandas as pd
+    axes, results = sweep_grid(fuel_gph=fuel_gph, fuel_price=fuel_price, rental=rental,
+                               delivery=delivery, pm_cost=pm_cost,
+                               daily_runtime_hr=daily_runtime_hr, days_in_month=days_in_month)
+    gph = _site_axis(fuel_gph)[1]
+    shape = next(iter(results.values())).shape
+    index = np.indices(shape).reshape(len(shape), -1)   # per-row position on each axis
+    columns = {}
+    for i, (name, values) in enumerate(axes.items()):
+        if name == "site":
+            columns["site"] = pd.Categorical.from_codes(index[i], categories=list(values))
+            columns["fuel_gph"] = gph[index[i]]
+        else:
+            columns[name] = values[index[i]]
+    for name, arr in results.items():
+        columns[name] = arr.reshape(-1)
+    return pd.DataFrame(columns)
+
+def tornado(frame: "pd.DataFrame", value: str = "total_cost",
+            params: Sequence[str] = SWEEP_PARAMS) -> "pd.DataFrame":
+    """
+    Tornado-chart rows from a cost_sweep() frame: for each swept input, the mean
+    `value` at its lowest and highest setting (averaged over every other input),
+    sorted by swing, largest first. Inputs held at a single value are skipped.
+    """
+    import pandas as pd
+    rows = []
+    for name in params:
+        if name not in frame or frame[name].nunique() < 2:
+            continue
+        means = frame.groupby(name, observed=True)[value].mean()
+        low, high = means.index.min(), means.index.max()
+        rows.append({"parameter": name, "low": low, "high": high,
+                     "value_at_low": means[low], "value_at_high": means[high],
+                     "swing": abs(means[high] - means[low])})
+    out = pd.DataFrame(rows, columns=["parameter", "low", "high", "value_at_low", "value_at_high", "swing"])
+    return out.sort_values("swing", ascending=False, ignore_index=True)
+
+def heatmap(frame: "pd.DataFrame", x: str, y: str, value: str = "total_cost",
+            agg: str = "mean") -> "pd.DataFrame":
+    """`value` aggregated over every other input, as a y-by-x table ready for a heatmap."""
+    return frame.pivot_table(index=y, columns=x, values=value, aggfunc=agg, observed=True)
+
+__all__ = [
+    "CO2_LB_PER_GAL",
+    "MAX_SWEEP_POINTS",
+    "SWEEP_PARAMS",
+    "cost_sweep",
+    "heatmap",
+    "monthly_costs",
+    "monthly_costs_many",
+    "span",
+    "sweep_grid",
+    "tornado",
+]
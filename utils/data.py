@@ -24,168 +24,563 @@ def charge_rate_for(model_name: str, eboss_type: str) -> float:
     return float(rec.get("fh_charge_rate" if eboss_type == "Full Hybrid" else "pm_charge_rate", 0.0))
 
 
-EBOSS_SPECS = {
-    "EBOSS 25 kVA": {
-        "Three-phase": "30 kva / 24 kw",
-        "Single-phase": "20 kva / 16 kw",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120/240 (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Amp-load @ 208V": "70 A / 13.5 kW",
-        "Amp-load @ 480V": "30 A / 19 kW",
-        "Motor start (3 sec @ 208V)": "104 A / 19.5 kW",
-        "Motor start (3 sec @ 480V)": "45 A / 29 kW",
-        "Generator size": "Airman SDG25",
-        "Three-phase output": "23 kva / 19 kw",
-        "Single-phase output": "20 kva / 16 kw",
-        "Battery chemistry": "Lithium Titanate Oxide (LTO)",
-        "Battery capacity": "15 kwh",
-        "Energy throughput": "1,200 mwh",
-        "Charge time (no load)": "< 45 min",
-        "Inverter output max": "24 kw",
-        "Parallel capability": "Available",
-        "Battery type": "Lithium Titanate Oxide (LTO)",
-        "Cycle life @ 77°F": "90K Cycles at 90% DOD",
-        "Cycle life @ 100°F": "80K Cycles at 90% DOD",
-        "Life @ 3kW load (100°F)": "41 Years",
-        "Inverter cold start (min)": "14°F",
-        "Running temp range": "-22°F to 130°F",
-        "Arctic package (optional)": "-50°F to 130°F",
-        "EBOSS only (L×W×H)": "40” x 48” x 46”",
-        "EBOSS weight only": "2,120 lbs",
-        "With trailer & generator": "160” x 74” x 75”",
-        "Total weight (no fuel / full)": "5100 / 5500 lbs",
-        "Fuel tank capacity": "51.5 gal",
-    },
-    "EBOSS 70 kVA": {
-        "Three-phase": "70 kVA / 56 kW",
-        "Single-phase": "47 kVA / 37 kW",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120/240 (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Amp-load @ 208V": "194 A 37.2 kW",
-        "Amp-load @ 480V": "84 A / 55 kW",
-        "Motor start (3 sec @ 208V)": "291 A / 55 kW",
-        "Motor start (3 sec @ 480V)": "126 A / 175  kW",
-        "Generator size": "Airman SDG45",
-        "Three-phase output": "42 kVA / 33 kW",
-        "Single-phase output": "28 kVA / 22 kW",
-        "Battery chemistry": "Lithium Titanate Oxide (LTO)",
-        "Battery capacity": "25 kWh",
-        "Energy throughput": "2,000 MWh",
-        "Charge time (no load)": "≈ 45 Minutes",
-        "Inverter output max": "56 kW",
-        "Parallel capability": "Available",
-        "Battery type": "Lithium Titanate Oxide (LTO)",
-        "Cycle life @ 77°F": "90K Cycles at 90% DOD",
-        "Cycle life @ 100°F": "80K Cycles at 90% DOD",
-        "Life @ 3kW load (100°F)": "20 Years",
-        "Inverter cold start (min)": "14°F",
-        "Running temp range": "-22°F to 130°F",
-        "Arctic package (optional)": "-50°F to 130°F",
-        "EBOSS only (L×W×H)": "55” x 44” x 62”",
-        "EBOSS weight only": "2,700 lbs",
-        "With trailer & generator": "167” x 71” x 76”",
-        "Total weight (no fuel / full)": "6950 / 7600 lbs",
-        "Fuel tank capacity": "80.5 gal",
-    },
-    "EBOSS 125 kVA": {
-        "Three-phase": "125 kVA / 100 kW",
-        "Single-phase": "N/A / N/A",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120V (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Amp-load @ 208V": "345 A 66.2 kW",
-        "Amp-load @ 480V": "150 A / 99 kW",
-        "Motor start (3 sec @ 208V)": "532 A / 291 kW",
-        "Motor start (3 sec @ 480V)": "231  / 532 kW",
-        "Generator size": "Airman SDG65",
-        "Three-phase output": "62 kVA / 50 kW",
-        "Single-phase output": "2.4 kW x 2",
-        "Battery chemistry": "Lithium Titanate Oxide (LTO)",
-        "Battery capacity": "50 kWh",
-        "Energy throughput": "4,000 MWh",
-        "Charge time (no load)": "= 1 Hour",
-        "Inverter output max": "100 kW",
-        "Parallel capability": "Available",
-        "Battery type": "Lithium Titanate Oxide (LTO)",
-        "Cycle life @ 77°F": "90K Cycles at 90% DOD",
-        "Cycle life @ 100°F": "80K Cycles at 90% DOD",
-        "Life @ 3kW load (100°F)": "20 Years",
-        "Inverter cold start (min)": "14°F",
-        "Running temp range": "-22°F to 130°F",
-        "Arctic package (optional)": "-50°F to 130°F",
-        "EBOSS only (L×W×H)": "≈ 73.5” x 61” x 104.5”",
-        "EBOSS weight only": "9,600 lbs",
-        "With trailer & generator": "233” x 52” x 97”",
-        "Total weight (no fuel / full)": "≈ 18,000 lbs",
-        "Fuel tank capacity": "111 gal",
-    },
-    "EBOSS 220 kVA": {
-        "Three-phase": "220 kVA / 176 kW",
-        "Single-phase": "N/A / N/A",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120V (1Φ) • 208/480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Amp-load @ 208V": "700 A / 134 kW",
-        "Amp-load @ 480V": "303 A / 201 kW",
-        "Motor start (3 sec @ 208V)": "1065 A / 204 kW",
-        "Motor start (3 sec @ 480V)": "461 A / 708 kW",
-        "Generator size": "Airman SDG125",
-        "Three-phase output": "120 kVA / 96 kW",
-        "Single-phase output": "2.4 kW x 2",
-        "Battery chemistry": "Lithium Titanate Oxide (LTO)",
-        "Battery capacity": "75 kWh",
-        "Energy throughput": "6,000 MWh",
-        "Charge time (no load)": "≈ 50 Minutes",
-        "Inverter output max": "176 kW",
-        "Parallel capability": "Available",
-        "Battery type": "Lithium Titanate Oxide (LTO)",
-        "Cycle life @ 77°F": "90K Cycles at 90% DOD",
-        "Cycle life @ 100°F": "80K Cycles at 90% DOD",
-        "Life @ 3kW load (100°F)": "20 Years",
-        "Inverter cold start (min)": "14°F",
-        "Running temp range": "-22°F to 130°F",
-        "Arctic package (optional)": "-50°F to 130°F",
-        "EBOSS only (L×W×H)": "≈73.5” x 61” x 104.5”",
-        "EBOSS weight only": "11,200 lbs",
-        "With trailer & generator": "≈249” x 52” x 97”",
-        "Total weight (no fuel / full)": "≈21,000 lbs",
-        "Fuel tank capacity": "168 gal",
-    },
-    "EBOSS 400 kVA": {
-        "Three-phase": "400 kVA / 320 kW",
-        "Single-phase": "N/A",
-        "Frequency": "60 Hz",
-        "Simultaneous voltage": "120V (Courtesy Outlets) • 480 (3Φ)",
-        "Voltage regulation": "Adjustable",
-        "Amp-load @ 208V": "481 A / 92.5 kW",
-        "Amp-load @ 480V": "769 A / 319 kW",
-        "Motor start (3 sec @ 208V)": "1776 A / 341 kW",
-        "Motor start (3 sec @ 480V)": "769 A / 511 kW",
-        "Generator size": "Airman SDG220",
-        "Three-phase output": "210 kVA / 168 kW",
-        "Single-phase output": "2.4 kW x 2",
-        "Battery chemistry": "Lithium Titanate Oxide (LTO)",
-        "Battery capacity": "125 kWh",
-        "Energy throughput": "10,000 MWh",
-        "Charge time (no load)": "≈ 45 Minutes",
-        "Inverter output max": "320 kW",
-        "Parallel capability": "Available",
-        "Battery type": "Lithium Titanate Oxide (LTO)",
-        "Cycle life @ 77°F": "90K Cycles at 90% DOD",
-        "Cycle life @ 100°F": "80K Cycles at 90% DOD",
-        "Life @ 3kW load (100°F)": "21 Years",
-        "Inverter cold start (min)": "14°F",
-        "Running temp range": "-22°F to 130°F",
-        "Arctic package (optional)": "-50°F to 130°F",
-        "EBOSS only (L×W×H)": "≈ TBD",
-        "EBOSS weight only": "11,037 lbs",
-        "With trailer & generator": "≈ 262” x 74” x 75”",
-        "Total weight (no fuel / full)": "≈ 21,600 lbs / 24,000 lbs",
-        "Fuel tank capacity": "285 gal",
-    },
-}
+# ── Large display tables: loaded lazily ─────────────────────────────────────
+# EBOSS_SPECS, EBOSS_SPEC_SHEET, STANDARD_GENERATOR_DATA and the two comparison
+# sheets are resolved on first access by the module __getattr__ below, which
+# calls these literal builders. (Building them takes tens of µs, several times
+# less than reading them back from the binary snapshot, so utils/snapshot.py
+# only holds the fault data.)
+
+def _eboss_specs_literal() -> dict:
+    """Per-model spec sheet: {"EBOSS 25 kVA": {label: display value}}."""
+    return {
+        "EBOSS 25 kVA": {
+            "Three-phase": "30 kva / 24 kw",
+            "Single-phase": "20 kva / 16 kw",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "120/240 (1Φ) • 208/480 (3Φ)",
+            "Voltage regulation": "Adjustable",
+            "Amp-load @ 208V": "70 A / 13.5 kW",
+            "Amp-load @ 480V": "30 A / 19 kW",
+            "Motor start (3 sec @ 208V)": "104 A / 19.5 kW",
+            "Motor start (3 sec @ 480V)": "45 A / 29 kW",
+            "Generator size": "Airman SDG25",
+            "Three-phase output": "23 kva / 19 kw",
+            "Single-phase output": "20 kva / 16 kw",
+            "Battery chemistry": "Lithium Titanate Oxide (LTO)",
+            "Battery capacity": "15 kwh",
+            "Energy throughput": "1,200 mwh",
+            "Charge time (no load)": "< 45 min",
+            "Inverter output max": "24 kw",
+            "Parallel capability": "Available",
+            "Battery type": "Lithium Titanate Oxide (LTO)",
+            "Cycle life @ 77°F": "90K Cycles at 90% DOD",
+            "Cycle life @ 100°F": "80K Cycles at 90% DOD",
+            "Life @ 3kW load (100°F)": "41 Years",
+            "Inverter cold start (min)": "14°F",
+            "Running temp range": "-22°F to 130°F",
+            "Arctic package (optional)": "-50°F to 130°F",
+            "EBOSS only (L×W×H)": "40” x 48” x 46”",
+            "EBOSS weight only": "2,120 lbs",
+            "With trailer & generator": "160” x 74” x 75”",
+            "Total weight (no fuel / full)": "5100 / 5500 lbs",
+            "Fuel tank capacity": "51.5 gal",
+        },
+        "EBOSS 70 kVA": {
+            "Three-phase": "70 kVA / 56 kW",
+            "Single-phase": "47 kVA / 37 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "120/240 (1Φ) • 208/480 (3Φ)",
+            "Voltage regulation": "Adjustable",
+            "Amp-load @ 208V": "194 A 37.2 kW",
+            "Amp-load @ 480V": "84 A / 55 kW",
+            "Motor start (3 sec @ 208V)": "291 A / 55 kW",
+            "Motor start (3 sec @ 480V)": "126 A / 175  kW",
+            "Generator size": "Airman SDG45",
+            "Three-phase output": "42 kVA / 33 kW",
+            "Single-phase output": "28 kVA / 22 kW",
+            "Battery chemistry": "Lithium Titanate Oxide (LTO)",
+            "Battery capacity": "25 kWh",
+            "Energy throughput": "2,000 MWh",
+            "Charge time (no load)": "≈ 45 Minutes",
+            "Inverter output max": "56 kW",
+            "Parallel capability": "Available",
+            "Battery type": "Lithium Titanate Oxide (LTO)",
+            "Cycle life @ 77°F": "90K Cycles at 90% DOD",
+            "Cycle life @ 100°F": "80K Cycles at 90% DOD",
+            "Life @ 3kW load (100°F)": "20 Years",
+            "Inverter cold start (min)": "14°F",
+            "Running temp range": "-22°F to 130°F",
+            "Arctic package (optional)": "-50°F to 130°F",
+            "EBOSS only (L×W×H)": "55” x 44” x 62”",
+            "EBOSS weight only": "2,700 lbs",
+            "With trailer & generator": "167” x 71” x 76”",
+            "Total weight (no fuel / full)": "6950 / 7600 lbs",
+            "Fuel tank capacity": "80.5 gal",
+        },
+        "EBOSS 125 kVA": {
+            "Three-phase": "125 kVA / 100 kW",
+            "Single-phase": "N/A / N/A",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "120V (1Φ) • 208/480 (3Φ)",
+            "Voltage regulation": "Adjustable",
+            "Amp-load @ 208V": "345 A 66.2 kW",
+            "Amp-load @ 480V": "150 A / 99 kW",
+            "Motor start (3 sec @ 208V)": "532 A / 291 kW",
+            "Motor start (3 sec @ 480V)": "231  / 532 kW",
+            "Generator size": "Airman SDG65",
+            "Three-phase output": "62 kVA / 50 kW",
+            "Single-phase output": "2.4 kW x 2",
+            "Battery chemistry": "Lithium Titanate Oxide (LTO)",
+            "Battery capacity": "50 kWh",
+            "Energy throughput": "4,000 MWh",
+            "Charge time (no load)": "= 1 Hour",
+            "Inverter output max": "100 kW",
+            "Parallel capability": "Available",
+            "Battery type": "Lithium Titanate Oxide (LTO)",
+            "Cycle life @ 77°F": "90K Cycles at 90% DOD",
+            "Cycle life @ 100°F": "80K Cycles at 90% DOD",
+            "Life @ 3kW load (100°F)": "20 Years",
+            "Inverter cold start (min)": "14°F",
+            "Running temp range": "-22°F to 130°F",
+            "Arctic package (optional)": "-50°F to 130°F",
+            "EBOSS only (L×W×H)": "≈ 73.5” x 61” x 104.5”",
+            "EBOSS weight only": "9,600 lbs",
+            "With trailer & generator": "233” x 52” x 97”",
+            "Total weight (no fuel / full)": "≈ 18,000 lbs",
+            "Fuel tank capacity": "111 gal",
+        },
+        "EBOSS 220 kVA": {
+            "Three-phase": "220 kVA / 176 kW",
+            "Single-phase": "N/A / N/A",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "120V (1Φ) • 208/480 (3Φ)",
+            "Voltage regulation": "Adjustable",
+            "Amp-load @ 208V": "700 A / 134 kW",
+            "Amp-load @ 480V": "303 A / 201 kW",
+            "Motor start (3 sec @ 208V)": "1065 A / 204 kW",
+            "Motor start (3 sec @ 480V)": "461 A / 708 kW",
+            "Generator size": "Airman SDG125",
+            "Three-phase output": "120 kVA / 96 kW",
+            "Single-phase output": "2.4 kW x 2",
+            "Battery chemistry": "Lithium Titanate Oxide (LTO)",
+            "Battery capacity": "75 kWh",
+            "Energy throughput": "6,000 MWh",
+            "Charge time (no load)": "≈ 50 Minutes",
+            "Inverter output max": "176 kW",
+            "Parallel capability": "Available",
+            "Battery type": "Lithium Titanate Oxide (LTO)",
+            "Cycle life @ 77°F": "90K Cycles at 90% DOD",
+            "Cycle life @ 100°F": "80K Cycles at 90% DOD",
+            "Life @ 3kW load (100°F)": "20 Years",
+            "Inverter cold start (min)": "14°F",
+            "Running temp range": "-22°F to 130°F",
+            "Arctic package (optional)": "-50°F to 130°F",
+            "EBOSS only (L×W×H)": "≈73.5” x 61” x 104.5”",
+            "EBOSS weight only": "11,200 lbs",
+            "With trailer & generator": "≈249” x 52” x 97”",
+            "Total weight (no fuel / full)": "≈21,000 lbs",
+            "Fuel tank capacity": "168 gal",
+        },
+        "EBOSS 400 kVA": {
+            "Three-phase": "400 kVA / 320 kW",
+            "Single-phase": "N/A",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "120V (Courtesy Outlets) • 480 (3Φ)",
+            "Voltage regulation": "Adjustable",
+            "Amp-load @ 208V": "481 A / 92.5 kW",
+            "Amp-load @ 480V": "769 A / 319 kW",
+            "Motor start (3 sec @ 208V)": "1776 A / 341 kW",
+            "Motor start (3 sec @ 480V)": "769 A / 511 kW",
+            "Generator size": "Airman SDG220",
+            "Three-phase output": "210 kVA / 168 kW",
+            "Single-phase output": "2.4 kW x 2",
+            "Battery chemistry": "Lithium Titanate Oxide (LTO)",
+            "Battery capacity": "125 kWh",
+            "Energy throughput": "10,000 MWh",
+            "Charge time (no load)": "≈ 45 Minutes",
+            "Inverter output max": "320 kW",
+            "Parallel capability": "Available",
+            "Battery type": "Lithium Titanate Oxide (LTO)",
+            "Cycle life @ 77°F": "90K Cycles at 90% DOD",
+            "Cycle life @ 100°F": "80K Cycles at 90% DOD",
+            "Life @ 3kW load (100°F)": "21 Years",
+            "Inverter cold start (min)": "14°F",
+            "Running temp range": "-22°F to 130°F",
+            "Arctic package (optional)": "-50°F to 130°F",
+            "EBOSS only (L×W×H)": "≈ TBD",
+            "EBOSS weight only": "11,037 lbs",
+            "With trailer & generator": "≈ 262” x 74” x 75”",
+            "Total weight (no fuel / full)": "≈ 21,600 lbs / 24,000 lbs",
+            "Fuel tank capacity": "285 gal",
+        },
+    }
+
+def _eboss_spec_sheet_literal() -> dict:
+    """Customer-facing spec sheet used by the main app: {"EB25 kVA": {label: value}}."""
+    return {
+        "EB25 kVA": {
+            "Hybrid Energy System": "ANA EBOSS",
+            "Three-phase Max Power": "30 kVA / 24 kW",
+            "Single-phase Max Power": "20 kVA / 16 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "120/240 (1Φ) • 208/480 (3Φ)",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "70 A / 13.5 kW",
+            "Max Continuous amp-load 208V": "55 A / 10.5 kW",
+            "Max Intermittent amp-load 240V": "61 A / 13.5 kW",
+            "Max Continuous amp-load 240V": "48 A / 10.5 kW",
+            "Max Intermittent amp-load 480V": "35 A / 28 kW",
+            "Max Continuous amp-load 480V": "28 A / 22 kW",
+            "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
+            "Battery Capacity": "15 kWh",
+            "Generator kVA": "25 kVA (Hybrid units only)",
+            "Battery Voltage": "440 VDC",
+            "Inverter Type": "Pure Sine Wave",
+            "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
+            "Dimensions (L x W x H)": "108\" x 45\" x 62\"",
+            "Weight": "8,200 lbs",
+            "Warranty - EBOSS only": "2 Years",
+            "Warranty - With trailer & generator": "2 Years, 2000 Hours",
+            "Battery warranty": "7 Years",
+            "Service & Support": "24/7, 365 Days",
+            "Training": "Henderson, NV or On Location"
+        },
+        "EB70 kVA": {
+            "Hybrid Energy System": "ANA EBOSS",
+            "Three-phase Max Power": "70 kVA / 56 kW",
+            "Single-phase Max Power": "47 kVA / 37 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "120/240 (1Φ) • 208/480 (3Φ)",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "194 A / 37.2 kW",
+            "Max Continuous amp-load 208V": "155 A / 29.8 kW",
+            "Max Intermittent amp-load 240V": "169 A / 37.2 kW",
+            "Max Continuous amp-load 240V": "135 A / 29.8 kW",
+            "Max Intermittent amp-load 480V": "84 A / 70 kW",
+            "Max Continuous amp-load 480V": "67 A / 56 kW",
+            "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
+            "Battery Capacity": "25 kWh",
+            "Generator kVA": "45 kVA (Hybrid units only)",
+            "Battery Voltage": "440 VDC",
+            "Inverter Type": "Pure Sine Wave",
+            "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
+            "Dimensions (L x W x H)": "108\" x 60\" x 62\"",
+            "Weight": "13,200 lbs",
+            "Warranty - EBOSS only": "2 Years",
+            "Warranty - With trailer & generator": "2 Years, 2000 Hours",
+            "Battery warranty": "7 Years",
+            "Service & Support": "24/7, 365 Days",
+            "Training": "Henderson, NV or On Location"
+        },
+        "EB125 kVA": {
+            "Hybrid Energy System": "ANA EBOSS",
+            "Three-phase Max Power": "125 kVA / 100 kW",
+            "Single-phase Max Power": "N/A / N/A",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "120V (1Φ) • 208/480 (3Φ)",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "345 A / 66.2 kW",
+            "Max Continuous amp-load 208V": "276 A / 53 kW",
+            "Max Intermittent amp-load 240V": "301 A / 66.2 kW",
+            "Max Continuous amp-load 240V": "241 A / 53 kW",
+            "Max Intermittent amp-load 480V": "150 A / 125 kW",
+            "Max Continuous amp-load 480V": "120 A / 100 kW",
+            "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
+            "Battery Capacity": "50 kWh",
+            "Generator kVA": "65 kVA (Hybrid units only)",
+            "Battery Voltage": "440 VDC",
+            "Inverter Type": "Pure Sine Wave",
+            "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
+            "Dimensions (L x W x H)": "144\" x 60\" x 62\"",
+            "Weight": "18,200 lbs",
+            "Warranty - EBOSS only": "2 Years",
+            "Warranty - With trailer & generator": "2 Years, 2000 Hours",
+            "Battery warranty": "7 Years",
+            "Service & Support": "24/7, 365 Days",
+            "Training": "Henderson, NV or On Location"
+        },
+        "EB220 kVA": {
+            "Hybrid Energy System": "ANA EBOSS",
+            "Three-phase Max Power": "220 kVA / 176 kW",
+            "Single-phase Max Power": "N/A / N/A",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "120V (1Φ) • 208/480 (3Φ)",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "700 A / 134 kW",
+            "Max Continuous amp-load 208V": "560 A / 108 kW",
+            "Max Intermittent amp-load 240V": "611 A / 134 kW",
+            "Max Continuous amp-load 240V": "489 A / 108 kW",
+            "Max Intermittent amp-load 480V": "264 A / 220 kW",
+            "Max Continuous amp-load 480V": "211 A / 176 kW",
+            "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
+            "Battery Capacity": "75 kWh",
+            "Generator kVA": "125 kVA (Hybrid units only)",
+            "Battery Voltage": "440 VDC",
+            "Inverter Type": "Pure Sine Wave",
+            "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
+            "Dimensions (L x W x H)": "192\" x 60\" x 62\"",
+            "Weight": "29,200 lbs",
+            "Warranty - EBOSS only": "2 Years",
+            "Warranty - With trailer & generator": "2 Years, 2000 Hours",
+            "Battery warranty": "7 Years",
+            "Service & Support": "24/7, 365 Days",
+            "Training": "Henderson, NV or On Location"
+        },
+        "EB400 kVA": {
+            "Hybrid Energy System": "ANA EBOSS™",
+            "Three-phase Max Power": "400 kVA / 320 kW",
+            "Single-phase Max Power": "N/A",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "120V (Courtesy Outlets) • 480 (3Φ)",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "481 A / 92.5 kW",
+            "Max Continuous amp-load 208V": "385 A / 74 kW",
+            "Max Intermittent amp-load 240V": "419 A / 92.5 kW",
+            "Max Continuous amp-load 240V": "335 A / 74 kW",
+            "Max Intermittent amp-load 480V": "481 A / 400 kW",
+            "Max Continuous amp-load 480V": "385 A / 320 kW",
+            "Battery Type": "Lithium Titanate Oxide (Li4Ti5O12)",
+            "Battery Capacity": "125 kWh",
+            "Generator kVA": "220 kVA (Hybrid units only)",
+            "Battery Voltage": "440 VDC",
+            "Inverter Type": "Pure Sine Wave",
+            "Operating Temperature": "-4°F to 113°F (-20°C to 45°C)",
+            "Dimensions (L x W x H)": "240\" x 60\" x 62\"",
+            "Weight": "38,200 lbs",
+            "Warranty": "2 Years",
+            "Warranty - With generator": "2 Years, 2000 Hours",
+            "Battery warranty": "7 Years",
+            "Service & Support": "24/7, 365 Days",
+            "Training": "Henderson, NV or On Location"
+        }
+    }
+
+def _eboss_comparison_specs_literal() -> dict:
+    """EBOSS side of the spec comparison table (from the Excel sheet): {"EB25 kVA": {label: value}}."""
+    return {
+        "EB25 kVA": {
+            "Three-phase Max Power": "30 kVA / 24 kW",
+            "Single-phase Max Power": "12 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "Yes",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "83 A",
+            "Max Intermittent amp-load 480V": "36 A",
+            "Motor start rating - 3 second 208V": "166 A",
+            "Motor start rating - 3 second 480V": "72 A",
+            "Three-phase Continuous": "14.5 kW",
+            "Single-phase Continuous": "12 kW",
+            "Max Continuous amp-load 208V": "40 A",
+            "Max Continuous amp-load 480V": "17 A",
+            "Parallelable": "Yes"
+        },
+        "EB70 kVA": {
+            "Three-phase Max Power": "85 kVA / 68 kW",
+            "Single-phase Max Power": "30 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "Yes",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "236 A",
+            "Max Intermittent amp-load 480V": "102 A",
+            "Motor start rating - 3 second 208V": "472 A",
+            "Motor start rating - 3 second 480V": "204 A",
+            "Three-phase Continuous": "24.5 kW",
+            "Single-phase Continuous": "30 kW",
+            "Max Continuous amp-load 208V": "68 A",
+            "Max Continuous amp-load 480V": "29 A",
+            "Parallelable": "Yes"
+        },
+        "EB125 kVA": {
+            "Three-phase Max Power": "151 kVA / 121 kW",
+            "Single-phase Max Power": "50 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "Yes",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "419 A",
+            "Max Intermittent amp-load 480V": "181 A",
+            "Motor start rating - 3 second 208V": "838 A",
+            "Motor start rating - 3 second 480V": "362 A",
+            "Three-phase Continuous": "49 kW",
+            "Single-phase Continuous": "50 kW",
+            "Max Continuous amp-load 208V": "136 A",
+            "Max Continuous amp-load 480V": "59 A",
+            "Parallelable": "Yes"
+        },
+        "EB220 kVA": {
+            "Three-phase Max Power": "266 kVA / 213 kW",
+            "Single-phase Max Power": "75 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "Yes",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "739 A",
+            "Max Intermittent amp-load 480V": "319 A",
+            "Motor start rating - 3 second 208V": "1478 A",
+            "Motor start rating - 3 second 480V": "638 A",
+            "Three-phase Continuous": "74 kW",
+            "Single-phase Continuous": "75 kW",
+            "Max Continuous amp-load 208V": "206 A",
+            "Max Continuous amp-load 480V": "89 A",
+            "Parallelable": "Yes"
+        },
+        "EB400 kVA": {
+            "Three-phase Max Power": "484 kVA / 387 kW",
+            "Single-phase Max Power": "125 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "Yes",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "1347 A",
+            "Max Intermittent amp-load 480V": "582 A",
+            "Motor start rating - 3 second 208V": "2694 A",
+            "Motor start rating - 3 second 480V": "1164 A",
+            "Three-phase Continuous": "125 kW",
+            "Single-phase Continuous": "125 kW",
+            "Max Continuous amp-load 208V": "347 A",
+            "Max Continuous amp-load 480V": "150 A",
+            "Parallelable": "Yes"
+        }
+    }
+
+def _standard_comparison_specs_literal() -> dict:
+    """Standard-generator side of the spec comparison table: {"25 kVA / 20 kW": {label: value}}."""
+    return {
+        "25 kVA / 20 kW": {
+            "Three-phase Max Power": "25 kVA / 20 kW",
+            "Single-phase Max Power": "16 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "No",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "69 A",
+            "Max Intermittent amp-load 480V": "30 A",
+            "Motor start rating - 3 second 208V": "138 A",
+            "Motor start rating - 3 second 480V": "60 A",
+            "Three-phase Continuous": "20 kW",
+            "Single-phase Continuous": "16 kW",
+            "Max Continuous amp-load 208V": "56 A",
+            "Max Continuous amp-load 480V": "24 A",
+            "Parallelable": "No"
+        },
+        "45 kVA / 36 kW": {
+            "Three-phase Max Power": "45 kVA / 36 kW",
+            "Single-phase Max Power": "29 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "No",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "125 A",
+            "Max Intermittent amp-load 480V": "54 A",
+            "Motor start rating - 3 second 208V": "250 A",
+            "Motor start rating - 3 second 480V": "108 A",
+            "Three-phase Continuous": "36 kW",
+            "Single-phase Continuous": "29 kW",
+            "Max Continuous amp-load 208V": "100 A",
+            "Max Continuous amp-load 480V": "43 A",
+            "Parallelable": "No"
+        },
+        "65 kVA / 52 kW": {
+            "Three-phase Max Power": "65 kVA / 52 kW",
+            "Single-phase Max Power": "42 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "No",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "181 A",
+            "Max Intermittent amp-load 480V": "78 A",
+            "Motor start rating - 3 second 208V": "361 A",
+            "Motor start rating - 3 second 480V": "156 A",
+            "Three-phase Continuous": "52 kW",
+            "Single-phase Continuous": "42 kW",
+            "Max Continuous amp-load 208V": "144 A",
+            "Max Continuous amp-load 480V": "62 A",
+            "Parallelable": "No"
+        },
+        "125 kVA / 100 kW": {
+            "Three-phase Max Power": "125 kVA / 100 kW",
+            "Single-phase Max Power": "80 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "No",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "347 A",
+            "Max Intermittent amp-load 480V": "150 A",
+            "Motor start rating - 3 second 208V": "694 A",
+            "Motor start rating - 3 second 480V": "300 A",
+            "Three-phase Continuous": "100 kW",
+            "Single-phase Continuous": "80 kW",
+            "Max Continuous amp-load 208V": "278 A",
+            "Max Continuous amp-load 480V": "120 A",
+            "Parallelable": "No"
+        },
+        "220 kVA / 176 kW": {
+            "Three-phase Max Power": "220 kVA / 176 kW",
+            "Single-phase Max Power": "141 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "No",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "611 A",
+            "Max Intermittent amp-load 480V": "264 A",
+            "Motor start rating - 3 second 208V": "1222 A",
+            "Motor start rating - 3 second 480V": "528 A",
+            "Three-phase Continuous": "176 kW",
+            "Single-phase Continuous": "141 kW",
+            "Max Continuous amp-load 208V": "489 A",
+            "Max Continuous amp-load 480V": "211 A",
+            "Parallelable": "No"
+        },
+        "400 kVA / 320 kW": {
+            "Three-phase Max Power": "400 kVA / 320 kW",
+            "Single-phase Max Power": "256 kW",
+            "Frequency": "60 Hz",
+            "Simultaneous voltage": "No",
+            "Voltage regulation": "Adjustable",
+            "Max Intermittent amp-load 208V": "1111 A",
+            "Max Intermittent amp-load 480V": "481 A",
+            "Motor start rating - 3 second 208V": "2222 A",
+            "Motor start rating - 3 second 480V": "962 A",
+            "Three-phase Continuous": "320 kW",
+            "Single-phase Continuous": "256 kW",
+            "Max Continuous amp-load 208V": "889 A",
+            "Max Continuous amp-load 480V": "385 A",
+            "Parallelable": "No"
+        }
+    }
+
+def _standard_generator_data_literal() -> dict:
+    """Standard diesel generator reference data (comparison baseline)."""
+    return {
+        "25 kVA / 20 kW": {
+            "kw": 20,
+            "fuel_consumption_gph": {"50%": 1.2, "75%": 1.7, "100%": 2.3},
+            "fuel_tank_gal": 38,
+            "co2_per_gal": 22.4,
+            "noise_level_db": 75,
+            "dimensions": "60\" x 24\" x 36\"",
+            "weight_lbs": 1850
+        },
+        "45 kVA / 36 kW": {
+            "kw": 36,
+            "fuel_consumption_gph": {"50%": 2.1, "75%": 3.0, "100%": 4.1},
+            "fuel_tank_gal": 60,
+            "co2_per_gal": 22.4,
+            "noise_level_db": 78,
+            "dimensions": "72\" x 30\" x 42\"",
+            "weight_lbs": 2850
+        },
+        "65 kVA / 52 kW": {
+            "kw": 52,
+            "fuel_consumption_gph": {"50%": 2.8, "75%": 4.2, "100%": 5.8},
+            "fuel_tank_gal": 80,
+            "co2_per_gal": 22.4,
+            "noise_level_db": 80,
+            "dimensions": "84\" x 36\" x 48\"",
+            "weight_lbs": 4200
+        },
+        "125 kVA / 100 kW": {
+            "kw": 100,
+            "fuel_consumption_gph": {"50%": 5.2, "75%": 7.8, "100%": 10.5},
+            "fuel_tank_gal": 120,
+            "co2_per_gal": 22.4,
+            "noise_level_db": 82,
+            "dimensions": "120\" x 48\" x 60\"",
+            "weight_lbs": 8500
+        },
+        "220 kVA / 176 kW": {
+            "kw": 176,
+            "fuel_consumption_gph": {"50%": 9.1, "75%": 13.7, "100%": 18.2},
+            "fuel_tank_gal": 200,
+            "co2_per_gal": 22.4,
+            "noise_level_db": 85,
+            "dimensions": "144\" x 60\" x 72\"",
+            "weight_lbs": 15000
+        },
+        "400 kVA / 320 kW": {
+            "kw": 320,
+            "fuel_consumption_gph": {"50%": 16.8, "75%": 25.2, "100%": 33.6},
+            "fuel_tank_gal": 350,
+            "co2_per_gal": 22.4,
+            "noise_level_db": 88,
+            "dimensions": "180\" x 72\" x 84\"",
+            "weight_lbs": 28000
+        }
+    }
+
 
 # utils/data.py
 
@@ -200,6 +595,49 @@ FUEL_BURN_CURVES = {
     400: [(0.25, 7.70), (0.50, 12.20), (0.75, 17.30), (1.00, 22.50)],
 }
 
-# Optional back-compat alias if any old code expects this name:
-EBOSS_LOAD_REFERENCE = FUEL_BURN_CURVES
+# ── Shared reference tables ──────────────────────────────────────────────────
+# Structured reference used by calculations.py and the main app. It is derived
+# from SPECS + FUEL_BURN_CURVES, so every engine reads the same curves.
+EBOSS_LOAD_REFERENCE = {
+    "battery_capacities": {rec["eboss_model"]: rec["kwh"] for rec in SPECS.values()},
+    "generator_kva_hybrid": dict(NAME_TO_KVA),
+    "generator_sizes": SPECS,
+    "gph_interpolation": {
+        kva: {f"{round(frac * 100)}%": gph for frac, gph in points}
+        for kva, points in FUEL_BURN_CURVES.items()
+    },
+}
+
+# EBOSS model -> comparable standard diesel generator (STANDARD_GENERATOR_DATA key)
+EBOSS_STANDARD_PAIRING = {
+    "EB25 kVA": "25 kVA / 20 kW",
+    "EB70 kVA": "65 kVA / 52 kW",
+    "EB125 kVA": "125 kVA / 100 kW",
+    "EB220 kVA": "220 kVA / 176 kW",
+    "EB400 kVA": "400 kVA / 320 kW",
+}
+
+SPEC_LABELS = [
+    "Battery Capacity",
+    "Inverter",
+    "Voltage Options",
+    "Weight",
+    "Dimensions",
+    "Warranty",
+]
+
+_LAZY_TABLES = {
+    "EBOSS_SPECS": _eboss_specs_literal,
+    "EBOSS_SPEC_SHEET": _eboss_spec_sheet_literal,
+    "STANDARD_GENERATOR_DATA": _standard_generator_data_literal,
+    "EBOSS_COMPARISON_SPECS": _eboss_comparison_specs_literal,
+    "STANDARD_COMPARISON_SPECS": _standard_comparison_specs_literal,
+}
 
+def __getattr__(name: str):
+    build = _LAZY_TABLES.get(name)
+    if build is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = build()
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
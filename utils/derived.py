@@ -1,45 +1,85 @@
 # utils/derived.py
 from __future__ import annotations
-import streamlit as st
-from typing import Optional, Dict
+import dataclasses
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Optional, Dict, Mapping
+import numpy as np
+from utils.cache import memoize
 from utils.keys import CANON as K
-from utils.data import SPECS
-from utils.sizing import fuel_gph_at_load  # uses (gen_kva, load_fraction)
+from utils.profiling import timed
+from utils.registry import spec_for
+from utils.results import SizedSpec
+from utils.sizing import fuel_gph_at_load, fuel_gph_at_load_many  # uses (gen_kva, load_fraction)
 # We'll reuse spec_store's cached spec for gen_kva_used and for defaults
 # current_spec is set by compute_and_store_spec(...)
 
-def _spec_for(model: str) -> Optional[Dict]:
-    for rec in SPECS.values():
-        if rec.get("eboss_model") == model:
-            return rec
-    return None
+# derive() is the pure calculation: inputs in, a frozen DerivedResult out, no
+# Streamlit involved (usable from threads, the HTTP service and batch jobs, and
+# memoized process-wide). derive_many() is the same rule over arrays of sites.
+# compute_and_store_derived() is the thin session adapter the pages call.
 
-def _get_charge_kw(spec: Dict, eboss_type: str) -> float:
+def get_charge_kw(spec: Mapping, eboss_type: str) -> float:
+    """A model's charge rate (kW) for the given EBOSS type, from its SPECS row."""
     if eboss_type == "Full Hybrid":
         return float(spec.get("fh_charge_rate", 0.0))
     else:
         return float(spec.get("pm_charge_rate", 0.0))
 
-def _gen_kw_from_kva(gen_kva: Optional[int]) -> float:
-    if not gen_kva: return 0.0
+def gen_kw_from_kva(gen_kva):
+    """Generator kW rating for a kVA size (elementwise for arrays); 0.0 when no size is known."""
     # If you have explicit gen_kw in your data for that size, use it; else PF≈0.8
+    if isinstance(gen_kva, np.ndarray):
+        return 0.8 * gen_kva
+    if not gen_kva: return 0.0
     return 0.8 * float(gen_kva)
 
-def compute_and_store_derived() -> None:
-    """Compute battery/runtimes, engine-load % (for interpolation), interpolated GPH & rollups."""
-    ss = st.session_state
-    spec = ss.get(K["current_spec"]) or {}
-    model = ss.get(K["model"])
-    eboss_type = ss.get(K["type"])
-    cont_kw = float(ss.get(K["actual_cont_kw"]) or 0.0)
-
+@dataclass(frozen=True, slots=True)
+class DerivedInputs:
+    model: str
+    eboss_type: str
+    cont_kw: float
+    std_gen_kw: float = 0.0
+    std_gen_kva: int = 0
+
+@dataclass(frozen=True, slots=True)
+class DerivedResult:
+    battery_life_hours: float
+    charge_time_hours: float
+    cycles_per_day: float
+    eboss_runtime_hours: float
+    std_runtime_hours: float
+    eboss_eng_load_pct: float
+    std_eng_load_pct: Optional[float]
+    eboss_gph: float
+    std_gph: Optional[float]
+    eboss_gpd: float
+    std_gpd: Optional[float]
+    eboss_gpw: float
+    std_gpw: Optional[float]
+    eboss_gpm: float
+    std_gpm: Optional[float]
+
+    def as_state(self) -> Dict[str, Any]:
+        """{session key: value}, using the canonical keys from utils.keys."""
+        return {K[f.name]: getattr(self, f.name) for f in fields(self)}
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+def derive(spec: Mapping, inputs: DerivedInputs) -> Optional[DerivedResult]:
+    """Battery/runtimes, engine-load %, interpolated GPH & rollups; None if inputs are incomplete."""
+    return _derive(inputs, int((spec or {}).get("gen_kva_used") or 0))
+
+@memoize
+def _derive(inputs: DerivedInputs, gen_kva_used: int) -> Optional[DerivedResult]:
+    model, eboss_type, cont_kw = inputs.model, inputs.eboss_type, float(inputs.cont_kw or 0.0)
     if not model or not eboss_type or cont_kw <= 0:
         # not enough info yet
-        return
+        return None
 
-    spec_row = _spec_for(model) or {}
+    spec_row = spec_for(model) or {}
     battery_kwh = float(spec_row.get("kwh", 0.0))
-    charge_kw   = _get_charge_kw(spec_row, eboss_type)
+    charge_kw   = get_charge_kw(spec_row, eboss_type)
 
     # 1) Battery/cycle model
     battery_life_hours = (battery_kwh / cont_kw) if cont_kw > 0 else 0.0
@@ -47,80 +87,157 @@ def compute_and_store_derived() -> None:
     denom = battery_life_hours + charge_time_hours
     cycles_per_day = (24.0 / denom) if denom > 0 else 0.0
 
-    ss[K["battery_life_hours"]] = battery_life_hours
-    ss[K["charge_time_hours"]]  = charge_time_hours
-    ss[K["cycles_per_day"]]     = cycles_per_day
-
     # 2) Runtime per day
     eboss_runtime_hours = charge_time_hours * cycles_per_day
     std_runtime_hours   = 24.0
-    ss[K["eboss_runtime_hours"]] = eboss_runtime_hours
-    ss[K["std_runtime_hours"]]   = std_runtime_hours
 
     # 3) Engine-load % for interpolation (per your latest rule)
     # EBOSS: (charge_kw / gen_kw)
-    gen_kva_used = int(spec.get("gen_kva_used") or 0)
-    gen_kw = _gen_kw_from_kva(gen_kva_used)
+    gen_kw = gen_kw_from_kva(gen_kva_used)
     eboss_eng_load_frac = (charge_kw / gen_kw) if gen_kw > 0 else 0.0
     eboss_eng_load_frac = max(0.0, min(1.0, eboss_eng_load_frac))
-    ss[K["eboss_eng_load_pct"]] = eboss_eng_load_frac * 100.0
 
     # Standard: (cont_kw / std_gen_kw_rating) if user provided these
-    std_gen_kw = float(ss.get(K["std_gen_kw"]) or 0.0)
-    std_gen_kva = int(ss.get(K["std_gen_kva"]) or 0)
+    std_gen_kw = float(inputs.std_gen_kw or 0.0)
+    std_gen_kva = int(inputs.std_gen_kva or 0)
     if std_gen_kw > 0 and std_gen_kva > 0:
         std_eng_load_frac = max(0.0, min(1.0, cont_kw / std_gen_kw))
-        ss[K["std_eng_load_pct"]] = std_eng_load_frac * 100.0
     else:
         std_eng_load_frac = None
-        ss[K["std_eng_load_pct"]] = None
 
     # 4) Interpolated GPH + rollups
-    # EBOSS GPH at eboss_eng_load_frac and gen_kva_used
     eboss_gph = fuel_gph_at_load(gen_kva_used, eboss_eng_load_frac) if gen_kva_used > 0 else 0.0
-    ss[K["eboss_gph"]] = eboss_gph
+    std_gph = fuel_gph_at_load(std_gen_kva, std_eng_load_frac) if std_eng_load_frac is not None else None
 
-    # Standard GPH if inputs available
-    if std_eng_load_frac is not None:
-        std_gph = fuel_gph_at_load(std_gen_kva, std_eng_load_frac)
-        ss[K["std_gph"]] = std_gph
-    else:
-        std_gph = None
-        ss[K["std_gph"]] = None
-
-    # EBOSS gallons per day/week/month from EBOSS runtime hours per day
+    # EBOSS gallons per day from EBOSS runtime hours per day; standard runs 24h/day
     eboss_gpd = eboss_gph * eboss_runtime_hours
-    ss[K["eboss_gpd"]] = eboss_gpd
-    ss[K["eboss_gpw"]] = eboss_gpd * 7.0
-    ss[K["eboss_gpm"]] = eboss_gpd * 30.0
-
-    # Standard gallons (24h/day)
-    if std_gph is not None:
-        std_gpd = std_gph * 24.0
-        ss[K["std_gpd"]] = std_gpd
-        ss[K["std_gpw"]] = std_gpd * 7.0
-        ss[K["std_gpm"]] = std_gpd * 30.0
-    else:
-        ss[K["std_gpd"]] = ss[K["std_gpw"]] = ss[K["std_gpm"]] = None
+    std_gpd = std_gph * 24.0 if std_gph is not None else None
+
+    return DerivedResult(
+        battery_life_hours=battery_life_hours,
+        charge_time_hours=charge_time_hours,
+        cycles_per_day=cycles_per_day,
+        eboss_runtime_hours=eboss_runtime_hours,
+        std_runtime_hours=std_runtime_hours,
+        eboss_eng_load_pct=eboss_eng_load_frac * 100.0,
+        std_eng_load_pct=std_eng_load_frac * 100.0 if std_eng_load_frac is not None else None,
+        eboss_gph=eboss_gph,
+        std_gph=std_gph,
+        eboss_gpd=eboss_gpd,
+        std_gpd=std_gpd,
+        eboss_gpw=eboss_gpd * 7.0,
+        std_gpw=std_gpd * 7.0 if std_gpd is not None else None,
+        eboss_gpm=eboss_gpd * 30.0,
+        std_gpm=std_gpd * 30.0 if std_gpd is not None else None,
+    )
+
+# ── Many sites at once ───────────────────────────────────────────────────────
+def derive_many(model, eboss_type, cont_kw, gen_kva_used, std_gen_kw=0.0, std_gen_kva=0) -> Dict[str, np.ndarray]:
+    """
+    derive() over equal-length arrays (scalars broadcast), one NumPy pass.
+
+    Returns {DerivedResult field: array}. Rows derive() would reject (no model or
+    type, cont_kw <= 0) come back as NaN; std_* values are NaN where the standard
+    generator was not given, matching derive()'s None.
+    """
+    model, eboss_type, cont_kw, gen_kva_used, std_gen_kw, std_gen_kva = np.broadcast_arrays(
+        np.asarray(model, dtype=object), np.asarray(eboss_type, dtype=object),
+        np.asarray(cont_kw, dtype=np.float64), np.asarray(gen_kva_used, dtype=np.float64),
+        np.asarray(std_gen_kw, dtype=np.float64), np.asarray(std_gen_kva, dtype=np.float64),
+    )
+    gen_kva_used = np.trunc(gen_kva_used)
+    std_gen_kva = np.trunc(std_gen_kva)
+    rows = {m: spec_for(m) or {} for m in set(model.tolist()) if m}
+    kwh = np.array([float(rows.get(m, {}).get("kwh", 0.0)) if m else 0.0 for m in model.tolist()])
+    charge_kw = np.array([get_charge_kw(rows.get(m, {}), t) if m else 0.0
+                          for m, t in zip(model.tolist(), eboss_type.tolist())])
+    valid = (model != None) & (model != "") & (eboss_type != None) & (eboss_type != "") & (cont_kw > 0)  # noqa: E711
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        battery_life = np.where(cont_kw > 0, kwh / cont_kw, 0.0)
+        charge_time = np.where(charge_kw > 0, kwh / charge_kw, 0.0)
+        denom = battery_life + charge_time
+        cycles = np.where(denom > 0, 24.0 / denom, 0.0)
+        eboss_runtime = charge_time * cycles
+
+        gen_kw = gen_kw_from_kva(gen_kva_used)
+        eboss_frac = np.clip(np.where(gen_kw > 0, charge_kw / gen_kw, 0.0), 0.0, 1.0)
+        has_std = (std_gen_kw > 0) & (std_gen_kva > 0)
+        std_frac = np.where(has_std, np.clip(cont_kw / std_gen_kw, 0.0, 1.0), np.nan)
+
+    eboss_gph = np.zeros(len(cont_kw))
+    ok = valid & (gen_kva_used > 0)
+    if ok.any():
+        eboss_gph[ok] = fuel_gph_at_load_many(gen_kva_used[ok], eboss_frac[ok])
+    std_gph = np.full(len(cont_kw), np.nan)
+    ok_std = valid & has_std
+    if ok_std.any():
+        std_gph[ok_std] = fuel_gph_at_load_many(std_gen_kva[ok_std], std_frac[ok_std])
+
+    eboss_gpd = eboss_gph * eboss_runtime
+    std_gpd = std_gph * 24.0
+    out = {
+        "battery_life_hours": battery_life,
+        "charge_time_hours": charge_time,
+        "cycles_per_day": cycles,
+        "eboss_runtime_hours": eboss_runtime,
+        "std_runtime_hours": np.full(len(cont_kw), 24.0),
+        "eboss_eng_load_pct": eboss_frac * 100.0,
+        "std_eng_load_pct": std_frac * 100.0,
+        "eboss_gph": eboss_gph,
+        "std_gph": std_gph,
+        "eboss_gpd": eboss_gpd,
+        "std_gpd": std_gpd,
+        "eboss_gpw": eboss_gpd * 7.0,
+        "std_gpw": std_gpd * 7.0,
+        "eboss_gpm": eboss_gpd * 30.0,
+        "std_gpm": std_gpd * 30.0,
+    }
+    return {name: np.where(valid, values, np.nan) for name, values in out.items()}
+
+# ── Streamlit adapter ────────────────────────────────────────────────────────
+_UNSET = object()
 
-    # Also tuck these under the cached spec for one-stop reads
+@timed()
+def compute_and_store_derived() -> None:
+    """Compute battery/runtimes, engine-load % (for interpolation), interpolated GPH & rollups."""
+    import streamlit as st
+    ss = st.session_state
+    spec = ss.get(K["current_spec"]) or {}
+    inputs = DerivedInputs(
+        model=ss.get(K["model"]) or "",
+        eboss_type=ss.get(K["type"]) or "",
+        cont_kw=float(ss.get(K["actual_cont_kw"]) or 0.0),
+        std_gen_kw=float(ss.get(K["std_gen_kw"]) or 0.0),
+        std_gen_kva=int(ss.get(K["std_gen_kva"]) or 0),
+    )
+    result = derive(spec, inputs)
+    if result is None:
+        # not enough info yet
+        return
+
+    # Write only what changed: most reruns recompute identical values.
+    derived = result.as_state()
+    for key, value in derived.items():
+        if ss.get(key, _UNSET) != value:
+            ss[key] = value
+
+    # Also tuck these under the current spec for one-stop reads. A SizedSpec is
+    # frozen (it is shared with the spec cache), so swap in an updated copy.
     cached = ss.get(K["current_spec"]) or {}
-    derived = {
-        K["battery_life_hours"]: battery_life_hours,
-        K["charge_time_hours"]:  charge_time_hours,
-        K["cycles_per_day"]:     cycles_per_day,
-        K["eboss_runtime_hours"]: eboss_runtime_hours,
-        K["std_runtime_hours"]:   std_runtime_hours,
-        K["eboss_eng_load_pct"]: ss[K["eboss_eng_load_pct"]],
-        K["std_eng_load_pct"]:   ss[K["std_eng_load_pct"]],
-        K["eboss_gph"]:          ss[K["eboss_gph"]],
-        K["std_gph"]:            ss[K["std_gph"]],
-        K["eboss_gpd"]:          ss[K["eboss_gpd"]],
-        K["std_gpd"]:            ss[K["std_gpd"]],
-        K["eboss_gpw"]:          ss[K["eboss_gpw"]],
-        K["std_gpw"]:            ss[K["std_gpw"]],
-        K["eboss_gpm"]:          ss[K["eboss_gpm"]],
-        K["std_gpm"]:            ss[K["std_gpm"]],
-    }
-    cached["derived"] = derived
-    ss[K["current_spec"]] = cached
+    if cached.get("derived") != derived:
+        if isinstance(cached, SizedSpec):
+            cached = dataclasses.replace(cached, derived=derived)
+        else:
+            cached["derived"] = derived
+        ss[K["current_spec"]] = cached
+
+__all__ = [
+    "DerivedInputs",
+    "DerivedResult",
+    "compute_and_store_derived",
+    "derive",
+    "derive_many",
+    "gen_kw_from_kva",
+    "get_charge_kw",
+]
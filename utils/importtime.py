@@ -0,0 +1,70 @@
+# utils/importtime.py
+from __future__ import annotations
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+# Per-module import cost, measured the way `python -X importtime` reports it.
+#
+# The entry modules are imported in a fresh interpreter (the running server has
+# them cached in sys.modules already, so timing them in-process would show ~0),
+# and the interpreter's stderr report is parsed into rows. Times are
+# microseconds in the raw report and milliseconds in the rows returned here.
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# What the Streamlit entry points pull in before they render anything.
+ENTRY_MODULES: tuple = (
+    "streamlit",
+    "calculations",
+    "utils.data",
+    "utils.registry",
+    "utils.sizing",
+    "utils.spec_store",
+    "utils.paralleling",
+    "utils.meter",
+    "fault_lookup_widget",
+)
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+def parse_importtime(report: str) -> List[Dict[str, object]]:
+    """Rows of {module, self_ms, cumulative_ms, depth} from an -X importtime report, in import order."""
+    rows = []
+    for line in report.splitlines():
+        m = _LINE_RE.match(line)
+        if not m:
+            continue  # header line and anything the modules printed themselves
+        self_us, cum_us, indent, module = m.groups()
+        rows.append({
+            "module": module,
+            "self_ms": int(self_us) / 1000.0,
+            "cumulative_ms": int(cum_us) / 1000.0,
+            "depth": (len(indent) - 1) // 2,
+        })
+    return rows
+
+def profile_imports(modules: Sequence[str] = ENTRY_MODULES, *, python: Optional[str] = None,
+                    timeout_s: float = 120.0) -> List[Dict[str, object]]:
+    """Import `modules` in a fresh interpreter under -X importtime and return the parsed rows.
+
+    Raises RuntimeError if the child interpreter fails (e.g. a module does not import).
+    """
+    code = "\n".join(f"import {name}" for name in modules)
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", code],
+        cwd=str(ROOT), capture_output=True, text=True, timeout=timeout_s,
+    )
+    if proc.returncode != 0:
+        tail = [ln for ln in proc.stderr.splitlines() if not ln.startswith("import time:")][-5:]
+        raise RuntimeError("Import profiling failed:\n" + "\n".join(tail))
+    return parse_importtime(proc.stderr)
+
+def summarize(rows: Sequence[Dict[str, object]], top: int = 25, max_depth: Optional[int] = None) -> List[Dict[str, object]]:
+    """The `top` most expensive rows by cumulative time, optionally only down to `max_depth`."""
+    picked = [r for r in rows if max_depth is None or r["depth"] <= max_depth]
+    return sorted(picked, key=lambda r: -r["cumulative_ms"])[:top]
+
+__all__ = ["ENTRY_MODULES", "parse_importtime", "profile_imports", "summarize"]
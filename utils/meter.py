@@ -0,0 +1,205 @@
+# utils/meter.py
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Streaming statistics over interval-meter load logs (CSV or Parquet).
+#
+# Files are read in fixed-size chunks and folded into a LoadStatsAccumulator, so
+# memory stays flat no matter how many months of logger data are uploaded.
+# Percentiles come from a fixed-resolution histogram; the "continuous" load is the
+# highest rolling average over a window (default 60 min), carried across chunks.
+
+DEFAULT_CHUNK_ROWS = 250_000
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+MAX_HIST_BINS = 1_000_000   # 8 MB of counts; at 0.1 kW that covers 0-100 MW, above lands in the top bin
+_TIME_HINTS = ("timestamp", "datetime", "time", "date")
+
+def _format_of(source, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt.lower()
+    name = str(getattr(source, "name", source)).lower()
+    return "parquet" if name.endswith((".parquet", ".pq")) else "csv"
+
+def pick_kw_column(columns: Sequence[str]) -> str:
+    """Best guess at the kW column: exact 'kW', else the first name mentioning kW (not kWh/kVAR)."""
+    names = [str(c) for c in columns]
+    for name in names:
+        if name.strip().lower() == "kw":
+            return name
+    for name in names:
+        low = name.lower()
+        if "kw" in low and "kwh" not in low and "kvar" not in low:
+            return name
+    raise ValueError(f"No kW column found in {names}; pass kw_column explicitly.")
+
+def pick_time_column(columns: Sequence[str]) -> Optional[str]:
+    for name in (str(c) for c in columns):
+        if any(h in name.lower() for h in _TIME_HINTS):
+            return name
+    return None
+
+def _infer_interval_minutes(times: pd.Series) -> Optional[float]:
+    stamps = pd.to_datetime(times, errors="coerce").dropna()
+    if len(stamps) < 2:
+        return None
+    step = stamps.diff().median()
+    minutes = step.total_seconds() / 60.0 if pd.notna(step) else 0.0
+    return minutes if minutes > 0 else None
+
+def iter_meter_frames(
+    source,
+    *,
+    columns: Optional[List[str]] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    fmt: Optional[str] = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield DataFrame chunks from a CSV/Parquet path or file-like (e.g. an st.file_uploader file)."""
+    if _format_of(source, fmt) == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Corrupt files surface as ArrowInvalid (bad magic) or OSError (bad thrift/pages);
+        # report both as ValueError, like a malformed CSV.
+        try:
+            pf = pq.ParquetFile(source)
+            for batch in pf.iter_batches(batch_size=chunk_rows, columns=columns):
+                yield batch.to_pandas()
+        except (pa.ArrowException, OSError) as e:
+            raise ValueError(f"Could not read Parquet file: {e}") from e
+        return
+
+    yield from pd.read_csv(source, usecols=columns, chunksize=chunk_rows)
+
+class LoadStatsAccumulator:
+    """Folds kW samples chunk-by-chunk into mean/peak/rolling/percentile statistics."""
+
+    def __init__(self, interval_minutes: float, *, continuous_window_minutes: float = 60.0,
+                 resolution_kw: float = 0.1):
+        if interval_minutes <= 0:
+            raise ValueError("interval_minutes must be positive.")
+        self.interval_minutes = float(interval_minutes)
+        self.window_steps = max(1, int(round(continuous_window_minutes / self.interval_minutes)))
+        self.continuous_window_minutes = self.window_steps * self.interval_minutes
+        self.resolution_kw = float(resolution_kw)
+
+        self.samples = 0
+        self.total_kw = 0.0
+        self.peak_kw = 0.0
+        self.min_kw = np.inf
+        self.best_window_kw = 0.0
+        self._tail = np.empty(0, dtype=np.float64)
+        self._hist = np.zeros(0, dtype=np.int64)
+
+    def add(self, kw) -> None:
+        values = pd.to_numeric(pd.Series(np.asarray(kw).ravel()), errors="coerce").dropna().to_numpy(np.float64)
+        values = np.clip(values[np.isfinite(values)], 0.0, None)
+        if values.size == 0:
+            return
+
+        self.samples += values.size
+        self.total_kw += float(values.sum())
+        self.peak_kw = max(self.peak_kw, float(values.max()))
+        self.min_kw = min(self.min_kw, float(values.min()))
+
+        # Rolling mean over window_steps, stitched onto the previous chunk's tail.
+        joined = np.concatenate([self._tail, values])
+        w = self.window_steps
+        if joined.size >= w:
+            csum = np.concatenate([[0.0], np.cumsum(joined)])
+            self.best_window_kw = max(self.best_window_kw, float((csum[w:] - csum[:-w]).max() / w))
+        self._tail = joined[-(w - 1):] if w > 1 else joined[:0]
+
+        bins = np.minimum(values / self.resolution_kw, MAX_HIST_BINS - 1).astype(np.int64)
+        counts = np.bincount(bins)
+        if counts.size > self._hist.size:
+            self._hist = np.pad(self._hist, (0, counts.size - self._hist.size))
+        self._hist[: counts.size] += counts
+
+    def percentile(self, q: float) -> float:
+        if self.samples == 0:
+            return 0.0
+        rank = np.searchsorted(np.cumsum(self._hist), np.ceil(q / 100.0 * self.samples))
+        return float(min((rank + 0.5) * self.resolution_kw, self.peak_kw))  # bin midpoint
+
+    def result(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        n = self.samples
+        mean_kw = self.total_kw / n if n else 0.0
+        # Shorter than one window: the best we can say is the overall average.
+        continuous_kw = self.best_window_kw if n >= self.window_steps else mean_kw
+        return {
+            "samples": n,
+            "interval_minutes": self.interval_minutes,
+            "hours": n * self.interval_minutes / 60.0,
+            "energy_kwh": self.total_kw * self.interval_minutes / 60.0,
+            "mean_kw": mean_kw,
+            "min_kw": float(self.min_kw) if n else 0.0,
+            "peak_kw": self.peak_kw,
+            "continuous_kw": continuous_kw,
+            "continuous_window_minutes": self.continuous_window_minutes,
+            "percentiles_kw": {float(q): self.percentile(q) for q in percentiles},
+        }
+
+def meter_load_stats(
+    source,
+    *,
+    kw_column: Optional[str] = None,
+    time_column: Optional[str] = None,
+    interval_minutes: Optional[float] = None,
+    continuous_window_minutes: float = 60.0,
+    percentiles: Iterable[float] = DEFAULT_PERCENTILES,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    fmt: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Stream a meter log and return continuous/peak/percentile kW statistics.
+
+    The kW and timestamp columns are auto-detected when not given; the sample interval
+    is inferred from the timestamps of the first chunk unless interval_minutes is set.
+    """
+    acc: Optional[LoadStatsAccumulator] = None
+    kw_col, time_col = kw_column, time_column
+
+    for frame in iter_meter_frames(source, chunk_rows=chunk_rows, fmt=fmt):
+        if acc is None:
+            kw_col = kw_col or pick_kw_column(frame.columns)
+            time_col = time_col or pick_time_column(frame.columns)
+            step = interval_minutes
+            if step is None and time_col is not None:
+                step = _infer_interval_minutes(frame[time_col])
+            if step is None:
+                raise ValueError("Could not infer the sample interval; pass interval_minutes.")
+            acc = LoadStatsAccumulator(step, continuous_window_minutes=continuous_window_minutes)
+        acc.add(frame[kw_col].to_numpy())
+
+    if acc is None:
+        raise ValueError("Meter file contains no rows.")
+    stats = acc.result(percentiles)
+    stats["kw_column"] = kw_col
+    stats["source"] = Path(str(getattr(source, "name", source))).name
+    return stats
+
+def sizing_inputs_from_stats(stats: Dict[str, Any], *, continuous_percentile: Optional[float] = None) -> Dict[str, float]:
+    """
+    Map meter statistics onto the sizing inputs (continuous and peak kW).
+    By default continuous = highest rolling-window average; pass a percentile
+    (e.g. 95) to size on that instead.
+    """
+    if continuous_percentile is not None:
+        cont_kw = stats["percentiles_kw"].get(float(continuous_percentile))
+        if cont_kw is None:
+            raise KeyError(f"Percentile {continuous_percentile} was not computed.")
+    else:
+        cont_kw = stats["continuous_kw"]
+    return {"cont_kw": float(cont_kw), "peak_kw": float(stats["peak_kw"])}
+
+__all__ = [
+    "LoadStatsAccumulator",
+    "iter_meter_frames",
+    "meter_load_stats",
+    "pick_kw_column",
+    "sizing_inputs_from_stats",
+]
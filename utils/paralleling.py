@@ -0,0 +1,182 @@
+# utils/paralleling.py
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import product
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.derived import gen_kw_from_kva
+from utils.registry import gen_kva_for, spec_for
+from utils.sizing import fuel_gph_at_load
+
+# Exhaustive fleet optimizer for paralleled EBOSS units.
+#
+# Every unit-count vector bounded by the entered inventory is a candidate. A fleet
+# is feasible when its summed continuous/peak kW cover the site and its summed
+# charge rate covers the continuous load (so the batteries can recover). Fleet
+# generators run at their charge rate for a duty fraction of load_kw / charge_kw,
+# which gives the average GPH; the cost objective adds per-unit daily rates.
+#
+# The search space is split on the leading models' counts into blocks of at most
+# _MAX_BLOCK candidates. Prefixes that cannot reach the load even with the rest of
+# the inventory are pruned before any work is done; surviving blocks are scored as
+# NumPy arrays, in a process pool once the space is large enough to pay for it.
+
+OBJECTIVES = ("gph", "cost")
+EBOSS_TYPES = ("Full Hybrid", "Power Module")
+_MAX_BLOCK = 1 << 18
+_PARALLEL_MIN_COMBOS = 200_000
+
+_POOL: Optional[ProcessPoolExecutor] = None
+
+def _get_pool(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    """One pool per process, reused across Streamlit reruns (worker start-up is the slow part)."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1)
+    return _POOL
+
+def _unit_table(models: List[str], eboss_type: str, pm_gen_kva: Optional[int]) -> Dict[str, np.ndarray]:
+    charge_key = "fh_charge_rate" if eboss_type == "Full Hybrid" else "pm_charge_rate"
+    cols: Dict[str, List[float]] = {k: [] for k in ("cont", "peak", "kwh", "charge", "gph")}
+    for model in models:
+        rec = spec_for(model)
+        if rec is None:
+            raise KeyError(f"Unknown EBOSS model: {model}")
+        kva = gen_kva_for(model)
+        # Full Hybrid runs its own generator; Power Modules pair with pm_gen_kva (default: same class).
+        gen_kva = kva if eboss_type == "Full Hybrid" else int(pm_gen_kva or kva)
+        charge = float(rec.get(charge_key, 0.0))
+        gen_kw = gen_kw_from_kva(gen_kva)
+        load_frac = max(0.0, min(1.0, charge / gen_kw)) if gen_kw > 0 else 0.0
+        cols["cont"].append(float(rec.get("max_cont_kw", 0.0)))
+        cols["peak"].append(float(rec.get("max_peak_kw", 0.0)))
+        cols["kwh"].append(float(rec.get("kwh", 0.0)))
+        cols["charge"].append(charge)
+        cols["gph"].append(fuel_gph_at_load(gen_kva, load_frac))
+    return {k: np.asarray(v, dtype=np.float64) for k, v in cols.items()}
+
+def _score_block(args) -> Tuple[np.ndarray, np.ndarray]:
+    """Score every count vector sharing `prefix`; return (counts, objective) of the best `top_n`."""
+    prefix, rest_bounds, units, req_cont, req_peak, fuel_price, rates, objective, top_n = args
+    rest = np.indices(tuple(b + 1 for b in rest_bounds), dtype=np.int32).reshape(len(rest_bounds), -1).T
+    counts = np.empty((rest.shape[0], len(prefix) + len(rest_bounds)), dtype=np.int32)
+    counts[:, : len(prefix)] = prefix
+    counts[:, len(prefix):] = rest
+
+    cont = counts @ units["cont"]
+    charge = counts @ units["charge"]
+    ok = (cont >= req_cont) & (counts @ units["peak"] >= req_peak) & (charge >= req_cont) & (counts.sum(axis=1) > 0)
+    if not ok.any():
+        return np.empty((0, counts.shape[1]), dtype=np.int32), np.empty(0)
+
+    counts, charge = counts[ok], charge[ok]
+    duty = np.where(charge > 0, req_cont / charge, 1.0)
+    score = duty * (counts @ units["gph"])
+    if objective == "cost":
+        score = score * 24.0 * fuel_price + counts @ rates
+
+    # Tie-break on fewer units, then less surplus capacity.
+    order = np.lexsort((cont[ok], counts.sum(axis=1), score))[:top_n]
+    return counts[order], score[order]
+
+def _blocks(bounds: List[int], units, req_cont: float, req_peak: float) -> Tuple[List[Tuple[int, ...]], List[int]]:
+    """Split on leading dimensions until each block is <= _MAX_BLOCK; prune unreachable prefixes."""
+    split = 0
+    size = int(np.prod([b + 1 for b in bounds]))
+    while split < len(bounds) - 1 and size > _MAX_BLOCK:
+        size //= bounds[split] + 1
+        split += 1
+
+    tail = np.asarray(bounds[split:], dtype=np.float64)
+    best_rest = {k: float(tail @ units[k][split:]) for k in ("cont", "peak", "charge")}
+    prefixes = []
+    for prefix in product(*(range(b + 1) for b in bounds[:split])):
+        p = np.asarray(prefix, dtype=np.float64)
+        reach = {k: float(p @ units[k][:split]) + best_rest[k] for k in best_rest}
+        if reach["cont"] >= req_cont and reach["peak"] >= req_peak and reach["charge"] >= req_cont:
+            prefixes.append(prefix)
+    return prefixes, bounds[split:]
+
+def optimize_fleet(
+    required_cont_kw: float,
+    required_peak_kw: float,
+    inventory: Dict[str, int],
+    *,
+    eboss_type: str = "Full Hybrid",
+    objective: str = "gph",
+    pm_gen_kva: Optional[int] = None,
+    fuel_price: float = 0.0,
+    daily_rates: Optional[Dict[str, float]] = None,
+    top_n: int = 3,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Return the best `top_n` unit mixes (best first) drawn from `inventory`
+    ({model name: available qty}) that carry the continuous and peak load.
+
+    objective="gph"  -> minimize average fleet fuel burn (gal/hr)
+    objective="cost" -> minimize fuel_price * gal/day + sum(qty * daily_rates[model])
+    An empty list means the inventory cannot carry the load.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {OBJECTIVES}, got {objective!r}")
+    if eboss_type not in EBOSS_TYPES:
+        raise ValueError(f"eboss_type must be one of {EBOSS_TYPES}, got {eboss_type!r}")
+    models = [m for m, qty in inventory.items() if int(qty or 0) > 0]
+    if not models or required_cont_kw < 0 or required_peak_kw < 0:
+        return []
+
+    bounds = [int(inventory[m]) for m in models]
+    units = _unit_table(models, eboss_type, pm_gen_kva)
+    rates = np.asarray([float((daily_rates or {}).get(m, 0.0)) for m in models], dtype=np.float64)
+    prefixes, rest_bounds = _blocks(bounds, units, required_cont_kw, required_peak_kw)
+    if not prefixes:
+        return []
+
+    jobs = [(prefix, rest_bounds, units, float(required_cont_kw), float(required_peak_kw),
+             float(fuel_price), rates, objective, top_n) for prefix in prefixes]
+    n_combos = len(prefixes) * int(np.prod([b + 1 for b in rest_bounds]))
+    if n_combos < _PARALLEL_MIN_COMBOS or len(jobs) == 1 or max_workers == 1:
+        parts = [_score_block(job) for job in jobs]
+    else:
+        try:
+            parts = list(_get_pool(max_workers).map(_score_block, jobs, chunksize=max(1, len(jobs) // 32)))
+        except BrokenProcessPool:
+            global _POOL
+            _POOL = None
+            parts = [_score_block(job) for job in jobs]
+
+    counts = np.concatenate([c for c, _ in parts]) if parts else np.empty((0, len(models)))
+    scores = np.concatenate([s for _, s in parts]) if parts else np.empty(0)
+    if scores.size == 0:
+        return []
+    order = np.lexsort((counts @ units["cont"], counts.sum(axis=1), scores))[:top_n]
+
+    results = []
+    for row, score in zip(counts[order], scores[order]):
+        total_kwh = float(row @ units["kwh"])
+        charge_kw = float(row @ units["charge"])
+        duty = required_cont_kw / charge_kw if charge_kw > 0 else 1.0
+        surplus = charge_kw - required_cont_kw
+        total_gph = duty * float(row @ units["gph"])
+        results.append({
+            "units": {m: int(q) for m, q in zip(models, row) if q > 0},
+            "total_kw": float(row @ units["cont"]),
+            "total_peak_kw": float(row @ units["peak"]),
+            "total_kwh": total_kwh,
+            "charge_kw": charge_kw,
+            "duty": duty,
+            "battery_life": total_kwh / required_cont_kw if required_cont_kw > 0 else 0.0,
+            "charge_time": total_kwh / surplus if surplus > 0 else None,   # None: no surplus to recharge
+            "runtime_hrs": 24.0 * duty * int(row.sum()),
+            "total_gph": total_gph,
+            "daily_cost": 24.0 * total_gph * fuel_price + float(row @ rates),
+            "objective": float(score),
+        })
+    return results
+
+__all__ = ["EBOSS_TYPES", "OBJECTIVES", "optimize_fleet"]
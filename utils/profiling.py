@@ -0,0 +1,242 @@
+# utils/profiling.py
+from __future__ import annotations
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Per-rerun timing spans for the Streamlit scripts.
+#
+# Off unless EBOSS_PROFILE=1 is set for the server or the page is opened with
+# ?profile=1 (remembered for the rest of the session). A page calls start_run()
+# at the top and finish_run() at the bottom; in between, section("name") starts a
+# new top-level section (closing the previous one), and span()/timed() time a
+# block or function wherever it is called from. Each finished rerun is appended
+# as one JSON line to logs/rerun_spans.log (rotated) and shown in a small
+# expander on the page. Fragment-only reruns (st.fragment) are logged as their
+# own runs via fragment_run().
+#
+# The current rerun is held in a thread-local: a session's script runs on its
+# own thread, so concurrent sessions never mix spans. When profiling is off
+# span()/timed() cost one attribute lookup; streamlit itself is only imported
+# by the page-level functions, so low-level modules can use span() freely.
+
+PROFILE_ENV = "EBOSS_PROFILE"
+ROOT = Path(__file__).resolve().parent.parent
+LOG_DIR = Path(os.environ.get("EBOSS_PROFILE_LOG_DIR", ROOT / "logs"))
+LOG_FILE = "rerun_spans.log"
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUPS = 5
+PANEL_HISTORY = 20
+
+_SESSION_FLAG = "_profile_enabled"
+_SESSION_ID = "_profile_session"
+_HISTORY = "_profile_history"
+_PENDING = "_profile_pending"
+_TRUTHY = ("1", "true", "yes", "on")
+
+_local = threading.local()
+_logger_lock = threading.Lock()
+_logger: Optional[logging.Logger] = None
+
+class RerunProfile:
+    def __init__(self, page: str, session: str):
+        self.page = page
+        self.session = session
+        self.started = time.time()
+        self.t0 = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        self.depth = 0
+        self._section: Optional[tuple] = None
+
+    def add(self, name: str, start: float, end: float, depth: int) -> None:
+        self.spans.append({"name": name, "start_ms": round((start - self.t0) * 1000, 3),
+                           "ms": round((end - start) * 1000, 3), "depth": depth})
+
+    def close_section(self, now: Optional[float] = None) -> None:
+        if self._section is not None:
+            name, start = self._section
+            self.add(name, start, now or time.perf_counter(), 0)
+            self._section = None
+
+    def open_section(self, name: str) -> None:
+        now = time.perf_counter()
+        self.close_section(now)
+        self._section = (name, now)
+
+    def to_record(self, total_ms: float, complete: bool = True) -> Dict[str, Any]:
+        spans = sorted(self.spans, key=lambda s: s["start_ms"])
+        return {"ts": round(self.started, 3), "session": self.session, "page": self.page,
+                "total_ms": round(total_ms, 3), "complete": complete, "spans": spans}
+
+# ── Enablement ───────────────────────────────────────────────────────────────
+def _env_enabled() -> bool:
+    return os.environ.get(PROFILE_ENV, "").strip().lower() in _TRUTHY
+
+def enabled() -> bool:
+    """True when EBOSS_PROFILE is set, or ?profile=1 was seen in this session (?profile=0 turns it off)."""
+    if _env_enabled():
+        return True
+    import streamlit as st
+    try:
+        flag = st.query_params.get("profile")
+    except Exception:
+        flag = None
+    if flag is not None:
+        st.session_state[_SESSION_FLAG] = str(flag).strip().lower() in _TRUTHY
+    return bool(st.session_state.get(_SESSION_FLAG, False))
+
+def current() -> Optional[RerunProfile]:
+    return getattr(_local, "run", None)
+
+# ── Log sink ─────────────────────────────────────────────────────────────────
+def _get_logger() -> logging.Logger:
+    global _logger
+    with _logger_lock:
+        if _logger is None:
+            logger = logging.getLogger("eboss.rerun_spans")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            try:
+                LOG_DIR.mkdir(parents=True, exist_ok=True)
+                handler: logging.Handler = RotatingFileHandler(
+                    LOG_DIR / LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8")
+            except OSError:
+                handler = logging.NullHandler()  # read-only deploy: panel only
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            _logger = logger
+        return _logger
+
+def _write(record: Dict[str, Any]) -> None:
+    _get_logger().info(json.dumps(record, separators=(",", ":")))
+
+# ── Recording ────────────────────────────────────────────────────────────────
+def start_run(page: str) -> Optional[RerunProfile]:
+    """Begin timing this rerun of `page` (no-op unless profiling is enabled)."""
+    import streamlit as st
+    _local.run = None
+    prev = st.session_state.pop(_PENDING, None)
+    if prev is not None:
+        # The previous rerun never reached finish_run (st.stop, an exception or a
+        # rerun request): log what it recorded.
+        prev.close_section()
+        _write(prev.to_record((time.perf_counter() - prev.t0) * 1000, complete=False))
+    if not enabled():
+        return None
+    session = st.session_state.setdefault(_SESSION_ID, uuid.uuid4().hex[:8])
+    run = RerunProfile(page, session)
+    _local.run = run
+    st.session_state[_PENDING] = run
+    return run
+
+def section(name: str) -> None:
+    """Start a new top-level section of the script, ending the previous one."""
+    run = current()
+    if run is not None:
+        run.open_section(name)
+
+class span:
+    """Time a block: `with span("sizing.gph_for"): ...`. Nested spans are indented in the panel."""
+    __slots__ = ("name", "run", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> "span":
+        self.run = current()
+        if self.run is not None:
+            self.run.depth += 1
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        if self.run is not None:
+            end = time.perf_counter()
+            self.run.depth -= 1
+            self.run.add(self.name, self.start, end, self.run.depth + 1)
+        return False
+
+def timed(name: Optional[str] = None) -> Callable:
+    """Decorator form of span(); the span is named after the function unless `name` is given."""
+    def deco(fn: Callable) -> Callable:
+        label = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if getattr(_local, "run", None) is None:
+                return fn(*args, **kwargs)
+            with span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+def _fragment_only_rerun() -> bool:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    ctx = get_script_run_ctx()
+    return bool(ctx is not None and ctx.fragment_ids_this_run)
+
+def fragment_run(name: str) -> Callable:
+    """
+    Decorator for st.fragment bodies (apply it under @st.fragment). When the whole
+    page reruns the fragment is an ordinary span of that run; when only the
+    fragment reruns it is logged as its own run, page "fragment:<name>", so
+    partial and full reruns can be compared in the same log.
+    """
+    def deco(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _fragment_only_rerun():
+                with span(f"fragment.{name}"):
+                    return fn(*args, **kwargs)
+            if not enabled():
+                return fn(*args, **kwargs)
+            import streamlit as st
+            run = RerunProfile(f"fragment:{name}", st.session_state.setdefault(_SESSION_ID, uuid.uuid4().hex[:8]))
+            _local.run = run
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _local.run = None
+                _write(run.to_record((time.perf_counter() - run.t0) * 1000))
+        return wrapper
+    return deco
+
+def finish_run(show_panel: bool = True) -> Optional[Dict[str, Any]]:
+    """End this rerun's timing: log it and (optionally) render the profile panel."""
+    run = current()
+    if run is None:
+        return None
+    _local.run = None
+    import streamlit as st
+    st.session_state.pop(_PENDING, None)
+    run.close_section()
+    total_ms = (time.perf_counter() - run.t0) * 1000
+    record = run.to_record(total_ms)
+    _write(record)
+
+    history = st.session_state.setdefault(_HISTORY, [])
+    history.append({"page": run.page, "total_ms": record["total_ms"], "spans": len(record["spans"])})
+    del history[:-PANEL_HISTORY]
+    if show_panel:
+        render_panel(record, history)
+    return record
+
+def render_panel(record: Dict[str, Any], history: List[Dict[str, Any]]) -> None:
+    import streamlit as st
+    with st.expander(f"⏱ Rerun profile — {record['total_ms']:.1f} ms", expanded=False):
+        rows = [{"span": "  " * s["depth"] + s["name"], "ms": s["ms"], "start_ms": s["start_ms"]}
+                for s in record["spans"]]
+        if rows:
+            st.dataframe(rows, use_container_width=True, hide_index=True)
+        st.caption(f"Last {len(history)} reruns this session (ms): "
+                   + " • ".join(f"{h['page']} {h['total_ms']:.0f}" for h in history[-10:]))
+        st.caption(f"Logged to {LOG_DIR / LOG_FILE}")
+
+__all__ = ["enabled", "finish_run", "fragment_run", "render_panel", "section", "span", "start_run", "timed"]
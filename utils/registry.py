@@ -0,0 +1,105 @@
+# utils/registry.py
+from __future__ import annotations
+import re
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+from utils.data import SPECS
+
+# Immutable spec registry, built once at import.
+#
+# SPECS is keyed by generator kVA (65) with model names like "EB125 kVA", while the
+# display sheet EBOSS_SPECS uses "EBOSS 125 kVA". Both spellings (and their rating
+# kVA) resolve to the same canonical model. Lookups return read-only
+# MappingProxyType views of the shared records, so callers never pay for a copy —
+# use dict(view) if you need to modify one. The sheet index is built on first use.
+
+_RATING_RE = re.compile(r"(\d+)\s*kva", re.IGNORECASE)
+
+def _rating_kva(name: str) -> Optional[int]:
+    m = _RATING_RE.search(str(name))
+    return int(m.group(1)) if m else None
+
+def _alias_key(name: Any) -> str:
+    """'EBOSS 125 kVA', 'eb125kva', 'EB125 kVA' -> 'eb125kva'."""
+    s = re.sub(r"[\s_\-]+", "", str(name).lower())
+    return "eb" + s[len("eboss"):] if s.startswith("eboss") else s
+
+def _build():
+    by_model, by_gen_kva, by_rating, aliases = {}, {}, {}, {}
+    for kva, rec in SPECS.items():
+        model = rec["eboss_model"]
+        view = MappingProxyType(dict(rec))
+        by_model[model] = view
+        by_gen_kva[int(kva)] = view
+        rating = _rating_kva(model)
+        if rating is not None:
+            by_rating[rating] = view
+        aliases[_alias_key(model)] = model
+
+    gen_kva = {rec["eboss_model"]: int(kva) for kva, rec in SPECS.items()}
+    return (MappingProxyType(by_model), MappingProxyType(by_gen_kva), MappingProxyType(by_rating),
+            MappingProxyType(aliases), MappingProxyType(gen_kva))
+
+BY_MODEL, BY_GEN_KVA, BY_RATING_KVA, ALIASES, GEN_KVA_BY_MODEL = _build()
+MODEL_NAMES: Tuple[str, ...] = tuple(BY_MODEL)
+
+_SHEETS: Optional[Mapping[str, Mapping[str, str]]] = None
+
+def _sheets() -> Mapping[str, Mapping[str, str]]:
+    """Display sheets by canonical model, served from the compiled spec table on first use."""
+    global _SHEETS
+    if _SHEETS is None:
+        from utils.spec_table import spec_table  # deferred: it parses the (lazy) EBOSS_SPECS
+        _SHEETS = MappingProxyType({model: MappingProxyType(sheet)
+                                    for model, sheet in spec_table("EBOSS_SPECS").sheets().items()
+                                    if model in BY_MODEL})
+    return _SHEETS
+
+def canonical_model(name: Any) -> Optional[str]:
+    """Canonical SPECS model name for any known spelling, else None."""
+    if name in BY_MODEL:
+        return name
+    if name is None:
+        return None
+    return ALIASES.get(_alias_key(name))
+
+def spec_for(name: Any) -> Optional[Mapping[str, Any]]:
+    """Read-only numeric spec record for a model name or alias."""
+    model = canonical_model(name)
+    return BY_MODEL[model] if model else None
+
+def spec_for_gen_kva(kva: Any) -> Optional[Mapping[str, Any]]:
+    try:
+        return BY_GEN_KVA.get(int(kva))
+    except (TypeError, ValueError):
+        return None
+
+def spec_for_rating_kva(kva: Any) -> Optional[Mapping[str, Any]]:
+    try:
+        return BY_RATING_KVA.get(int(kva))
+    except (TypeError, ValueError):
+        return None
+
+def gen_kva_for(name: Any) -> Optional[int]:
+    """Generator kVA (SPECS key) used by the Full Hybrid of this model."""
+    model = canonical_model(name)
+    return GEN_KVA_BY_MODEL[model] if model else None
+
+def sheet_for(name: Any) -> Optional[Mapping[str, str]]:
+    """Read-only EBOSS_SPECS display sheet for a model name or alias."""
+    model = canonical_model(name)
+    return _sheets().get(model) if model else None
+
+__all__ = [
+    "BY_GEN_KVA",
+    "BY_MODEL",
+    "BY_RATING_KVA",
+    "MODEL_NAMES",
+    "canonical_model",
+    "gen_kva_for",
+    "sheet_for",
+    "spec_for",
+    "spec_for_gen_kva",
+    "spec_for_rating_kva",
+]
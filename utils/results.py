@@ -0,0 +1,199 @@
+# utils/results.py
+from __future__ import annotations
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Type
+
+import numpy as np
+
+# Result types for the sizing/cost calculators.
+#
+# Each result is a frozen dataclass with __slots__ (no per-instance __dict__),
+# so it is small, safe to share out of the process-wide memo caches, and has
+# plain attribute access. They also implement the read-only Mapping interface,
+# so existing code that does result["gph"], result.get(...), `"x" in result` or
+# dict(result) keeps working unchanged.
+#
+# ResultBatch is the columnar counterpart for fleet-scale runs: one NumPy array
+# per field instead of one object per result.
+
+class ResultMapping(Mapping):
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in type(self).__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(type(self).__dataclass_fields__)
+
+    def __len__(self) -> int:
+        return len(type(self).__dataclass_fields__)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Shallow {field: value} copy (nested values are shared, not copied)."""
+        return {name: getattr(self, name) for name in type(self).__dataclass_fields__}
+
+@dataclass(frozen=True, slots=True)
+class LoadSpecs(ResultMapping):
+    """calculations.calculate_load_specs(...)"""
+    model_capacity: float
+    peak_utilization: float
+    continuous_utilization: float
+    charge_rate: float
+    battery_capacity: float
+    charge_time: float
+    fuel_consumption_gph: Optional[float]
+    fuel_per_day: float
+    co2_per_day: float
+    engine_load_percent: float
+    generator_data: Optional[Mapping] = None
+
+@dataclass(frozen=True, slots=True)
+class StandardGeneratorSpecs(ResultMapping):
+    """calculations.calculate_standard_generator_specs(...)"""
+    generator_type: str
+    generator_size: str
+    engine_load_percent: float
+    continuous_load_percent: float
+    fuel_consumption_gph: float
+    fuel_per_hour: float
+    fuel_per_day: float
+    fuel_per_week: float
+    fuel_per_month: float
+    co2_per_day: float
+    runtime_per_day: float
+    tank_runtime_hours: float
+    noise_level: float
+    dimensions: str
+    weight_lbs: float
+    fuel_tank_capacity: float
+
+@dataclass(frozen=True, slots=True)
+class MonthlyCosts(ResultMapping):
+    """utils.cost.monthly_costs(...)"""
+    monthly_hours: float
+    gallons: float
+    fuel_total: float
+    total_cost: float
+    co2_tons: float
+
+@dataclass(frozen=True, slots=True)
+class SizedSpec(ResultMapping):
+    """utils.spec_store.compute_and_store_spec(...): the model's SPECS record plus the sizing result."""
+    eboss_model: str
+    pm_charge_rate: float
+    fh_charge_rate: float
+    max_charge_rate: float
+    kwh: float
+    gen_kw: float
+    max_cont_kw: float
+    max_peak_kw: float
+    equipment_type: str
+    actual_cont_kw: float
+    gph: float
+    engine_load_percent: float
+    gen_kva_used: int
+    inputs: Tuple[Tuple[str, Any], ...] = ()
+    derived: Optional[Dict[str, Any]] = None   # DerivedResult.as_state(), set by compute_and_store_derived
+
+@dataclass(frozen=True, slots=True)
+class Comparison(ResultMapping):
+    """utils.compare.compare(...): EBOSS vs standard generator at one load, and EBOSS minus standard."""
+    eboss_engine_load_percent: float
+    standard_engine_load_percent: float
+    diff_engine_load_percent: float
+    eboss_fuel_gph: float
+    standard_fuel_gph: float
+    diff_fuel_gph: float
+    eboss_fuel_per_day: float
+    standard_fuel_per_day: float
+    diff_fuel_per_day: float
+    eboss_fuel_per_month: float
+    standard_fuel_per_month: float
+    diff_fuel_per_month: float
+    eboss_co2_per_day: float
+    standard_co2_per_day: float
+    diff_co2_per_day: float
+
+# ── Columnar batches ─────────────────────────────────────────────────────────
+_FLOAT_TYPES = {"float", "Optional[float]"}
+_INT_TYPES = {"int"}
+
+def _dtype(annotation: Any) -> Any:
+    name = annotation if isinstance(annotation, str) else getattr(annotation, "__name__", "")
+    if name in _FLOAT_TYPES:
+        return np.float64
+    if name in _INT_TYPES:
+        return np.int64
+    return object
+
+class ResultBatch(Sequence):
+    """
+    Many results of one type stored column-wise: batch.column("gph") is a
+    float64 array, batch[i] rebuilds the i-th result object on demand.
+    Optional float fields store None as NaN.
+    """
+    __slots__ = ("kind", "columns", "_n")
+
+    def __init__(self, kind: Type[ResultMapping], columns: Dict[str, Any]):
+        self.kind = kind
+        self.columns: Dict[str, np.ndarray] = {}
+        n = None
+        for f in fields(kind):
+            col = np.asarray(columns[f.name], dtype=_dtype(f.type))
+            if col.ndim != 1 or (n is not None and len(col) != n):
+                raise ValueError(f"Column {f.name!r} must be 1-D with one value per result.")
+            n = len(col)
+            self.columns[f.name] = col
+        self._n = n or 0
+
+    @classmethod
+    def from_results(cls, kind: Type[ResultMapping], results: Iterable[Mapping]) -> "ResultBatch":
+        rows = list(results)
+        columns = {}
+        for f in fields(kind):
+            values = [r[f.name] for r in rows]
+            if _dtype(f.type) is np.float64:
+                values = [np.nan if v is None else v for v in values]
+            columns[f.name] = values if values else np.empty(0, dtype=_dtype(f.type))
+        return cls(kind, columns)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return ResultBatch(self.kind, {name: col[i] for name, col in self.columns.items()})
+        values = {}
+        for f in fields(self.kind):
+            v = self.columns[f.name][i]
+            if isinstance(v, np.generic):
+                v = v.item()
+            if f.type == "Optional[float]" and v != v:  # NaN -> None
+                v = None
+            values[f.name] = v
+        return self.kind(**values)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the numeric columns (object columns count their pointer arrays only)."""
+        return sum(col.nbytes for col in self.columns.values())
+
+    def to_frame(self):
+        import pandas as pd
+        return pd.DataFrame(self.columns)
+
+__all__ = [
+    "Comparison",
+    "LoadSpecs",
+    "MonthlyCosts",
+    "ResultBatch",
+    "ResultMapping",
+    "SizedSpec",
+    "StandardGeneratorSpecs",
+]
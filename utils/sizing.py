@@ -1,36 +1,36 @@
 # utils/sizing.py
 from __future__ import annotations
-from typing import Dict, List, Tuple, Optional
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, List, Mapping, Tuple, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:  # pandas is only needed by the batch API; imported there on first use
+    import pandas as pd
+
+from utils.profiling import timed
 
 # --- Safe imports: never crash at import time ---
 try:
-    from utils.data import SPECS as _SPECS  # your calc/spec table keyed by kVA
+    from utils.registry import gen_kva_for as _gen_kva_for, spec_for as _spec_for
 except Exception:
-    _SPECS: Dict[int, Dict] = {}
+    _gen_kva_for = lambda model_name: None
+    _spec_for = lambda model_name: None
 
-# Try preferred name first, then legacy, else empty dict (functions will guard)
+# Empty dict if the curves are missing (functions will guard)
 try:
     from utils.data import FUEL_BURN_CURVES as FUEL_CURVES
 except Exception:
-    try:
-        from utils.data import EBOSS_LOAD_REFERENCE as FUEL_CURVES  # back-compat
-    except Exception:
-        FUEL_CURVES: Dict[int, List[Tuple[float, float]]] = {}
+    FUEL_CURVES: Dict[int, List[Tuple[float, float]]] = {}
 
 # ── Small helpers over your data ──────────────────────────────────────────────
-def _spec_by_model(model_name: str) -> Dict:
-    """Return the numeric spec record for a model string like 'EB125 kVA'."""
-    for kva, rec in _SPECS.items():
-        if rec.get("eboss_model") == model_name:
-            return dict(rec)
-    return {}
+def _spec_by_model(model_name: str) -> Mapping:
+    """Read-only spec record for a model string like 'EB125 kVA' (or alias 'EBOSS 125 kVA')."""
+    return _spec_for(model_name) or {}
 
 def _hybrid_kva_for_model(model_name: str) -> Optional[int]:
     """Which gen kVA curve to use for Full Hybrid for this model."""
-    for kva, rec in _SPECS.items():
-        if rec.get("eboss_model") == model_name:
-            return int(kva)
-    return None
+    return _gen_kva_for(model_name)
 
 def eboss_defined_charge_rate_kw(model: str, eboss_type: str) -> float:
     """
@@ -45,20 +45,48 @@ def eboss_defined_charge_rate_kw(model: str, eboss_type: str) -> float:
     return float(rec.get(key, 0.0))
 
 # ── Fuel curve interpolation ──────────────────────────────────────────────────
+# Curves are compiled once at import: sorted points per kVA for the scalar path,
+# and contiguous NumPy arrays (one row per kVA) for the batch path.
+_CURVES_MISSING_MSG = (
+    "Fuel-burn curves are missing. Define FUEL_BURN_CURVES in utils/data.py."
+)
+
+def _compile_curves(curves: Dict[int, List[Tuple[float, float]]]):
+    sizes = tuple(sorted(int(k) for k in curves))
+    points = {kva: tuple(sorted(curves[kva], key=lambda p: p[0])) for kva in sizes}
+    width = max((len(p) for p in points.values()), default=0)
+    xs = np.empty((len(sizes), width), dtype=np.float64)
+    ys = np.empty((len(sizes), width), dtype=np.float64)
+    lens = np.empty(len(sizes), dtype=np.intp)
+    for row, kva in enumerate(sizes):
+        pts = points[kva]
+        n = len(pts)
+        xs[row, :n] = [p[0] for p in pts]
+        ys[row, :n] = [p[1] for p in pts]
+        # Pad short curves with their last point so every row is a valid, flat tail.
+        xs[row, n:] = xs[row, n - 1]
+        ys[row, n:] = ys[row, n - 1]
+        lens[row] = n
+    return sizes, points, np.array(sizes, dtype=np.float64), xs, ys, lens
+
+_CURVE_SIZES, _CURVE_POINTS, _CURVE_KVA, _CURVE_X, _CURVE_Y, _CURVE_LEN = _compile_curves(FUEL_CURVES)
+
 def _interp(x0: float, y0: float, x1: float, y1: float, x: float) -> float:
     if x1 == x0:
         return y0
     return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
 
 def _nearest_curve_size(gen_kva: int) -> int:
-    """Pick nearest available kVA curve if exact size is missing."""
-    if not FUEL_CURVES:
-        raise RuntimeError(
-            "Fuel-burn curves are missing. Define FUEL_BURN_CURVES in utils/data.py "
-            "or provide EBOSS_LOAD_REFERENCE for back-compat."
-        )
-    sizes = sorted(FUEL_CURVES.keys())
-    return min(sizes, key=lambda s: abs(s - gen_kva))
+    """Pick nearest available kVA curve if exact size is missing (ties go to the smaller size)."""
+    if not _CURVE_SIZES:
+        raise RuntimeError(_CURVES_MISSING_MSG)
+    i = bisect_left(_CURVE_SIZES, gen_kva)
+    if i == 0:
+        return _CURVE_SIZES[0]
+    if i == len(_CURVE_SIZES):
+        return _CURVE_SIZES[-1]
+    lo, hi = _CURVE_SIZES[i - 1], _CURVE_SIZES[i]
+    return hi if abs(hi - gen_kva) < abs(lo - gen_kva) else lo
 
 def fuel_gph_at_load(gen_kva: int, load_fraction: float) -> float:
     """
@@ -66,16 +94,13 @@ def fuel_gph_at_load(gen_kva: int, load_fraction: float) -> float:
     - If the curve for gen_kva doesn't exist, we use the nearest available kVA curve.
     - load_fraction is clamped to the curve's min/max x (typically 0.25..1.00).
     """
-    if not FUEL_CURVES:
-        raise RuntimeError(
-            "Fuel-burn curves are missing. Define FUEL_BURN_CURVES in utils/data.py "
-            "or provide EBOSS_LOAD_REFERENCE for back-compat."
-        )
+    if not _CURVE_SIZES:
+        raise RuntimeError(_CURVES_MISSING_MSG)
 
-    if gen_kva not in FUEL_CURVES:
-        gen_kva = _nearest_curve_size(gen_kva)
+    points = _CURVE_POINTS.get(gen_kva)
+    if points is None:
+        points = _CURVE_POINTS[_nearest_curve_size(gen_kva)]
 
-    points: List[Tuple[float, float]] = sorted(FUEL_CURVES[gen_kva], key=lambda p: p[0])
     x_min, x_max = points[0][0], points[-1][0]
     x = max(x_min, min(x_max, float(load_fraction)))
 
@@ -87,6 +112,47 @@ def fuel_gph_at_load(gen_kva: int, load_fraction: float) -> float:
 
     return points[-1][1]  # fallback (shouldn't hit with clamp)
 
+def _nearest_curve_rows(gen_kva: np.ndarray) -> np.ndarray:
+    """Row index into the compiled curve arrays for each requested kVA (nearest size)."""
+    kva = np.asarray(gen_kva, dtype=np.float64)
+    hi = np.searchsorted(_CURVE_KVA, kva, side="left").clip(0, len(_CURVE_KVA) - 1)
+    lo = (hi - 1).clip(0, None)
+    take_hi = np.abs(_CURVE_KVA[hi] - kva) < np.abs(_CURVE_KVA[lo] - kva)
+    return np.where(take_hi, hi, lo)
+
+def fuel_gph_at_load_many(gen_kva, load_fraction) -> np.ndarray:
+    """
+    Batch form of fuel_gph_at_load over arrays of (gen_kva, load_fraction).
+    Inputs broadcast against each other; returns a float64 array of GPH with the
+    broadcast shape. Same rules as the scalar version: nearest kVA curve, and the
+    load fraction is clamped to the curve's x-range.
+    """
+    if not _CURVE_SIZES:
+        raise RuntimeError(_CURVES_MISSING_MSG)
+
+    kva, frac = np.broadcast_arrays(
+        np.asarray(gen_kva, dtype=np.float64),
+        np.asarray(load_fraction, dtype=np.float64),
+    )
+    shape = kva.shape
+    rows = _nearest_curve_rows(kva.ravel())
+    x = frac.ravel()
+
+    xs = _CURVE_X[rows]
+    ys = _CURVE_Y[rows]
+    last = _CURVE_LEN[rows] - 1
+    x = np.clip(x, xs[:, 0], xs[np.arange(len(rows)), last])
+
+    # Segment index per point: count of breakpoints strictly below x, kept inside [1, last].
+    seg = (xs < x[:, None]).sum(axis=1).clip(1, np.maximum(last, 1))
+    idx = np.arange(len(rows))
+    x0, x1 = xs[idx, seg - 1], xs[idx, seg]
+    y0, y1 = ys[idx, seg - 1], ys[idx, seg]
+    span = x1 - x0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(span > 0, y0 + (y1 - y0) * (x - x0) / span, y0)
+    return out.reshape(shape)
+
 # ── EBOSS & Standard GPH calculators ─────────────────────────────────────────
 def gph_for_eboss(
     model: str,
@@ -137,6 +203,7 @@ def gph_for_standard(
     gph = fuel_gph_at_load(gen_kva_used, load_frac)
     return (float(gph), load_frac * 100.0, int(gen_kva_used))
 
+@timed()
 def gph_for(
     *,
     model: Optional[str],
@@ -161,10 +228,90 @@ def gph_for(
         return (0.0, 0.0, 0)
     return gph_for_standard(cont_kw=cont_kw, std_gen_kw_rating=float(gen_kw), std_gen_kva=int(size_kva))
 
+# ── Batch calculator over whole job lists ───────────────────────────────────
+GPH_JOB_COLUMNS = ("model", "type", "cont_kw", "pm_gen", "std_gen_kw", "std_gen_kva")
+
+def _numeric_column(frame: pd.DataFrame, name: str) -> np.ndarray:
+    if name not in frame:
+        return np.zeros(len(frame), dtype=np.float64)
+    import pandas as pd
+    return pd.to_numeric(frame[name], errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+
+def _model_column(frame: pd.DataFrame, field: str) -> np.ndarray:
+    """Per-row numeric SPECS field for the row's model (0 for unknown models)."""
+    if "model" not in frame:
+        return np.zeros(len(frame), dtype=np.float64)
+    lookup = {name: float(_spec_by_model(name).get(field, 0.0)) for name in frame["model"].dropna().unique()}
+    return frame["model"].map(lookup).fillna(0.0).to_numpy(dtype=np.float64)
+
+def gph_for_many(jobs=None, **columns) -> pd.DataFrame:
+    """
+    Vectorized gph_for over many jobs in one pass.
+
+    `jobs` is a DataFrame or a mapping of equal-length columns; columns may also be
+    passed as keyword arrays. Recognised columns (missing ones default to empty/0):
+    model, type, cont_kw, pm_gen, std_gen_kw, std_gen_kva.
+
+    Returns a DataFrame (same index as the jobs) with
+    gph, engine_load_percent and gen_kva_used — row-for-row identical to gph_for(...).
+    """
+    import pandas as pd
+
+    if isinstance(jobs, pd.DataFrame):
+        frame = jobs.assign(**columns) if columns else jobs
+    else:
+        frame = pd.DataFrame({**dict(jobs or {}), **columns})
+
+    n = len(frame)
+    etype = frame["type"] if "type" in frame else pd.Series("", index=frame.index)
+    is_fh = (etype == "Full Hybrid").to_numpy()
+    is_pm = (etype == "Power Module").to_numpy()
+    is_std = ~(is_fh | is_pm)
+
+    cont_kw = _numeric_column(frame, "cont_kw")
+    pm_gen = np.trunc(_numeric_column(frame, "pm_gen"))
+    std_gen_kw = _numeric_column(frame, "std_gen_kw")
+    std_gen_kva = np.trunc(_numeric_column(frame, "std_gen_kva"))
+
+    # EBOSS rule: engine load = defined charge rate / actual continuous load
+    charge_kw = np.where(is_fh, _model_column(frame, "fh_charge_rate"), _model_column(frame, "pm_charge_rate"))
+    hybrid_kva = np.zeros(n, dtype=np.float64)
+    if "model" in frame:
+        # resolved through the registry like _model_column, so aliases match gph_for
+        kva_lookup = {name: float(_hybrid_kva_for_model(name) or 0) for name in frame["model"].dropna().unique()}
+        hybrid_kva = frame["model"].map(kva_lookup).fillna(0.0).to_numpy(dtype=np.float64)
+    eboss_kva = np.where(is_fh, hybrid_kva, pm_gen)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eboss_frac = np.clip(charge_kw / cont_kw, 0.0, 1.0)
+        std_frac = np.clip(cont_kw / std_gen_kw, 0.0, 1.0)
+
+    eboss_ok = (is_fh | is_pm) & (charge_kw > 0) & (cont_kw > 0) & (eboss_kva > 0)
+    std_ok = is_std & (cont_kw > 0) & (std_gen_kw > 0) & (std_gen_kva > 0)
+
+    frac = np.where(eboss_ok, eboss_frac, np.where(std_ok, std_frac, 0.0))
+    kva_used = np.where(eboss_ok, eboss_kva, np.where(std_ok, std_gen_kva, 0.0))
+    ok = eboss_ok | std_ok
+
+    gph = np.zeros(n, dtype=np.float64)
+    if ok.any():
+        gph[ok] = fuel_gph_at_load_many(kva_used[ok], frac[ok])
+
+    return pd.DataFrame(
+        {
+            "gph": gph,
+            "engine_load_percent": np.where(ok, frac * 100.0, 0.0),
+            "gen_kva_used": kva_used.astype(np.int64),
+        },
+        index=frame.index,
+    )
+
 __all__ = [
     "fuel_gph_at_load",
+    "fuel_gph_at_load_many",
     "gph_for_eboss",
     "gph_for_standard",
     "gph_for",
+    "gph_for_many",
     "eboss_defined_charge_rate_kw",
 ]
@@ -0,0 +1,90 @@
+# utils/snapshot.py
+from __future__ import annotations
+import hashlib
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Binary snapshot of the parsed fault-code file.
+#
+# Build it once per image with `python -m utils.snapshot`; at run time the fault
+# dictionary is read from the snapshot instead of being re-parsed from JSON.
+# marshal is used because it is the fastest stdlib loader for plain
+# dict/list/str/float data; its format is tied to the Python version, so the
+# header records it and a mismatched, stale or missing snapshot simply falls
+# back to parsing the JSON. The utils.data tables stay on their literal builders.
+
+MAGIC = b"EBSNAP\x00\x01"
+ROOT = Path(__file__).resolve().parent.parent
+SNAPSHOT_PATH = Path(os.environ.get("EBOSS_SNAPSHOT", ROOT / "data" / "eboss_snapshot.bin"))
+
+_HEADER = MAGIC + bytes(sys.version_info[:2]) + bytes([marshal.version])
+_loaded: Dict[str, Any] = {}
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+def _read(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        blob = Path(path).read_bytes()
+    except OSError:
+        return None
+    if not blob.startswith(_HEADER):
+        return None
+    try:
+        snap = marshal.loads(blob[len(_HEADER):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return snap if isinstance(snap, dict) else None
+
+def load_snapshot(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """The snapshot dict (read once per process), or None if absent/incompatible."""
+    path = Path(path or SNAPSHOT_PATH)
+    key = str(path)
+    if key not in _loaded:
+        _loaded[key] = _read(path)
+    return _loaded[key]
+
+def load_faults(source: Path, path: Optional[Path] = None) -> Optional[Dict[str, Dict[str, dict]]]:
+    """Pre-parsed fault dictionary for `source`, if the snapshot was built from identical bytes."""
+    snap = load_snapshot(path)
+    entry = (snap or {}).get("faults")
+    if not entry:
+        return None
+    try:
+        if entry.get("digest") != file_digest(source):
+            return None
+    except OSError:
+        return None
+    return entry.get("faults")
+
+def build_snapshot(path: Optional[Path] = None, fault_source: Optional[Path] = None) -> Path:
+    """Compile the local fault JSON (if found) into a snapshot file."""
+    import json
+
+    snap: Dict[str, Any] = {}
+
+    if fault_source is None:
+        from fault_lookup_widget import LOCAL_CANDIDATES
+        fault_source = next((p for p in LOCAL_CANDIDATES if p.exists()), None)
+    if fault_source is not None:
+        from fault_lookup_widget import parse_rows_to_faults
+        rows = json.loads(Path(fault_source).read_text(encoding="utf-8"))
+        snap["faults"] = {"digest": file_digest(fault_source), "faults": parse_rows_to_faults(rows)}
+
+    path = Path(path or SNAPSHOT_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(_HEADER + marshal.dumps(snap))
+    tmp.replace(path)
+    _loaded.pop(str(path), None)
+    return path
+
+if __name__ == "__main__":
+    out = build_snapshot(Path(sys.argv[1]) if len(sys.argv) > 1 else None)
+    snap = load_snapshot(out) or {}
+    print(f"wrote {out} ({out.stat().st_size:,} bytes): faults={'yes' if snap.get('faults') else 'no'}")
+
+__all__ = ["SNAPSHOT_PATH", "build_snapshot", "load_faults", "load_snapshot"]
@@ -1,23 +1,48 @@
 # utils/spec_store.py
 from __future__ import annotations
-from typing import Optional, Dict, Any
+from typing import Optional, Any, Mapping, Tuple
 import streamlit as st
-from utils.data import SPECS
+from utils.cache import LRUCache
+from utils.profiling import timed
+from utils.registry import canonical_model, spec_for
 from utils.sizing import gph_for          # returns (gph, engine_load_pct, gen_kva_used)
 from utils.keys import CANON as K
 from utils.derived import compute_and_store_derived  # computes battery/run/gpd/gpm, etc.
+from utils.results import SizedSpec
 
-def _lookup_static_spec(model: str) -> Dict[str, Any]:
-    for rec in SPECS.values():
-        if rec.get("eboss_model") == model:
-            return dict(rec)
-    raise KeyError(f"Unknown EBOSS model: {model}")
+# Per-session merged-spec cache: bounded so slider drags can't grow session memory.
+SPEC_CACHE_MAXSIZE = 64
+SPEC_CACHE_TTL_S = 30 * 60
 
-def compute_and_store_spec(*, model: str, type: str, cont_kw: float,
-                           gen_kw: Optional[float] = None,
-                           size_kva: Optional[int] = None,
-                           pm_gen: Optional[int] = None) -> Dict[str, Any]:
-    """Build merged spec (incl. interpolated GPH), cache it in session, and compute derived metrics."""
+def _lookup_static_spec(model: str) -> Mapping[str, Any]:
+    rec = spec_for(model)
+    if rec is None:
+        raise KeyError(f"Unknown EBOSS model: {model}")
+    return rec
+
+def _opt_float(x) -> Optional[float]:
+    return None if x is None or x == "" else round(float(x), 3)
+
+def _opt_int(x) -> Optional[int]:
+    return None if x is None or x == "" else int(x)
+
+def spec_cache_key(*, model: str, type: str, cont_kw: float,
+                   gen_kw: Optional[float] = None,
+                   size_kva: Optional[int] = None,
+                   pm_gen: Optional[int] = None) -> Tuple:
+    """Normalized cache key: aliases collapse to one model, kW rounded to 1 W."""
+    return (canonical_model(model) or model, type, round(float(cont_kw), 3),
+            _opt_float(gen_kw), _opt_int(size_kva), _opt_int(pm_gen))
+
+def get_spec_cache() -> LRUCache:
+    cache = st.session_state.get(K["spec_cache"])
+    if not isinstance(cache, LRUCache):
+        cache = LRUCache(maxsize=SPEC_CACHE_MAXSIZE, ttl=SPEC_CACHE_TTL_S)
+        st.session_state[K["spec_cache"]] = cache
+    return cache
+
+def _build_spec(*, model: str, type: str, cont_kw: float,
+                gen_kw: Optional[float], size_kva: Optional[int], pm_gen: Optional[int]) -> SizedSpec:
     base = _lookup_static_spec(model)
 
     gph, pct, used_kva = gph_for(
@@ -25,23 +50,29 @@ def compute_and_store_spec(*, model: str, type: str, cont_kw: float,
         gen_kw=gen_kw, size_kva=size_kva, pm_gen=pm_gen
     )
 
-    merged = {
+    return SizedSpec(
         **base,
-        "equipment_type": type,
-        "actual_cont_kw": float(cont_kw),
-        "gph": float(gph),
-        "engine_load_percent": float(pct),
-        "gen_kva_used": int(used_kva) if used_kva else 0,
-        "_inputs": {
-            "gen_kw": gen_kw,
-            "size_kva": size_kva,
-            "pm_gen": pm_gen,
-        },
-    }
-
-    key = f"{model}|{type}|ckw={cont_kw:.3f}|skva={size_kva or ''}|pm={pm_gen or ''}"
-    cache = st.session_state.setdefault(K["spec_cache"], {})
-    cache[key] = merged
+        equipment_type=type,
+        actual_cont_kw=float(cont_kw),
+        gph=float(gph),
+        engine_load_percent=float(pct),
+        gen_kva_used=int(used_kva) if used_kva else 0,
+        inputs=(("gen_kw", gen_kw), ("size_kva", size_kva), ("pm_gen", pm_gen)),
+    )
+
+@timed()
+def compute_and_store_spec(*, model: str, type: str, cont_kw: float,
+                           gen_kw: Optional[float] = None,
+                           size_kva: Optional[int] = None,
+                           pm_gen: Optional[int] = None) -> SizedSpec:
+    """Build merged spec (incl. interpolated GPH), cache it in session, and compute derived metrics."""
+    key = spec_cache_key(model=model, type=type, cont_kw=cont_kw,
+                         gen_kw=gen_kw, size_kva=size_kva, pm_gen=pm_gen)
+    merged = get_spec_cache().get_or_set(key, lambda: _build_spec(
+        model=model, type=type, cont_kw=cont_kw,
+        gen_kw=gen_kw, size_kva=size_kva, pm_gen=pm_gen,
+    ))
+
     st.session_state[K["current_spec_key"]] = key
     st.session_state[K["current_spec"]] = merged
 
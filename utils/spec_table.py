@@ -0,0 +1,283 @@
+# utils/spec_table.py
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+import utils.data as _data
+
+# Typed, columnar view of the display spec sheets.
+#
+# EBOSS_SPECS / EBOSS_SPEC_SHEET hold display strings ("194 A / 37.2 kW",
+# "≈ 18,000 lbs", "-22°F to 130°F"). compile_sheet() parses every value once
+# into rows of (model, label, part, value, unit, min, max, approx), one row per
+# quantity in the string; spec_table() keeps one compiled table per sheet for the
+# life of the process. Pages read numbers as arrays aligned to MODEL_NAMES, and
+# the display text is rendered once, at compile time, from the parsed quantities
+# (format_quantity), so every sheet shows the same units and number format
+# ("30 kva / 24 kw" -> "30 kVA / 24 kW"). registry.sheet_for and the comparison
+# table serve that column; differences are computed from the value arrays.
+#
+# Strings that are not plain quantities ("Airman SDG45", "120/240 (1Φ) • ...",
+# "2 Years, 2000 Hours") keep their text and get a single row with value NaN.
+
+SHEETS = ("EBOSS_SPECS", "EBOSS_SPEC_SHEET", "EBOSS_COMPARISON_SPECS", "STANDARD_COMPARISON_SPECS")
+_UNCANONICAL = frozenset({"STANDARD_COMPARISON_SPECS"})   # keyed by generator size, not EBOSS model
+
+_UNITS = {
+    "a": "A", "hz": "Hz", "kva": "kVA", "kw": "kW", "kwh": "kWh", "mwh": "MWh", "vdc": "VDC",
+    "lb": "lbs", "lbs": "lbs", "gal": "gal", '"': "in", "”": "in",
+    "min": "min", "minute": "min", "minutes": "min", "hour": "h", "hours": "h",
+    "year": "yr", "years": "yr", "cycles": "cycles", "°f": "°F", "°c": "°C",
+}
+# (singular, plural) display names; units not listed print as is after a space
+_UNIT_TEXT = {"h": ("hour", "hours"), "yr": ("year", "years"), "cycles": ("cycle", "cycles")}
+_GLUED_UNITS = {"in": "”", "°F": "°F", "°C": "°C"}
+
+_NUM = r"-?\d[\d,]*(?:\.\d+)?"
+_QTY_RE = re.compile(rf"\s*({_NUM})(K?)\s*([A-Za-z°]+|[\"”])?\s*", re.IGNORECASE)
+_SEP_RE = re.compile(r"\s*(?:/|\bx\b|\bto\b)?\s*", re.IGNORECASE)
+_PREFIX_RE = re.compile(r"^\s*(≈|~|<|>|=)?\s*")
+_SUFFIX_RE = re.compile(r"\s*(\([^()]*\)|\bat\b.*)$", re.IGNORECASE)   # "(Hybrid units only)", "at 90% DOD"
+
+@dataclass(frozen=True, slots=True)
+class Quantity:
+    value: float
+    unit: str = ""
+    min: float = float("nan")
+    max: float = float("nan")
+    approx: bool = False
+
+def _unit(raw: Optional[str]) -> str:
+    if not raw:
+        return ""
+    return _UNITS.get(raw.lower(), raw)
+
+def parse_spec_value(text: str) -> Tuple[Quantity, ...]:
+    """
+    Quantities in one display string, or () when it is not a plain quantity.
+
+    "194 A / 37.2 kW", "194 A 37.2 kW" -> 194 A, 37.2 kW;  "5100 / 5500 lbs" -> 5100 lbs, 5500 lbs
+    "-22°F to 130°F"  -> one quantity with min -22 and max 130 (value NaN)
+    "≈ 18,000 lbs"    -> approx;  "< 45 min" -> max 45;  "90K Cycles at 90% DOD" -> 90000 cycles
+    """
+    return _parse(text)[0]
+
+def _parse(text: str) -> Tuple[Tuple[Quantity, ...], Tuple[str, ...], str]:
+    """(quantities, separators between them, trailing qualifier such as "at 90% DOD")."""
+    s = str(text)
+    prefix = _PREFIX_RE.match(s)
+    marker = prefix.group(1) or ""
+    suffix = _SUFFIX_RE.search(s[prefix.end():])
+    body = s[prefix.end():suffix.start()] if suffix else s[prefix.end():]
+    qualifier = suffix.group(1) if suffix else ""
+    parts: List[Tuple[float, str]] = []
+    seps: List[str] = []
+    pos = 0
+    while pos < len(body):
+        m = _QTY_RE.match(body, pos)
+        if m is None:
+            return (), (), ""
+        value = float(m.group(1).replace(",", "")) * (1000.0 if m.group(2) else 1.0)
+        parts.append((value, _unit(m.group(3))))
+        pos = m.end()
+        if pos < len(body):
+            sep = _SEP_RE.match(body, pos)
+            if sep.end() == pos and not parts[-1][1]:   # "194 A 37.2 kW" is fine, "24 7" is not
+                return (), (), ""
+            seps.append(sep.group(0).strip().lower())
+            pos = sep.end()
+    if not parts or len(seps) != len(parts) - 1:
+        return (), (), ""
+
+    # "5100 / 5500 lbs", "231  / 532 kW": a bare number takes the unit of the next quantity
+    units = [u for _, u in parts]
+    for i in range(len(units) - 2, -1, -1):
+        if not units[i] and seps[i] == "/":
+            units[i] = units[i + 1]
+    approx = marker in ("≈", "~")
+
+    if seps == ["to"]:
+        (lo, _), (hi, _) = parts
+        return (Quantity(float("nan"), units[1] or units[0], lo, hi, approx),), ("to",), qualifier
+    out = []
+    for (value, _), unit in zip(parts, units):
+        lo = value if marker != "<" else float("nan")
+        hi = value if marker != ">" else float("nan")
+        out.append(Quantity(value, unit, lo, hi, approx))
+    return tuple(out), tuple(seps), qualifier
+
+def _num(x: float, digits: int) -> str:
+    return f"{x:,.0f}" if float(x).is_integer() else f"{x:,.{digits}f}".rstrip("0")
+
+def _with_unit(x: float, unit: str, digits: int) -> str:
+    if unit in _GLUED_UNITS:
+        return _num(x, digits) + _GLUED_UNITS[unit]
+    if unit in _UNIT_TEXT:
+        unit = _UNIT_TEXT[unit][x != 1]
+    return f"{_num(x, digits)} {unit}".rstrip()
+
+def format_quantity(q: Quantity, digits: int = 2, marker: bool = True) -> str:
+    """Display text for a quantity: 18000 lbs (approx) -> '≈ 18,000 lbs'; -22..130 °F -> '-22°F to 130°F'."""
+    if np.isnan(q.value):
+        return _with_unit(q.min, q.unit, digits) + " to " + _with_unit(q.max, q.unit, digits)
+    body = _with_unit(q.value, q.unit, digits)
+    if not marker:
+        return body
+    if q.approx:
+        return "≈ " + body
+    if np.isnan(q.min):
+        return "< " + body
+    if np.isnan(q.max):
+        return "> " + body
+    return body
+
+def format_spec(quantities: Sequence[Quantity], seps: Sequence[str] = (), qualifier: str = "") -> str:
+    """Display text for a parsed entry: quantities joined by their separators, e.g. '40” x 48” x 46”'."""
+    text = format_quantity(quantities[0])
+    for sep, q in zip(list(seps) or [""] * (len(quantities) - 1), quantities[1:]):
+        text += f" {sep or '/'} " + format_quantity(q, marker=False)
+    return f"{text} {qualifier}" if qualifier else text
+
+# ── Compiled table ───────────────────────────────────────────────────────────
+class SpecTable:
+    """One row per quantity: parallel NumPy columns plus a (model, label) index."""
+    __slots__ = ("name", "models", "labels", "text", "display", "part", "value", "unit", "min", "max",
+                 "approx", "_index", "_sheets")
+
+    def __init__(self, name: str, rows: List[Tuple[str, str, str, str, int, Quantity]]):
+        self.name = name
+        self.models = np.array([r[0] for r in rows], dtype=object)
+        self.labels = np.array([r[1] for r in rows], dtype=object)
+        self.text = np.array([r[2] for r in rows], dtype=object)       # source string
+        self.display = np.array([r[3] for r in rows], dtype=object)    # rendered from the quantities
+        self.part = np.array([r[4] for r in rows], dtype=np.int16)
+        self.value = np.array([r[5].value for r in rows], dtype=np.float64)
+        self.unit = np.array([r[5].unit for r in rows], dtype=object)
+        self.min = np.array([r[5].min for r in rows], dtype=np.float64)
+        self.max = np.array([r[5].max for r in rows], dtype=np.float64)
+        self.approx = np.array([r[5].approx for r in rows], dtype=bool)
+        self._index: Dict[Tuple[str, str], List[int]] = {}
+        for i, (model, label) in enumerate(zip(self.models.tolist(), self.labels.tolist())):
+            self._index.setdefault((model, label), []).append(i)
+        self._sheets: Optional[Dict[str, Dict[str, str]]] = None
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def _row(self, model: str, label: str, unit: Optional[str], part: int) -> Optional[int]:
+        rows = self._index.get((model, label), ())
+        if unit is not None:
+            rows = [i for i in rows if self.unit[i] == unit]
+        return rows[part] if part < len(rows) else None
+
+    def quantities(self, model: str, label: str) -> Tuple[Quantity, ...]:
+        """Parsed quantities of one entry; () for text-only values."""
+        rows = [i for i in self._index.get((model, label), ())
+                if not (np.isnan(self.value[i]) and np.isnan(self.min[i]) and np.isnan(self.max[i]))]
+        return tuple(Quantity(float(self.value[i]), self.unit[i], float(self.min[i]), float(self.max[i]),
+                              bool(self.approx[i])) for i in rows)
+
+    def get(self, model: str, label: str, unit: Optional[str] = None, part: int = 0,
+            field: str = "value") -> Optional[float]:
+        """One number, e.g. get("EB70 kVA", "Max Continuous amp-load 480V", unit="kW") -> 56.0."""
+        i = self._row(model, label, unit, part)
+        if i is None:
+            return None
+        v = float(getattr(self, field)[i])
+        return None if np.isnan(v) else v
+
+    def column(self, label: str, unit: Optional[str] = None, part: int = 0, field: str = "value",
+               models: Optional[Sequence[str]] = None) -> np.ndarray:
+        """`field` of `label` for each model (default: registry.MODEL_NAMES), NaN where missing."""
+        if models is None:
+            from utils.registry import MODEL_NAMES
+            models = MODEL_NAMES
+        data = getattr(self, field)
+        out = np.full(len(models), np.nan)
+        for j, model in enumerate(models):
+            i = self._row(model, label, unit, part)
+            if i is not None:
+                out[j] = data[i]
+        return out
+
+    def text_for(self, model: str, label: str) -> Optional[str]:
+        """The source string, as written in utils.data."""
+        rows = self._index.get((model, label))
+        return self.text[rows[0]] if rows else None
+
+    def display_for(self, model: str, label: str, default: Optional[str] = None) -> Optional[str]:
+        """Display text rendered from the compiled quantities (source text for non-quantities)."""
+        rows = self._index.get((model, label))
+        return self.display[rows[0]] if rows else default
+
+    def sheets(self) -> Dict[str, Dict[str, str]]:
+        """{model: {label: display text}}, in the source sheet's order."""
+        if self._sheets is None:
+            sheets: Dict[str, Dict[str, str]] = {}
+            for model, label in self._index:
+                sheets.setdefault(model, {})[label] = self.display_for(model, label)
+            self._sheets = sheets
+        return self._sheets
+
+    def differences(self, model: str, other: "SpecTable", other_model: str,
+                    labels: Sequence[str]) -> Tuple[np.ndarray, List[str]]:
+        """
+        self - other for each label, on the first quantity the two entries share a
+        unit for: (values, units), NaN / "" where there is none.
+        """
+        out = np.full(len(labels), np.nan)
+        units = [""] * len(labels)
+        for k, label in enumerate(labels):
+            mine = self._index.get((model, label), ())
+            theirs = other._index.get((other_model, label), ())
+            for i in mine:
+                j = next((j for j in theirs if other.unit[j] == self.unit[i] and not np.isnan(other.value[j])), None)
+                if j is not None and not np.isnan(self.value[i]):
+                    out[k] = self.value[i] - other.value[j]
+                    units[k] = self.unit[i]
+                    break
+        return out, units
+
+    def to_frame(self):
+        import pandas as pd
+        return pd.DataFrame({"model": self.models, "label": self.labels, "part": self.part,
+                             "value": self.value, "unit": self.unit, "min": self.min, "max": self.max,
+                             "approx": self.approx, "text": self.text, "display": self.display})
+
+def compile_sheet(name: str, sheet: Mapping[str, Mapping[str, str]], canonical: bool = True) -> SpecTable:
+    """Parse a {model: {label: display string}} sheet; model names are canonicalized unless `canonical` is False."""
+    from utils.registry import canonical_model
+    rows = []
+    for sheet_model, specs in sheet.items():
+        model = (canonical_model(sheet_model) if canonical else None) or sheet_model
+        for label, text in specs.items():
+            quantities, seps, qualifier = _parse(text)
+            display = format_spec(quantities, seps, qualifier) if quantities else str(text)
+            for part, q in enumerate(quantities or (Quantity(float("nan")),)):
+                rows.append((model, label, str(text), display, part, q))
+    return SpecTable(name, rows)
+
+_TABLES: Dict[str, SpecTable] = {}
+
+def spec_table(name: str = "EBOSS_SPECS") -> SpecTable:
+    """Compiled table for one of SHEETS, built on first use and kept for the process."""
+    table = _TABLES.get(name)
+    if table is None:
+        if name not in SHEETS:
+            raise KeyError(f"Unknown spec sheet: {name}")
+        table = _TABLES[name] = compile_sheet(name, getattr(_data, name), canonical=name not in _UNCANONICAL)
+    return table
+
+__all__ = [
+    "SHEETS",
+    "Quantity",
+    "SpecTable",
+    "compile_sheet",
+    "format_quantity",
+    "format_spec",
+    "parse_spec_value",
+    "spec_table",
+]
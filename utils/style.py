@@ -1,11 +1,106 @@
+# utils/style.py
+from __future__ import annotations
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, Optional
+
 import streamlit as st
 
+# Stylesheets, compiled once and linked once per browser session.
+#
+# The page CSS (theme, global styles, nav buttons, tables) used to be pushed as
+# a <style> block through st.markdown on every rerun of every page. Now each
+# named stylesheet is compiled once per process into static/css/<name>.<hash>.css
+# (the hash is of the content, so a changed sheet gets a new URL) and served by
+# Streamlit's static file route (server.enableStaticServing, .streamlit/config.toml).
+# ensure_stylesheet() adds a single <link> to the document <head> the first time
+# a session asks for a sheet and records the URL in session state; later reruns
+# and page switches send nothing. The link lives in <head>, outside the element
+# tree Streamlit clears between runs, and a browser reload starts a new session
+# and links it again.
+#
+# Streamlit's static route answers with ETag/Last-Modified only (no
+# Cache-Control of its own); the content-hashed names make it safe to mark
+# app/static/css/* "public, max-age=31536000, immutable" at a proxy or CDN.
+# With static serving off, or if static/ is not writable, sheets fall back to
+# an inline <style> on every run, as before.
 
-def global_css():
-    
-    st.markdown("""
-    <style>
+ROOT = Path(__file__).resolve().parent.parent
+CSS_DIR = ROOT / "static" / "css"
+CSS_URL = "app/static/css"
+DIGEST_CHARS = 12
+
+_SESSION_KEY = "_stylesheets"   # {sheet name: href already linked in this session}
+_LINK_JS = """<script>(function(){
+var id="eboss-css-%(name)s", href="%(href)s", old=document.getElementById(id);
+if(old && old.getAttribute("href")===href) return;
+var link=document.createElement("link"); link.id=id; link.rel="stylesheet"; link.href=href;
+document.head.appendChild(link); if(old) old.remove();
+})();</script>"""
+
+@dataclass(frozen=True, slots=True)
+class Stylesheet:
+    name: str
+    digest: str
+    css: str
+    href: Optional[str] = None   # None: not published, inject inline
+
+_SHEETS: Dict[str, Stylesheet] = {}
+_lock = threading.Lock()
+
+def _static_serving() -> bool:
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+def _publish(name: str, digest: str, css: str) -> Optional[str]:
+    """Write static/css/<name>.<digest>.css (once) and drop older builds of the sheet."""
+    filename = f"{name}.{digest}.css"
+    path = CSS_DIR / filename
+    try:
+        if not path.exists():
+            CSS_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(css, encoding="utf-8")
+            os.replace(tmp, path)
+        for old in CSS_DIR.glob(f"{name}.*.css"):
+            if old.name != filename:
+                old.unlink(missing_ok=True)
+    except OSError:
+        return None
+    return f"{CSS_URL}/{filename}"
+
+def stylesheet(name: str, css: str) -> Stylesheet:
+    """The compiled sheet for `name`, rebuilt only when `css` changes."""
+    sheet = _SHEETS.get(name)
+    if sheet is not None and (sheet.css is css or sheet.css == css):
+        return sheet
+    with _lock:
+        sheet = _SHEETS.get(name)
+        if sheet is None or sheet.css != css:
+            digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:DIGEST_CHARS]
+            href = _publish(name, digest, css) if _static_serving() else None
+            sheet = _SHEETS[name] = Stylesheet(name, digest, css, href)
+    return sheet
+
+def ensure_stylesheet(name: str, css: str) -> Stylesheet:
+    """Link the sheet into this browser session if it is not linked yet (inline <style> fallback)."""
+    sheet = stylesheet(name, css)
+    if sheet.href is None:
+        st.html(f"<style>{sheet.css}</style>")
+        return sheet
+    linked: Dict[str, str] = st.session_state.setdefault(_SESSION_KEY, {})
+    if linked.get(name) != sheet.href:
+        st.html(_LINK_JS % {"name": name, "href": sheet.href}, unsafe_allow_javascript=True)
+        linked[name] = sheet.href
+    return sheet
+
+# ── Sheets ───────────────────────────────────────────────────────────────────
+GLOBAL_CSS = """
     /* Import fonts */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
     
@@ -296,32 +391,12 @@ def global_css():
             margin: 2rem auto;
         }
     }
-</style>
-""", unsafe_allow_html=True)
+"""
 
-def inject_css_file(path: str):
-    css = Path(path).read_text(encoding="utf-8")
-    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
-
-def inject_theme_vars(colors: dict):
-    st.markdown(
-        f"""
-        <style>
-        :root {{
-          --asphalt: {colors["Asphalt"]};
-          --alpine: {colors["Alpine White"]};
-          --concrete: {colors["Concrete"]};
-          --energy: {colors["Energy Green"]};
-        }}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+def global_css():
+    ensure_stylesheet("global", GLOBAL_CSS)
 
-def inject_theme_css():
-    st.markdown(
-        """
-        <style>
+CTA_CSS = """
         .cta-scope [data-testid="column"] .stButton { width: 100%; }
         .cta-scope .stButton > button{
             display:block; width:100%;
@@ -351,19 +426,33 @@ def inject_theme_css():
             transition: box-shadow .25s ease, transform .15s ease;
         }
         .cta-link:hover{ box-shadow: 0 0 28px var(--energy); transform: translateY(-1px); }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+"""
+
+def theme_vars_css(colors: dict) -> str:
+    return f"""
+:root {{
+  --asphalt: {colors["Asphalt"]};
+  --alpine: {colors["Alpine White"]};
+  --concrete: {colors["Concrete"]};
+  --energy: {colors["Energy Green"]};
+}}
+"""
+
+def inject_css_file(path: str):
+    ensure_stylesheet(Path(path).stem, Path(path).read_text(encoding="utf-8"))
+
+def inject_theme_vars(colors: dict):
+    ensure_stylesheet("theme-vars", theme_vars_css(colors))
+
+def inject_theme_css():
+    ensure_stylesheet("cta", CTA_CSS)
 
 def ensure_global_css(colors: dict, extra_files: list[str] | None = None):
-    if st.session_state.get("_css_injected"):
-        return
-    inject_theme_vars(colors)
-    inject_theme_css()
+    """Theme variables, CTA buttons and any extra CSS files as one linked sheet."""
+    parts = [theme_vars_css(colors), CTA_CSS]
     for f in (extra_files or []):
         try:
-            inject_css_file(f)
+            parts.append(Path(f).read_text(encoding="utf-8"))
         except FileNotFoundError:
             pass
-    st.session_state["_css_injected"] = True
+    ensure_stylesheet("nav", "\n".join(parts))
@@ -1,4 +1,6 @@
 import streamlit as st
+from utils.profiling import timed
+from utils.style import ensure_stylesheet
 
 COLORS = {
     "Asphalt": "#000000",
@@ -12,9 +14,7 @@ COLORS = {
 LOGO_URL = "https://raw.githubusercontent.com/TimBuffington/troubleshooting/refs/heads/main/assets/ANA-ENERGY-LOGO-HORIZONTAL-WHITE-GREEN.png"
 BG_URL   = "https://raw.githubusercontent.com/TimBuffington/Eboss-tool-V2/main/assets/bg.png"
 
-def apply_theme():
-    st.markdown(f"""
-    <style>
+THEME_CSS = f"""
     /* Hide default chrome */
     [data-testid="stHeader"], [data-testid="stToolbar"], footer, [data-testid="stFooter"], #MainMenu {{
       visibility: hidden; height: 0 !important;
@@ -23,7 +23,7 @@ def apply_theme():
 
     /* Background & text */
     .stApp {{
-      background-image: url("{BG_URL}"
+      background-image: url("{BG_URL}");
       background-size: cover; background-position:center; background-repeat:no-repeat; background-attachment:fixed;
       color: {COLORS['Alpine White']}; font-family: Arial, sans-serif;
     }}
@@ -72,9 +72,13 @@ def apply_theme():
       [data-testid="column"] {{ width:100% !important; flex:1 1 100% !important; }}
       .logo-wrap img {{ width: clamp(180px, 70vw, 520px); }}
     }}
-    </style>
-    """, unsafe_allow_html=True)
+    """
+
+@timed()
+def apply_theme():
+    ensure_stylesheet("theme", THEME_CSS)
 
+@timed()
 def render_logo():
     st.markdown(f"<div class='logo-wrap'><img src='{LOGO_URL}' alt='ANA Energy Logo' /></div>", unsafe_allow_html=True)
     